@@ -0,0 +1,61 @@
+"""
+Time the ParenthesisBalancer against pathological template strings.
+
+Every input is --size characters long, the time per character should stay flat
+    as --size grows.
+
+    python benchmarks/bench_balancer.py --size 200000
+"""
+
+import argparse
+import timeit
+
+from sept.balancer import ParenthesisBalancer
+
+
+def pathological_inputs(size):
+    pairs = size // 2
+    return [
+        ("unclosed opens", "{{" * pairs),
+        ("unopened closes", "}}" * pairs),
+        ("single open, many closes", "{" + "}}" * (pairs - 1)),
+        ("alternating partial pairs", "{{a}" * (size // 4)),
+        ("deep valid nesting", ("{{" * 32 + "}}" * 32) * (size // 128)),
+        ("plain text", "a" * size),
+    ]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--size", type=int, default=200000)
+    arg_parser.add_argument("--number", type=int, default=3)
+    arg_parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=None,
+        help="Maximum nesting depth, unlimited by default.",
+    )
+    args = arg_parser.parse_args()
+
+    for name, template_str in pathological_inputs(args.size):
+        seconds = timeit.timeit(
+            lambda: ParenthesisBalancer.parse_string(
+                template_str, max_depth=args.max_depth
+            ),
+            number=args.number,
+        )
+        _, errors = ParenthesisBalancer.parse_string(
+            template_str, max_depth=args.max_depth
+        )
+        print(
+            "{name:>26} {msec:9.2f} msec {nsec:7.1f} nsec/char {errors:>3} errors".format(
+                name=name,
+                msec=seconds / args.number * 1e3,
+                nsec=seconds / args.number / len(template_str) * 1e9,
+                errors=len(errors),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
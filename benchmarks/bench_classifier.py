@@ -0,0 +1,88 @@
+"""
+Classify paths against a large set of templates with a TemplateSet, compared
+to testing every template in turn.
+
+    python benchmarks/bench_classifier.py --templates 500 --paths 1000000
+"""
+
+import argparse
+import random
+import time
+
+from sept import PathTemplateParser
+
+AREAS = ["work", "publish", "review", "cache", "render", "comp", "lighting"]
+KINDS = ["maya", "nuke", "houdini", "mov", "exr", "abc", "usd", "json"]
+
+
+def build_templates(count, rng):
+    template_strs = {}
+    while len(template_strs) < count:
+        depth = rng.randint(2, 6)
+        levels = [
+            rng.choice(AREAS + KINDS) + str(rng.randint(0, 9)) for _ in range(depth)
+        ]
+        template_str = (
+            "/show/{{show}}/"
+            + "/".join(levels[: depth // 2])
+            + "/{{shot}}/"
+            + "/".join(levels[depth // 2 :])
+            + "/{{step}}_v{{pad[3,0]:version}}.{{ext}}"
+        )
+        template_strs["template_{}".format(len(template_strs))] = template_str
+    return template_strs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--templates", type=int, default=500)
+    arg_parser.add_argument("--paths", type=int, default=1000000)
+    arg_parser.add_argument("--naive-paths", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    parser = PathTemplateParser(engine="scanner")
+    template_set = parser.validate_template_set(build_templates(args.templates, rng))
+    templates = [template_set[name] for name in template_set]
+
+    paths = []
+    for index in range(args.paths):
+        data = {
+            "show": "abc",
+            "shot": "sh{:04d}".format(index % 9000),
+            "step": rng.choice(["comp", "light", "anim"]),
+            "version": str(index % 200),
+            "ext": rng.choice(["ma", "nk", "exr"]),
+        }
+        paths.append(rng.choice(templates).resolve(data))
+
+    start = time.time()
+    matched = sum(1 for path in paths if template_set.match(path) is not None)
+    elapsed = time.time() - start
+    print(
+        "TemplateSet.match: {count} paths x {templates} templates in {sec:.2f}s "
+        "({usec:.2f} usec/path, {matched} matched)".format(
+            count=len(paths),
+            templates=len(templates),
+            sec=elapsed,
+            usec=elapsed / len(paths) * 1e6,
+            matched=matched,
+        )
+    )
+
+    naive_paths = paths[: args.naive_paths]
+    start = time.time()
+    for path in naive_paths:
+        for template in templates:
+            if template.parse_path(path) is not None:
+                break
+    elapsed = time.time() - start
+    print(
+        "Template.parse_path loop: {usec:.2f} usec/path".format(
+            usec=elapsed / len(naive_paths) * 1e6
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
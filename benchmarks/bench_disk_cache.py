@@ -0,0 +1,66 @@
+"""
+Compare compiling a template library in a fresh interpreter with loading it
+from a warm on-disk compiled template cache.
+
+    python benchmarks/bench_disk_cache.py --templates 300
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT = """
+import sys
+from sept import PathTemplateParser
+
+count, cache_dir = int(sys.argv[1]), sys.argv[2] or None
+parser = PathTemplateParser(cache_dir=cache_dir)
+for index in range(count):
+    parser.validate_template(
+        "/show/{{show}}/%d/{{sequence}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}/"
+        "{{upper:show}}_{{lower:{{substr[0,3]:shot}}}}_{{step}}.{{pad[4,0]:frame}}.exr"
+        % index
+    )
+"""
+
+
+def _run(count, cache_dir):
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    start = time.time()
+    subprocess.check_call(
+        [sys.executable, "-c", SCRIPT, str(count), cache_dir or ""], env=env
+    )
+    return time.time() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--templates", type=int, default=300)
+    args = arg_parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        results = [
+            ("compile", _run(args.templates, None)),
+            ("cold disk cache", _run(args.templates, cache_dir)),
+            ("warm disk cache", _run(args.templates, cache_dir)),
+        ]
+    finally:
+        shutil.rmtree(cache_dir)
+
+    for name, seconds in results:
+        print(
+            "{name:>16} {msec:8.1f} msec process, {templates} templates".format(
+                name=name, msec=seconds * 1e3, templates=args.templates
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare the compile time of the pyparsing and scanner template engines.
+
+    python benchmarks/bench_engines.py
+"""
+
+import argparse
+import timeit
+
+from sept import PathTemplateParser
+from sept.template import ENGINES
+
+TEMPLATES = [
+    r"{{lower:name}}",
+    r"/show/{{show}}/{{sequence}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}",
+    r"/show/{{upper:show}}/{{lower:{{substr[0,3]:shot}}}}/{{shot}}_{{step}}.{{pad[4,0]:frame}}.exr",
+    r"{{replace[\s,_]:description}}_{{lower:{{replace[-,_]:{{substr[start,8]:name}}}}}}",
+]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--number", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    for engine in ENGINES:
+        # Disable the compiled template cache so every call compiles.
+        parser = PathTemplateParser(cache_size=0, engine=engine)
+        for template_str in TEMPLATES:
+            seconds = timeit.timeit(
+                lambda: parser.validate_template(template_str), number=args.number
+            )
+            print(
+                "{engine:>10} {usec:10.2f} usec/compile  {template}".format(
+                    engine=engine,
+                    usec=seconds / args.number * 1e6,
+                    template=template_str,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
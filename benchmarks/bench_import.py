@@ -0,0 +1,92 @@
+"""
+Report the cold start cost of sept in fresh interpreters.
+
+For `import sept` and for importing sept and resolving a single template with
+    each engine, prints the median `-X importtime` cumulative time of the sept
+    package, the median wall time of the whole process and whether the heavy
+    optional modules got imported.
+
+    python benchmarks/bench_import.py --number 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("pyparsing", "six", "sept._version")
+
+SCENARIOS = [
+    ("import sept", "import sept"),
+    (
+        "resolve (pyparsing)",
+        "import sept\n"
+        "sept.PathTemplateParser().parse('/{{show}}/{{lower:shot}}', {'show': 'a', 'shot': 'B'})",
+    ),
+    (
+        "resolve (scanner)",
+        "import sept\n"
+        "sept.PathTemplateParser(engine='scanner').parse("
+        "'/{{show}}/{{lower:shot}}', {'show': 'a', 'shot': 'B'})",
+    ),
+]
+
+REPORT = (
+    "\nimport sys\n"
+    "sys.stdout.write(','.join(m for m in {modules!r} if m in sys.modules))\n"
+)
+
+
+def _run(code):
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    start = time.time()
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        universal_newlines=True,
+    )
+    stdout, stderr = process.communicate()
+    seconds = time.time() - start
+
+    cumulative = 0
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "sept":
+            cumulative = int(parts[1])
+    return cumulative, seconds, stdout
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--number", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    for name, code in SCENARIOS:
+        runs = [
+            _run(code + REPORT.format(modules=HEAVY_MODULES))
+            for _ in range(args.number)
+        ]
+        print(
+            "{name:>20} import sept {usec:8.0f} usec, process {msec:6.1f} msec, "
+            "loaded: {modules}".format(
+                name=name,
+                usec=_median([run[0] for run in runs]),
+                msec=_median([run[1] for run in runs]) * 1e3,
+                modules=runs[-1][2] or "-",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Report the memory held by compiled Templates.
+
+Compiles --number distinct templates (one per show/step combination) and
+    reports the bytes retained per compiled template with tracemalloc.
+
+    python benchmarks/bench_memory.py --number 10000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from sept import PathTemplateParser
+
+TEMPLATE = (
+    r"/show/{{show}}/{{sequence}}/{{shot}}/{{step}}/{{entity}}/"
+    r"v{{pad[3,0]:version}}/{{show}}_{{shot}}_{{lower:step}}_"
+    r"{{upper:{{substr[0,3]:entity}}}}_v{{pad[3,0]:version}}.{{pad[4,0]:frame}}.exr"
+)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--number", type=int, default=10000)
+    args = arg_parser.parse_args()
+
+    # Keep every compiled template alive ourselves, not in the parser cache.
+    parser = PathTemplateParser(cache_size=0)
+    template_strs = ["/{}{}".format(index, TEMPLATE) for index in range(args.number)]
+    parser.validate_template(template_strs[0])
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    templates = [
+        parser.validate_template(template_str) for template_str in template_strs
+    ]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        "{count} templates, {tokens} tokens each, {size:.0f} bytes per template".format(
+            count=len(templates),
+            tokens=len(templates[0]._resolved_tokens),
+            size=float(after - before) / len(templates),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measure the per record cost of resolving a deep publish path template.
+
+    python benchmarks/bench_resolve.py
+"""
+
+import argparse
+import timeit
+
+from sept import PathTemplateParser
+
+TEMPLATE = (
+    r"/show/{{show}}/{{sequence}}/{{shot}}/{{step}}/{{task}}/{{lower:user}}/"
+    r"v{{pad[3,0]:version}}/{{upper:show}}_{{sequence}}_{{shot}}_{{step}}_"
+    r"{{task}}_{{lower:user}}_v{{pad[3,0]:version}}/{{layer}}/{{aov}}/"
+    r"{{show}}_{{shot}}_{{layer}}_{{aov}}_v{{pad[3,0]:version}}."
+    r"{{pad[4,0]:frame}}.{{ext}}"
+)
+DATA = {
+    "show": "abc",
+    "sequence": "seq010",
+    "shot": "sh0100",
+    "step": "comp",
+    "task": "main",
+    "user": "AHughes",
+    "version": "12",
+    "layer": "beauty",
+    "aov": "diffuse",
+    "frame": "1001",
+    "ext": "exr",
+}
+# Values that stay fixed for a whole shot, see `Template.bind`.
+SHOT_KEYS = ("show", "sequence", "shot", "step", "task", "user", "layer", "ext")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--number", type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    parser = PathTemplateParser()
+    template = parser.validate_template(TEMPLATE)
+    print("{} tokens".format(len(template._resolved_tokens)))
+
+    function = template.compile_function()
+    trusted_function = template.compile_function(trusted=True)
+    bound = template.bind(dict((key, DATA[key]) for key in SHOT_KEYS))
+    bound_function = bound.compile_function()
+    candidates = [
+        ("resolve", lambda: template.resolve(DATA)),
+        ("resolve(trusted)", lambda: template.resolve(DATA, trusted=True)),
+        ("compile_function", lambda: function(DATA)),
+        ("compile_function(trusted)", lambda: trusted_function(DATA)),
+        ("bind(shot).resolve", lambda: bound.resolve(DATA)),
+        ("bind(shot).function", lambda: bound_function(DATA)),
+    ]
+    records = [DATA] * args.number
+    for name, candidate in candidates:
+        seconds = timeit.timeit(candidate, number=args.number)
+        print(
+            "{name:>26} {usec:8.2f} usec/resolve".format(
+                name=name, usec=seconds / args.number * 1e6
+            )
+        )
+
+    for chunk_size in (None, 1000):
+        seconds = timeit.timeit(
+            lambda: list(template.resolve_many(records, chunk_size=chunk_size)),
+            number=1,
+        )
+        print(
+            "{name:>26} {usec:8.2f} usec/resolve".format(
+                name="resolve_many({})".format(chunk_size),
+                usec=seconds / args.number * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
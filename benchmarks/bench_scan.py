@@ -0,0 +1,73 @@
+"""
+Compare finding the published files of one shot with `glob.glob` over the
+show root and with the template-guided `Template.scan`.
+
+    python benchmarks/bench_scan.py --shots 200 --versions 10
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+import timeit
+
+from sept.parser import PathTemplateParser
+
+TEMPLATE_STR = (
+    r"{{root}}/{{sequence}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}/"
+    r"{{shot}}_{{step}}_v{{pad[3,0]:version}}.exr"
+)
+STEPS = ("anim", "comp", "fx", "light")
+
+
+def _build_tree(root, shots, versions):
+    for index in range(shots):
+        sequence = "seq{:03d}".format(index // 20)
+        shot = "sh{:04d}".format(index * 10)
+        for step in STEPS:
+            for version in range(1, versions + 1):
+                directory = os.path.join(
+                    root, sequence, shot, step, "v{:03d}".format(version)
+                )
+                os.makedirs(directory)
+                name = "{}_{}_v{:03d}.exr".format(shot, step, version)
+                open(os.path.join(directory, name), "w").close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--shots", type=int, default=200)
+    arg_parser.add_argument("--versions", type=int, default=10)
+    arg_parser.add_argument("--number", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    root = tempfile.mkdtemp()
+    try:
+        _build_tree(root, args.shots, args.versions)
+        template_obj = PathTemplateParser().validate_template(TEMPLATE_STR)
+        partial_data = {"root": root, "shot": "sh0100", "step": "comp"}
+        pattern = os.path.join(root, "*", "*", "*", "v*", "sh0100_comp_v*.exr")
+        cases = [
+            ("glob.glob", lambda: glob.glob(pattern)),
+            (
+                "glob.glob to_glob",
+                lambda: glob.glob(template_obj.to_glob(partial_data)),
+            ),
+            ("Template.scan", lambda: list(template_obj.scan(partial_data))),
+        ]
+        expected = len(glob.glob(pattern))
+        assert len(list(template_obj.scan(partial_data))) == expected
+        for name, function in cases:
+            seconds = timeit.timeit(function, number=args.number)
+            print(
+                "{name:>18} {msec:8.2f} msec per scan, {count} files".format(
+                    name=name, msec=seconds * 1e3 / args.number, count=expected
+                )
+            )
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare resolving every frame of a sequence with `Template.resolve`, the
+compiled resolver and `Template.sequence`.
+
+    python benchmarks/bench_sequence.py --frames 100000
+"""
+
+import argparse
+import timeit
+
+from sept.parser import PathTemplateParser
+from sept.sequence import frame_range
+
+TEMPLATE_STR = (
+    r"/show/{{show}}/{{sequence}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}/"
+    r"{{upper:show}}_{{shot}}_{{step}}_v{{pad[3,0]:version}}.{{pad[4,0]:frame}}.exr"
+)
+state_data = {
+    "show": "abc",
+    "sequence": "seq010",
+    "shot": "sh0100",
+    "step": "comp",
+    "version": "12",
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--frames", type=int, default=100000)
+    arg_parser.add_argument("--number", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    template_obj = PathTemplateParser().validate_template(TEMPLATE_STR)
+    frames = frame_range(1001, 1000 + args.frames)
+    resolve = template_obj.compile_function()
+
+    def per_frame(function):
+        for frame in frames:
+            record = dict(state_data)
+            record["frame"] = frame
+            function(record)
+
+    cases = [
+        ("resolve", lambda: per_frame(template_obj.resolve)),
+        ("compiled", lambda: per_frame(resolve)),
+        ("sequence", lambda: list(template_obj.sequence(state_data, frames))),
+    ]
+    for name, function in cases:
+        seconds = min(timeit.repeat(function, number=1, repeat=args.number))
+        print(
+            "{name:>10} {usec:8.3f} usec per frame, {frames} frames".format(
+                name=name, usec=seconds * 1e6 / args.frames, frames=args.frames
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Resolve a publish worth of related templates against one context, comparing a
+TemplateSet shared evaluation plan to resolving every template on its own.
+
+    python benchmarks/bench_template_set.py --templates 50
+"""
+
+import argparse
+import timeit
+
+from sept import PathTemplateParser
+
+ROOT = r"/show/{{show}}/{{sequence}}/{{shot}}/{{step}}"
+NAME = r"{{upper:show}}_{{shot}}_{{lower:step}}_{{task}}_v{{pad[3,0]:version}}"
+KINDS = ["work", "render", "cache", "review", "thumbnail", "proxy", "log", "meta"]
+EXTENSIONS = ["ma", "exr", "abc", "mov", "jpg", "json", "usd", "nk"]
+DATA = {
+    "show": "abc",
+    "sequence": "seq010",
+    "shot": "sh0100",
+    "step": "Comp",
+    "task": "main",
+    "version": "12",
+    "frame": "1001",
+    "user": "ahughes",
+}
+
+
+def build_templates(count):
+    template_strs = {}
+    for index in range(count):
+        kind = KINDS[index % len(KINDS)]
+        extension = EXTENSIONS[(index // len(KINDS)) % len(EXTENSIONS)]
+        template_strs["{}_{}".format(kind, index)] = (
+            ROOT + "/" + kind + "/v{{pad[3,0]:version}}/" + NAME + "." + extension
+        )
+    return template_strs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--templates", type=int, default=50)
+    arg_parser.add_argument("--number", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    parser = PathTemplateParser()
+    template_set = parser.validate_template_set(build_templates(args.templates))
+    templates = [(name, template_set[name]) for name in template_set]
+    functions = [(name, template.compile_function()) for name, template in templates]
+    set_function = template_set.compile_function()
+
+    candidates = [
+        (
+            "Template.resolve",
+            lambda: dict((name, t.resolve(DATA)) for name, t in templates),
+        ),
+        (
+            "compile_function",
+            lambda: dict((name, function(DATA)) for name, function in functions),
+        ),
+        ("TemplateSet.resolve", lambda: set_function(DATA)),
+    ]
+    for name, candidate in candidates:
+        seconds = timeit.timeit(candidate, number=args.number)
+        print(
+            "{name:>20} {usec:9.2f} usec/record ({templates} templates)".format(
+                name=name,
+                usec=seconds / args.number * 1e6,
+                templates=len(templates),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Compare looking up the latest version of many shots one after another and on
+a pool of threads with `Template.find_latest_versions`.
+
+    python benchmarks/bench_versions.py --shots 2000 --versions 10
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from sept.parser import PathTemplateParser
+
+TEMPLATE_STR = (
+    r"{{root}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}/"
+    r"{{shot}}_{{step}}_v{{pad[3,0]:version}}.exr"
+)
+
+
+def _build_tree(root, shots, versions):
+    for index in range(shots):
+        shot = "sh{:04d}".format(index * 10)
+        for version in range(1, versions + 1):
+            os.makedirs(os.path.join(root, shot, "comp", "v{:03d}".format(version)))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--shots", type=int, default=2000)
+    arg_parser.add_argument("--versions", type=int, default=10)
+    arg_parser.add_argument("--workers", type=int, default=16)
+    args = arg_parser.parse_args()
+
+    root = tempfile.mkdtemp()
+    try:
+        _build_tree(root, args.shots, args.versions)
+        template_obj = PathTemplateParser().validate_template(TEMPLATE_STR)
+        records = [
+            {"root": root, "shot": "sh{:04d}".format(index * 10), "step": "comp"}
+            for index in range(args.shots)
+        ]
+
+        start = time.time()
+        serial = [template_obj.find_latest_version(record) for record in records]
+        serial_seconds = time.time() - start
+
+        start = time.time()
+        threaded = template_obj.find_latest_versions(records, max_workers=args.workers)
+        threaded_seconds = time.time() - start
+        assert serial == threaded
+    finally:
+        shutil.rmtree(root)
+
+    for name, seconds in (("serial", serial_seconds), ("threads", threaded_seconds)):
+        print(
+            "{name:>8} {msec:8.1f} msec, {shots} shots".format(
+                name=name, msec=seconds * 1e3, shots=args.shots
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
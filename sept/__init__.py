@@ -1,8 +1,21 @@
+import sys
+
 from .token import Token
 from .operator import Operator
 from .parser import PathTemplateParser
 
-from ._version import get_versions
 
-__version__ = get_versions()["version"]
-del get_versions
+def __getattr__(name):
+    # Looking up the version can run git, only do it when it is asked for.
+    if name == "__version__":
+        from ._version import get_versions
+
+        version = get_versions()["version"]
+        globals()["__version__"] = version
+        return version
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ needs Python 3.7, look the version up now.
+    __version__ = __getattr__("__version__")
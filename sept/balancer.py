@@ -1,11 +1,18 @@
 from sept.errors import (
     ClosingBalancingParenthesisError,
     OpeningBalancingParenthesisError,
+    MaximumDepthParsingError,
+    MaximumLengthParsingError,
 )
 
 START_TOK = "{"
 CLOSE_TOK = "}"
 
+# Deep enough for any hand written template while keeping the recursive
+#   parsers well clear of the interpreter recursion limit.
+DEFAULT_MAX_DEPTH = 64
+DEFAULT_MAX_LENGTH = None
+
 
 class ParenthesisBalancer(object):
     """
@@ -14,16 +21,28 @@ class ParenthesisBalancer(object):
     It will check for any unbalanced pairs and return a record of those in addition to any successfuly found pairs
 
     Successfully matched pairs get returned as a list of [start_index, end_index] values which can be used to generate substrings of only the "Token Expression" chunks.
+
+    The balancer runs in linear time and memory, even for malformed input. Templates longer than `max_length` are rejected before being read, nesting deeper than `max_depth` stops the scan, and so does recording more than `MAX_ERRORS` errors.
     """
 
-    def __init__(self, template_str):
+    # Every error keeps a substring of the template, stop scanning once this
+    #   many have been found so the errors do not outgrow the template.
+    MAX_ERRORS = 32
+
+    def __init__(
+        self, template_str, max_depth=DEFAULT_MAX_DEPTH, max_length=DEFAULT_MAX_LENGTH
+    ):
         super(ParenthesisBalancer, self).__init__()
         self.template_str = template_str
+        self.max_depth = max_depth
+        self.max_length = max_length
         self._open_count = 0
         self._root_locations = []
         self._currently_open_locations = []
-        self._recently_closed_locations = []
-        self._single_opens = []
+        self._last_closed_location = None
+        # First single "{" after the last successful close, used as the start
+        #   of the substring reported for a "}}" without an opener.
+        self._first_open_since_close = None
         self._single_closes = []
         self._errors = []
 
@@ -31,25 +50,39 @@ class ParenthesisBalancer(object):
         """
         execute the template parsing.
         This method runs the token balancing check and will store any errors as either `sept.errors.OpeningBalancingParenthesisError` or `sept.errors.ClosingBalancingParenthesisError` exceptions, unthrown.
+        Exceeding `max_length` or `max_depth` is stored as a `sept.errors.MaximumLengthParsingError` or `sept.errors.MaximumDepthParsingError` and ends the check.
 
         It returns any successfully found "Token Expressions" at the root level. Any nested "Token Expressions" get validated but not returned as locations from this method.
 
         :return: Returns a list of "Token Expression" locations as index start:end values and a list of any errors that were encountered.
         :rtype: list[list,list]
         """
-        # msg = " {} ".format(msg)
+        if self.max_length is not None and len(self.template_str) > self.max_length:
+            self._errors.append(
+                MaximumLengthParsingError(
+                    length=len(self.template_str), max_length=self.max_length
+                )
+            )
+            return self._root_locations, self._errors
+
         for index, curr_char in enumerate(self.template_str):
             prev_char, next_char = self._get_chars(curr_index=index)
 
             if curr_char == START_TOK:
-                self._single_opens.append(index)
+                if self._first_open_since_close is None:
+                    self._first_open_since_close = index
             elif curr_char == CLOSE_TOK:
                 self._single_closes.append(index)
 
             if self._is_start_tok(curr_char, next_char):
                 # Might have a tok_start
                 if prev_char == START_TOK:
-                    if index - 2 in self._currently_open_locations:
+                    # Two groups can never open on neighbouring characters, so
+                    #   only the innermost open group can start at index - 2.
+                    if (
+                        self._currently_open_locations
+                        and self._currently_open_locations[-1] == index - 2
+                    ):
                         # We have nested goupings
                         self.open_group(curr_index=index)
                     continue
@@ -59,29 +92,47 @@ class ParenthesisBalancer(object):
                 if next_char == CLOSE_TOK:
                     # Might have a tok_close
                     if prev_char == CLOSE_TOK:
-                        if index - 2 in self._recently_closed_locations:
+                        if self._last_closed_location == index - 2:
                             # We are closing a nested grouping
                             self.close_group(curr_index=index)
                         continue
                     self.close_group(curr_index=index)
-        if self._currently_open_locations:
-            for open_location in self._currently_open_locations:
-                next_close = open_location
-                for close_index in reversed(self._single_closes):
-                    if close_index < open_location:
-                        break
-                    next_close = close_index
-                self._errors.append(
-                    ClosingBalancingParenthesisError(
-                        start_location=open_location,
-                        end_location=next_close,
-                        missing_token=CLOSE_TOK + CLOSE_TOK,
-                        substr=self.template_str[open_location:],
-                    )
+
+            if self._is_exhausted():
+                return self._root_locations, self._errors
+
+        # The unclosed groups and the single closes are both in ascending
+        #   order, pair every group with the first "}" after it in one pass.
+        close_position = 0
+        for open_location in self._currently_open_locations:
+            if len(self._errors) >= self.MAX_ERRORS:
+                break
+            while (
+                close_position < len(self._single_closes)
+                and self._single_closes[close_position] < open_location
+            ):
+                close_position += 1
+            next_close = open_location
+            if close_position < len(self._single_closes):
+                next_close = self._single_closes[close_position]
+            self._errors.append(
+                ClosingBalancingParenthesisError(
+                    start_location=open_location,
+                    end_location=next_close,
+                    missing_token=CLOSE_TOK + CLOSE_TOK,
+                    substr=self.template_str[open_location:],
                 )
+            )
 
         return self._root_locations, self._errors
 
+    def _is_exhausted(self):
+        if len(self._errors) >= self.MAX_ERRORS:
+            return True
+        return bool(self._errors) and isinstance(
+            self._errors[-1], MaximumDepthParsingError
+        )
+
     def _is_start_tok(self, curr_char, next_char):
         if curr_char == START_TOK:
             if next_char == START_TOK:
@@ -101,20 +152,19 @@ class ParenthesisBalancer(object):
         return prev_char, next_char
 
     def open_group(self, curr_index):
+        if self.max_depth is not None and self._open_count >= self.max_depth:
+            self._errors.append(
+                MaximumDepthParsingError(location=curr_index, max_depth=self.max_depth)
+            )
+            return
         self._open_count += 1
         self._currently_open_locations.append(curr_index)
 
     def close_group(self, curr_index):
         if self._open_count <= 0:
-            last_closed = 0
-            if self._recently_closed_locations:
-                last_closed = self._recently_closed_locations[-1]
-
-            last_open = last_closed + 2
-            for open_index in reversed(self._single_opens):
-                if open_index < last_closed:
-                    break
-                last_open = open_index
+            last_open = self._first_open_since_close
+            if last_open is None:
+                last_open = (self._last_closed_location or 0) + 2
 
             end_index = curr_index + 1
             self._errors.append(
@@ -130,16 +180,21 @@ class ParenthesisBalancer(object):
         last_opener = self._currently_open_locations.pop()
         if not self._currently_open_locations:
             self._root_locations.append((last_opener, curr_index + 1))
-        self._recently_closed_locations.append(curr_index)
+        self._last_closed_location = curr_index
+        self._first_open_since_close = None
 
     @classmethod
-    def parse_string(cls, template_str):
+    def parse_string(
+        cls, template_str, max_depth=DEFAULT_MAX_DEPTH, max_length=DEFAULT_MAX_LENGTH
+    ):
         """
         Standard entrypoint into usage of the ParenthesisBalancer class
 
         :param str template_str: Template string that we want to validate.
+        :param int|None max_depth: Maximum nesting of "Token Expressions", None for no limit.
+        :param int|None max_length: Maximum length of `template_str`, None for no limit.
         :return: Tuple of expression_locations and errors. See `execute` for definition.
         :rtype: list[list,list]
         """
-        _b = cls(template_str)
+        _b = cls(template_str, max_depth=max_depth, max_length=max_length)
         return _b.execute()
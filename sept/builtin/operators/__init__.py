@@ -1,15 +1,55 @@
-from .lower import LowerOperator
-from .upper import UpperOperator
-from .substr import SubStringOperator
-from .replace import ReplaceOperator
-from .pad import PadOperator
-from .null import NullOperator
-
-ALL_OPERATORS = [
-    LowerOperator,
-    UpperOperator,
-    SubStringOperator,
-    NullOperator,
-    ReplaceOperator,
-    PadOperator,
-]
+import importlib
+import sys
+
+# Builtin Operators by name, as the module and class that define them.
+#   The OperatorManager only imports an Operator the first time it is used.
+BUILTIN_OPERATORS = {
+    "lower": ("sept.builtin.operators.lower", "LowerOperator"),
+    "upper": ("sept.builtin.operators.upper", "UpperOperator"),
+    "substr": ("sept.builtin.operators.substr", "SubStringOperator"),
+    "NULL": ("sept.builtin.operators.null", "NullOperator"),
+    "replace": ("sept.builtin.operators.replace", "ReplaceOperator"),
+    "pad": ("sept.builtin.operators.pad", "PadOperator"),
+}
+
+_ALL_OPERATOR_NAMES = ["lower", "upper", "substr", "NULL", "replace", "pad"]
+_CLASS_NAMES = dict((klass, name) for name, (_, klass) in BUILTIN_OPERATORS.items())
+
+
+def load_builtin_operator(name):
+    """
+    load_builtin_operator will import and return the builtin Operator class
+        registered as `name`.
+
+    :param str name: Name of the builtin Operator.
+    :rtype: type
+    """
+    module_name, class_name = BUILTIN_OPERATORS[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name):
+    if name == "ALL_OPERATORS":
+        return [load_builtin_operator(name) for name in _ALL_OPERATOR_NAMES]
+    if name in _CLASS_NAMES:
+        return load_builtin_operator(_CLASS_NAMES[name])
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ needs Python 3.7, import everything up front.
+    from .lower import LowerOperator
+    from .upper import UpperOperator
+    from .substr import SubStringOperator
+    from .replace import ReplaceOperator
+    from .pad import PadOperator
+    from .null import NullOperator
+
+    ALL_OPERATORS = [
+        LowerOperator,
+        UpperOperator,
+        SubStringOperator,
+        NullOperator,
+        ReplaceOperator,
+        PadOperator,
+    ]
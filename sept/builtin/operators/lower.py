@@ -11,7 +11,10 @@ class LowerOperator(Operator):
     <br>&emsp;<code>"ALEX11" -> "alex11"</code>
     """
 
+    __slots__ = ()
+
     name = "lower"
+    stateless = True
 
     def is_invalid(self, token_value):
         if hasattr(token_value, "lower"):
@@ -23,3 +26,13 @@ class LowerOperator(Operator):
 
     def execute(self, input_data):
         return input_data.lower()
+
+    def output_pattern(self, input_pattern):
+        from sept.path_matcher import case_insensitive_pattern, LOWERCASE_PATTERN
+
+        return case_insensitive_pattern(input_pattern, LOWERCASE_PATTERN)
+
+    def output_type(self, input_type):
+        if hasattr(input_type, "lower"):
+            return input_type
+        return None
@@ -11,7 +11,10 @@ class NullOperator(Operator):
     <br>&emsp;<code>"ALEX11" -> "ALEX11"</code>
     """
 
+    __slots__ = ()
+
     name = "NULL"
+    stateless = True
     _private = True
 
     def is_invalid(self, token_value):
@@ -19,3 +22,9 @@ class NullOperator(Operator):
 
     def execute(self, input_data):
         return input_data
+
+    def output_pattern(self, input_pattern):
+        return input_pattern
+
+    def output_type(self, input_type):
+        return input_type
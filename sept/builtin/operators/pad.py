@@ -1,3 +1,6 @@
+import re
+
+from sept.errors import InvalidOperatorArgumentsError
 from sept.operator import Operator
 
 
@@ -12,35 +15,78 @@ class PadOperator(Operator):
     <br>&emsp;<code>{{pad[4,0]:name}} -> "0001"</code>
     """
 
+    __slots__ = ("_padding_count", "_formatter")
+
     name = "pad"
+    stateless = True
 
-    def is_invalid(self, token_value):
+    def compile(self):
         args = self._args
         if not args or len(args) != 2:
-            return (
+            raise InvalidOperatorArgumentsError(
                 "Invalid argument values passed to {name}. We expect two "
                 "arguments that are text values.".format(name=self.name)
             )
+        padding_count, padding_char = args
         try:
-            int(self._args[0])
+            padding_count = int(padding_count)
         except (TypeError, ValueError):
             # Could not cast to int
-            return "The first input value passed should be a number."
-        if len(self._args[1]) > 1:
-            return "The padding character as the second input value needs to be a single character/"
-        return None
+            raise InvalidOperatorArgumentsError(
+                "The first input value passed should be a number."
+            )
+        if len(padding_char) > 1:
+            raise InvalidOperatorArgumentsError(
+                "The padding character as the second input value needs to be a single character/"
+            )
 
-    def execute(self, input_data):
-        padding_count, padding_char = self._args
+        template_msg = "{{:{char}>{count}}}".format(
+            char=padding_char, count=padding_count
+        )
         try:
-            padding_count = int(padding_count)
-        except (TypeError, ValueError):
-            return None
+            template_msg.format("")
+        except ValueError:
+            raise InvalidOperatorArgumentsError(
+                '"{char}" can not be used as a padding character.'.format(
+                    char=padding_char
+                )
+            )
+        self._padding_count = padding_count
+        self._formatter = template_msg.format
 
+    def __getstate__(self):
+        state = super(PadOperator, self).__getstate__()
+        # A bound `str.format` can not be pickled on Python 2.
+        state.pop("_formatter", None)
+        return state
+
+    def __setstate__(self, state):
+        super(PadOperator, self).__setstate__(state)
+        self.compile()
+
+    def compiled_key(self):
+        return self._padding_count, self._args[1]
+
+    def is_invalid(self, token_value):
+        return None
+
+    def execute(self, input_data):
         try:
-            template_msg = "{{:{char}>{count}}}".format(
-                char=padding_char, count=padding_count
-            )
-            return template_msg.format(input_data)
+            return self._formatter(input_data)
         except Exception:
             return None
+
+    def output_pattern(self, input_pattern):
+        # The padding characters come before the input and the lookahead
+        #   keeps the minimum width, longer values are kept as they are.
+        return r"(?=[^/\\]{{{count}}})(?:{fill})*?(?:{input})".format(
+            count=max(self._padding_count, 1),
+            fill=re.escape(self._args[1] or " "),
+            input=input_pattern,
+        )
+
+    def output_type(self, input_type):
+        # Formatting text with a valid padding spec can not fail.
+        if issubclass(input_type, str):
+            return str
+        return None
@@ -13,7 +13,10 @@ class ReplaceOperator(Operator):
     <br>&emsp;<code>{{replace[kite,dog:name}} -> "alex"</code>
     """
 
+    __slots__ = ("_src_char", "_dst_char")
+
     name = "replace"
+    stateless = True
     args = [
         {
             "name": "Find String",
@@ -32,13 +35,26 @@ class ReplaceOperator(Operator):
         SPACE: " ",
     }
 
-    def is_invalid(self, token_value):
+    def compile(self):
         args = self._args
         if not args or len(args) != 2:
-            return (
+            raise InvalidOperatorArgumentsError(
                 "Invalid argument values passed to {name}. We expect two "
                 "arguments that are text values.".format(name=self.name)
             )
+        src_char, dst_char = args
+
+        for special_character in self.keywords:
+            replacement = self.keywords[special_character]
+            src_char = src_char.replace(special_character, replacement)
+            dst_char = dst_char.replace(special_character, replacement)
+        self._src_char = src_char
+        self._dst_char = dst_char
+
+    def compiled_key(self):
+        return self._src_char, self._dst_char
+
+    def is_invalid(self, token_value):
         if isinstance(token_value, self.DATA_TYPES):
             # Is valid
             return None
@@ -50,22 +66,17 @@ class ReplaceOperator(Operator):
         )
 
     def execute(self, input_data):
-        src_char, dst_char = self._args
-
-        for special_character in self.keywords:
-            replacement = self.keywords[special_character]
-            try:
-                src_char = src_char.replace(special_character, replacement)
-                dst_char = dst_char.replace(special_character, replacement)
-            except Exception as err:
-                print(str(err))
-
         try:
-            output_data = input_data.replace(src_char, dst_char)
+            output_data = input_data.replace(self._src_char, self._dst_char)
         except Exception as err:
             raise InvalidOperatorArgumentsError(
                 "Error replacing {src} with {dst}. Error: {err}".format(
-                    src=src_char, dst=dst_char, err=str(err)
+                    src=self._src_char, dst=self._dst_char, err=str(err)
                 )
             )
         return output_data
+
+    def output_type(self, input_type):
+        if issubclass(input_type, self.DATA_TYPES):
+            return input_type
+        return None
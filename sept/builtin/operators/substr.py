@@ -16,7 +16,10 @@ class SubStringOperator(Operator):
     <br>&emsp;<code>{{substr[1,3]:name}} &nbsp; &nbsp;&nbsp;&nbsp;-> "le"</code>
     """
 
+    __slots__ = ("_start", "_end")
+
     name = "substr"
+    stateless = True
     args = [
         {
             "name": "Start Location",
@@ -37,41 +40,40 @@ class SubStringOperator(Operator):
         END_KEY: None,
     }
 
-    def is_invalid(self, token_value):
+    def _parse_location(self, value, position):
+        value = value.lower().strip(" ")
+        if value in self.keywords:
+            return self.keywords[value]
+        try:
+            return int(value)
+        except ValueError:
+            raise InvalidOperatorArgumentsError(
+                "Invalid input value passed to {name}. "
+                "We expect the {position} argument to be a number or either "
+                '"start" or "end" values. '
+                "{value} was passed instead.".format(
+                    name=self.name, position=position, value=value
+                )
+            )
+
+    def compile(self):
         args = self._args
         if not args or len(args) > 2:
-            return (
+            raise InvalidOperatorArgumentsError(
                 "Invalid argument values passed to {name}. We expect one "
                 "or two arguments that are either a number or either "
                 '"start" or "end" text values.'.format(name=self.name)
             )
-        if len(args) == 1:
-            start = args
-            end = self.END_KEY
-        else:
-            start, end = args
+        self._start = self._parse_location(args[0], "first")
+        self._end = None
+        if len(args) == 2:
+            # An end of 0 has always meant "until the end".
+            self._end = self._parse_location(args[1], "second") or None
 
-        if start not in self.keywords:
-            try:
-                int(start)
-            except ValueError:
-                return (
-                    "Invalid input value passed to {name}. "
-                    "We expect the first argument to be a number or either "
-                    '"start" or "end" values. '
-                    "{value} was passed instead.".format(name=self.name, value=start)
-                )
+    def compiled_key(self):
+        return self._start, self._end
 
-        if end not in self.keywords:
-            try:
-                int(end)
-            except ValueError:
-                return (
-                    "Invalid input value passed to {name}. "
-                    "We expect the second argument to be a number or either "
-                    '"start" or "end" values. '
-                    "{value} was passed instead.".format(name=self.name, value=end)
-                )
+    def is_invalid(self, token_value):
         if isinstance(token_value, self.DATA_TYPES):
             # Is valid
             return None
@@ -83,35 +85,9 @@ class SubStringOperator(Operator):
         )
 
     def execute(self, input_data):
-        args = self._args
-        if len(args) == 1:
-            # Only have a start value
-            start = args[0]
-            end = None
-        elif len(args) == 2:
-            start = args[0]
-            end = args[1]
-        else:
-            err = (
-                "The `substr` Operator does not support the following "
-                "arguments: {}".format(args)
-            )
-            raise InvalidOperatorArgumentsError(err)
-
-        start = start.lower().strip(" ")
-        if end:
-            end = end.lower().strip(" ")
-
-        if start in self.keywords:
-            start = self.keywords.get(start)
-        else:
-            start = int(start)
-        if end in self.keywords:
-            end = self.keywords.get(end)
-        elif end is not None:
-            end = int(end)
+        return input_data[self._start : self._end]
 
-        if end:
-            return input_data[start:end]
-        else:
-            return input_data[start:]
+    def output_type(self, input_type):
+        if issubclass(input_type, self.DATA_TYPES):
+            return input_type
+        return None
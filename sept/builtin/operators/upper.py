@@ -11,7 +11,10 @@ class UpperOperator(Operator):
     <br>&emsp;<code>"alex11" -> "ALEX11"</code>
     """
 
+    __slots__ = ()
+
     name = "upper"
+    stateless = True
 
     def is_invalid(self, token_value):
         if hasattr(token_value, "upper"):
@@ -23,3 +26,13 @@ class UpperOperator(Operator):
 
     def execute(self, input_data):
         return input_data.upper()
+
+    def output_pattern(self, input_pattern):
+        from sept.path_matcher import case_insensitive_pattern, UPPERCASE_PATTERN
+
+        return case_insensitive_pattern(input_pattern, UPPERCASE_PATTERN)
+
+    def output_type(self, input_type):
+        if hasattr(input_type, "upper"):
+            return input_type
+        return None
@@ -1,3 +1,3 @@
-from .default import DefaultTokenFactory
+from .default import DefaultTokenFactory, DefaultFallbackToken, default_fallback_token
 
 ALL_TOKENS = []
@@ -1,11 +1,161 @@
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from sept.cache import LRUCache
 from sept.token import Token
 
+# Separates the keys, attributes and indexes of a dotted path Token like
+#   `{{entity.shot.code}}`.
+PATH_SEPARATOR = "."
 
-def DefaultTokenFactory(token_name):
-    class DefaultFallbackToken(Token):
-        name = token_name
+# Fallback Tokens hold no state beyond their name, one instance per name is
+#   shared by every Template of every parser.
+DEFAULT_TOKEN_CACHE_SIZE = 4096
+_default_tokens = LRUCache(maxsize=DEFAULT_TOKEN_CACHE_SIZE)
+# Classes created by `DefaultTokenFactory`, by name.
+_default_token_classes = LRUCache(maxsize=DEFAULT_TOKEN_CACHE_SIZE)
+
+
+def _path_step(segment):
+    index = None
+    if segment.lstrip("-").isdigit():
+        index = int(segment)
+
+    def step(value):
+        if isinstance(value, (dict, Mapping)):
+            result = value.get(segment)
+            if result is None and index is not None:
+                result = value.get(index)
+            return result
+        if index is not None:
+            try:
+                return value[index]
+            except (IndexError, KeyError, TypeError):
+                return None
+        if segment.startswith("_"):
+            # Templates can be user entered, private attributes and dunders
+            #   like `__globals__` must never be reachable from a path.
+            return None
+        result = getattr(value, segment, None)
+        if callable(result):
+            # Methods and functions lead to their internals (`func_globals`
+            #   on Python 2), only plain attribute values are read.
+            return None
+        return result
+
+    return step
+
+
+def _key_accessor(token_name):
+    if PATH_SEPARATOR not in token_name:
 
-        def getValue(self, data):
+        def get_value(data):
             return data.get(token_name)
 
-    return DefaultFallbackToken
+        return get_value
+
+    # Every level of the path is compiled once into a step that looks the
+    #   segment up as a key of a mapping, an index of a sequence or an
+    #   attribute of any other object.
+    steps = tuple(_path_step(segment) for segment in token_name.split(PATH_SEPARATOR))
+    # A flat key containing dots is still looked up first, plain names have
+    #   always been looked up lower cased.
+    flat_keys = (token_name,)
+    if token_name.lower() != token_name:
+        flat_keys += (token_name.lower(),)
+
+    def get_path_value(data):
+        for key in flat_keys:
+            value = data.get(key)
+            if value is not None:
+                return value
+        for step in steps:
+            data = step(data)
+            if data is None:
+                return None
+        return data
+
+    return get_path_value
+
+
+class DefaultFallbackToken(Token):
+    """
+    The DefaultFallbackToken class looks up its name in the data, it is used
+        for every Token name that was not registered when a Template is
+        compiled with `default_fallback` enabled.
+
+    A dotted name like `entity.shot.code` is first looked up as a flat key,
+        then walks nested data where each segment is used as a mapping key, a
+        sequence index or a public, non callable attribute.
+    """
+
+    def __init__(self, token_name):
+        super(DefaultFallbackToken, self).__init__()
+        self.name = token_name
+        # Precompiled lookup used in place of `getValue`.
+        self.getValue = _key_accessor(token_name)
+
+    def __reduce__(self):
+        # Rebuild through the cache so unpickled Tokens are shared as well.
+        return default_fallback_token, (self.name,)
+
+
+def default_fallback_token(token_name):
+    """
+    default_fallback_token will return the shared DefaultFallbackToken for
+        `token_name`.
+
+    Plain names are lower cased like registered Token names, the keys of a
+        dotted path keep their case.
+
+    :param str token_name: Name of the Token to look up in the data.
+    :rtype: DefaultFallbackToken
+    """
+    if PATH_SEPARATOR not in token_name:
+        token_name = token_name.lower()
+    token = _default_tokens.get(token_name)
+    if token is None:
+        token = _default_tokens.setdefault(token_name, DefaultFallbackToken(token_name))
+    return token
+
+
+def _bound_token_class(token_name):
+    class BoundDefaultFallbackToken(DefaultFallbackToken):
+        name = token_name
+
+        def __init__(self):
+            super(BoundDefaultFallbackToken, self).__init__(token_name)
+
+        def __reduce__(self):
+            # The class only exists inside this factory, rebuild it by name.
+            return _create_default_token, (token_name,)
+
+    return BoundDefaultFallbackToken
+
+
+def DefaultTokenFactory(token_name):
+    """
+    DefaultTokenFactory will return a DefaultFallbackToken subclass bound to
+        `token_name`, one class per name is created and cached.
+
+    It is kept for backwards compatibility, the returned class can still be
+        instantiated without arguments, subclassed and used with
+        `isinstance`. Templates no longer use it, they share the instances
+        returned by `default_fallback_token`.
+
+    :param str token_name: Name of the Token to look up in the data.
+    :rtype: type
+    """
+    klass = _default_token_classes.get(token_name)
+    if klass is None:
+        klass = _default_token_classes.setdefault(
+            token_name, _bound_token_class(token_name)
+        )
+    return klass
+
+
+def _create_default_token(token_name):
+    # Name used by the pickles of `DefaultTokenFactory` instances.
+    return DefaultTokenFactory(token_name)()
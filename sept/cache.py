@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "size"])
+
+
+class LRUCache(object):
+    """
+    The LRUCache class is a small, bounded, thread safe least recently used
+        mapping.
+
+    It keeps track of how often a lookup succeeded, how often it missed and
+        how many entries had to be evicted to stay within `maxsize`.
+    A `maxsize` of 0 disables caching entirely and a `maxsize` of None lets
+        the cache grow without bounds.
+    """
+
+    def __init__(self, maxsize=128):
+        super(LRUCache, self).__init__()
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __getstate__(self):
+        # Locks can not be pickled, a copy starts out empty.
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(maxsize=state["maxsize"])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        get will return the value stored for `key` and mark it as the most
+            recently used entry.
+
+        :param Hashable key: Key to look up.
+        :param Any default: Value returned when `key` is not cached.
+        :return: The cached value or `default`.
+        :rtype: Any
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data[key] = value
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        put will store `value` under `key`, evicting the least recently used
+            entries if the cache is full.
+
+        :param Hashable key: Key to store the value under.
+        :param Any value: Value to cache.
+        :return: The value that is stored in the cache for `key`.
+        :rtype: Any
+        """
+        if self.maxsize == 0:
+            return value
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self._evictions += 1
+            return value
+
+    def setdefault(self, key, value):
+        """
+        setdefault will store `value` under `key` unless another value is
+            already cached for it.
+
+        Threads racing to cache the same key all get the same value back.
+
+        :param Hashable key: Key to store the value under.
+        :param Any value: Value to cache if `key` is not cached yet.
+        :return: The value that is stored in the cache for `key`.
+        :rtype: Any
+        """
+        if self.maxsize == 0:
+            return value
+        with self._lock:
+            if key in self._data:
+                value = self._data.pop(key)
+                self._data[key] = value
+                return value
+            self._data[key] = value
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self._evictions += 1
+            return value
+
+    def clear(self):
+        """
+        clear will remove every entry and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self):
+        """
+        info will return the hit, miss and eviction statistics of the cache.
+
+        :return: Current statistics of the cache.
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self.maxsize,
+                size=len(self._data),
+            )
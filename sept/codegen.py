@@ -0,0 +1,239 @@
+import collections
+
+from sept.builtin.operators.null import NullOperator
+from sept.errors import MultipleParsingError, ParsingError
+
+_FACTORY_NAME = "_make_resolver"
+_FUNCTION_NAME = "resolve"
+
+
+class _Source(object):
+    def __init__(self):
+        super(_Source, self).__init__()
+        self.lines = []
+        self.closure = {}
+        self._names = 0
+
+    def bind(self, prefix, value):
+        name = "{prefix}_{index}".format(prefix=prefix, index=len(self.closure))
+        self.closure[name] = value
+        return name
+
+    def local(self, prefix):
+        self._names += 1
+        return "{prefix}_{index}".format(prefix=prefix, index=self._names)
+
+    def emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+
+def _raise_invalid_data(users, operator, previous_operator, message):
+    # `users` holds the (Template name, ResolvedToken) of the first use of a
+    #   shared expression in every Template, so each error points into its
+    #   own Template.
+    errors = []
+    for name, resolved_token in users:
+        err = resolved_token.invalid_data_error(operator, message, previous_operator)
+        if name is not None:
+            err = "{name}: {err}".format(name=name, err=err)
+        errors.append(
+            ParsingError(
+                location=resolved_token.start,
+                length=resolved_token.end - resolved_token.start,
+                message=str(err),
+            )
+        )
+    if len(errors) == 1:
+        raise errors[0]
+    raise MultipleParsingError(errors)
+
+
+def _expression_key(resolved_token):
+    # Stateless Operators with the same arguments always produce the same
+    #   output, any other Operator is only equal to itself. The original
+    #   string is part of the key because it is the text of a missing value,
+    #   names that only differ in case share a raw Token but not that text.
+    return (id(resolved_token.raw_token), resolved_token.original_string) + tuple(
+        (
+            (type(operator), tuple(operator._args or ()))
+            if operator.stateless
+            else id(operator)
+        )
+        for operator in resolved_token.operators
+    )
+
+
+def _emit_value(source, raw_token, values):
+    # Deterministic Tokens are evaluated at their first occurrence and the
+    #   text is reused by every later occurrence.
+    key = id(raw_token)
+    if raw_token.deterministic and key in values:
+        return values[key]
+    value_name = source.local("value")
+    get_value = source.bind("get_value", raw_token.getValue)
+    source.emit(
+        2, "{value} = {get_value}(data)".format(value=value_name, get_value=get_value)
+    )
+    source.emit(2, "if {value} is not None:".format(value=value_name))
+    source.emit(3, "{value} = _str({value})".format(value=value_name))
+    if raw_token.deterministic:
+        values[key] = value_name
+    return value_name
+
+
+def _emit_slot(source, name, resolved_token, values, texts, trusted):
+    # The same expression of a deterministic Token always produces the same
+    #   text, it is only computed once.
+    key = None
+    if resolved_token.raw_token.deterministic:
+        key = _expression_key(resolved_token)
+        if key in texts:
+            text_name, users = texts[key]
+            if all(user_name != name for user_name, _ in users):
+                users.append((name, resolved_token))
+            return text_name
+
+    text_name = source.local("text")
+    value_name = _emit_value(source, resolved_token.raw_token, values)
+    original = source.bind("original", resolved_token.original_string)
+    source.emit(2, "if {value} is None:".format(value=value_name))
+    source.emit(3, "{text} = {original}".format(text=text_name, original=original))
+    source.emit(2, "else:")
+    source.emit(3, "{text} = {value}".format(text=text_name, value=value_name))
+
+    users = [(name, resolved_token)]
+    users_name = source.bind("users", users)
+    previous_name = "None"
+    checks = resolved_token.trusted_checks()
+    for operator, checked in zip(resolved_token.operators, checks):
+        operator_name = source.bind("operator", operator)
+        if type(operator) is NullOperator:
+            # The NULL operator never rejects data and returns its input.
+            previous_name = operator_name
+            continue
+        execute = source.bind("execute", operator.execute)
+        if trusted and not checked:
+            source.emit(
+                3, "{text} = {execute}({text})".format(text=text_name, execute=execute)
+            )
+            previous_name = operator_name
+            continue
+        is_invalid = source.bind("is_invalid", operator.is_invalid)
+        source.emit(
+            3,
+            "error = {is_invalid}({text})".format(
+                is_invalid=is_invalid, text=text_name
+            ),
+        )
+        source.emit(3, "if error:")
+        source.emit(
+            4,
+            "_raise_invalid_data({users}, {operator}, {previous}, error)".format(
+                users=users_name, operator=operator_name, previous=previous_name
+            ),
+        )
+        source.emit(
+            3, "{text} = {execute}({text})".format(text=text_name, execute=execute)
+        )
+        previous_name = operator_name
+
+    if key is not None:
+        texts[key] = (text_name, users)
+    return text_name
+
+
+def _emit_template(source, name, template, values, texts, trusted):
+    parts = list(template._parts)
+    for index, resolved_token in template._slots:
+        parts[index] = _emit_slot(source, name, resolved_token, values, texts, trusted)
+
+    slot_indexes = set(index for index, _ in template._slots)
+    joined = ", ".join(
+        part if index in slot_indexes else repr(part)
+        for index, part in enumerate(parts)
+    )
+    if joined:
+        return "_join(({parts},))".format(parts=joined)
+    return "''"
+
+
+def _new_source():
+    source = _Source()
+    source.closure["_str"] = str
+    source.closure["_join"] = "".join
+    source.closure["_raise_invalid_data"] = _raise_invalid_data
+    source.emit(1, "def {name}(data):".format(name=_FUNCTION_NAME))
+    return source
+
+
+def _build(source, filename):
+    source.emit(1, "return {name}".format(name=_FUNCTION_NAME))
+    # The bound values are unpacked into locals of the factory so the
+    #   generated function reads them as closure variables.
+    header = ["def {factory}(closure):".format(factory=_FACTORY_NAME)]
+    for name in sorted(source.closure):
+        header.append("    {name} = closure[{key!r}]".format(name=name, key=name))
+    code = "\n".join(header + source.lines) + "\n"
+    namespace = {}
+    exec(compile(code, filename, "exec"), namespace)
+    function = namespace[_FACTORY_NAME](source.closure)
+    function.__source__ = code
+    return function
+
+
+def compile_resolver(template, trusted=False):
+    """
+    compile_resolver generates a Python function specialized to `template`.
+
+    The returned function takes a data dictionary and returns the same value
+        as `Template.resolve`, but every literal, `getValue` call and Operator
+        call is written out inline instead of looping over the tokens.
+    Like `Template.resolve`, deterministic Tokens are only evaluated once.
+
+    :param sept.template.Template template: Template to compile.
+    :param bool trusted: Leave out the `is_invalid` calls that
+        `ResolvedToken.trusted_checks` proved unnecessary.
+    :return: Function taking the data to resolve against.
+    :rtype: callable
+    """
+    source = _new_source()
+    joined = _emit_template(source, None, template, {}, {}, trusted)
+    source.emit(2, "return {joined}".format(joined=joined))
+    return _build(source, "<sept template {!r}>".format(template.text()))
+
+
+def compile_set_resolver(templates, trusted=False):
+    """
+    compile_set_resolver generates a single Python function that resolves
+        every Template in `templates` against the same data.
+
+    Every deterministic Token is evaluated once and every distinct Token
+        Expression (the Token with its Operator chain) is computed once, no
+        matter how many of the Templates use it.
+
+    :param list[tuple[str,sept.template.Template]] templates: Templates by
+        name.
+    :param bool trusted: See `compile_resolver`.
+    :return: Function taking the data to resolve against and returning an
+        OrderedDict of the resolved strings by name, in the order of
+        `templates`.
+    :rtype: callable
+    """
+    source = _new_source()
+    source.closure["_OrderedDict"] = collections.OrderedDict
+    values = {}
+    texts = {}
+    results = []
+    for name, template in templates:
+        joined = _emit_template(source, name, template, values, texts, trusted)
+        results.append(
+            "({name}, {joined})".format(name=source.bind("name", name), joined=joined)
+        )
+    # Dictionaries only keep their insertion order from Python 3.7 on.
+    source.emit(
+        2,
+        "return _OrderedDict(({results}))".format(
+            results="".join(result + ", " for result in results)
+        ),
+    )
+    return _build(source, "<sept template set>")
@@ -10,12 +10,24 @@ class OperatorError(SeptError):
     pass
 
 
+def _restore_error(klass, message, state):
+    error = klass.__new__(klass)
+    Exception.__init__(error, message)
+    error.__dict__.update(state)
+    return error
+
+
 class LocationAwareSeptError(SeptError):
     def __init__(self, location, message, length=0):
         super(SeptError, self).__init__(message)
         self.location = location
         self.length = length
 
+    def __reduce__(self):
+        # Subclasses have their own __init__ signatures, rebuild them from
+        #   their message and attributes so they survive pickling.
+        return _restore_error, (self.__class__, str(self), self.__dict__)
+
 
 class ParsingError(LocationAwareSeptError):
     def __init__(self, location, message, length=0):
@@ -90,6 +102,30 @@ class ClosingBalancingParenthesisError(BalancingParenthesisError):
     pass
 
 
+class MaximumDepthParsingError(ParsingError):
+    def __init__(self, location, max_depth):
+        message = (
+            "Error: Token Expression at {} is nested deeper than the maximum "
+            "depth of {}".format(location, max_depth)
+        )
+        super(MaximumDepthParsingError, self).__init__(
+            location=location, length=2, message=message
+        )
+        self.max_depth = max_depth
+
+
+class MaximumLengthParsingError(ParsingError):
+    def __init__(self, length, max_length):
+        message = (
+            "Error: Template is {} characters long, longer than the maximum "
+            "length of {}".format(length, max_length)
+        )
+        super(MaximumLengthParsingError, self).__init__(
+            location=0, length=length, message=message
+        )
+        self.max_length = max_length
+
+
 class MultipleBalancingError(ParsingError):
     def __init__(self, errors):
         location = -1
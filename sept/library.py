@@ -0,0 +1,193 @@
+import json
+import pickle
+import threading
+import uuid
+from collections import OrderedDict, namedtuple
+
+from sept.errors import SeptError
+from sept.template_set import TemplateSet
+
+# Outcome of `TemplateLibrary.load`.
+#   `compiled`, `unchanged` and `removed` are lists of names and `errors`
+#   maps the name of every entry that failed to compile to its error.
+LoadReport = namedtuple("LoadReport", ["compiled", "unchanged", "removed", "errors"])
+
+# The parser each worker process compiles with, by the key of the `load`
+#   call that sent it. It is only unpickled once per worker.
+_worker_parser = (None, None)
+
+
+def _compile_entry(parser, template_str, default_fallback_token):
+    try:
+        return parser.validate_template(template_str, default_fallback_token)
+    except SeptError as err:
+        return err
+
+
+def _compile_in_worker(key, payload, template_str, default_fallback_token):
+    global _worker_parser
+    if _worker_parser[0] != key:
+        _worker_parser = (key, pickle.loads(payload))
+    return _compile_entry(_worker_parser[1], template_str, default_fallback_token)
+
+
+class TemplateLibrary(object):
+    """
+    The TemplateLibrary class keeps a named collection of compiled Templates
+        in sync with a configuration mapping names to template strings.
+
+    Every `load` only compiles the entries whose template string changed,
+        optionally spread over an executor, and reports every entry that
+        failed instead of stopping at the first one.
+    The Templates are swapped in all at once when a load finishes, so
+        readers never see a half loaded library.
+    """
+
+    def __init__(self, parser=None, executor=None, default_fallback_token=True):
+        """
+        :param sept.parser.PathTemplateParser parser: Parser compiling the
+            template strings, a default parser is created if not given.
+        :param concurrent.futures.Executor executor: Executor the entries are
+            compiled on, they are compiled in the calling thread if not given.
+            Compiling is CPU bound, only a `ProcessPoolExecutor` compiles
+            entries at the same time. The parser and any custom Tokens and
+            Operators it uses have to be picklable for one.
+        :param bool default_fallback_token: See
+            `sept.parser.PathTemplateParser.validate_template`.
+        """
+        super(TemplateLibrary, self).__init__()
+        if parser is None:
+            from sept.parser import PathTemplateParser
+
+            parser = PathTemplateParser()
+        self._parser = parser
+        self._executor = executor
+        self._default_fallback_token = default_fallback_token
+        self._load_lock = threading.Lock()
+        # Compile key (see `PathTemplateParser._cache_key`) and compiled
+        #   Template by name.
+        self._sources = OrderedDict()
+        self._templates = OrderedDict()
+        self._template_set = None
+
+    def __len__(self):
+        return len(self._templates)
+
+    def __iter__(self):
+        return iter(self._templates)
+
+    def __contains__(self, name):
+        return name in self._templates
+
+    def __getitem__(self, name):
+        return self._templates[name]
+
+    def names(self):
+        return list(self._templates)
+
+    def template_set(self):
+        """
+        template_set will return the loaded Templates as a TemplateSet.
+
+        :rtype: sept.template_set.TemplateSet
+        """
+        template_set = self._template_set
+        if template_set is None:
+            template_set = TemplateSet(self._templates)
+            self._template_set = template_set
+        return template_set
+
+    def _compile_all(self, template_strs):
+        fallback = self._default_fallback_token
+        if self._executor is None:
+            return [
+                _compile_entry(self._parser, template_str, fallback)
+                for template_str in template_strs
+            ]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        if isinstance(self._executor, ProcessPoolExecutor):
+            # The parser is pickled once instead of with the library for
+            #   every entry.
+            key = uuid.uuid4().hex
+            payload = pickle.dumps(self._parser, pickle.HIGHEST_PROTOCOL)
+            futures = [
+                self._executor.submit(
+                    _compile_in_worker, key, payload, template_str, fallback
+                )
+                for template_str in template_strs
+            ]
+        else:
+            futures = [
+                self._executor.submit(
+                    _compile_entry, self._parser, template_str, fallback
+                )
+                for template_str in template_strs
+            ]
+        return [future.result() for future in futures]
+
+    def load(self, template_strs):
+        """
+        load will make the library match `template_strs`.
+
+        Entries with the same template string as the previous load keep their
+            compiled Template, unless Tokens or Operators were registered on
+            the parser since. New and changed entries are compiled and
+            entries that are no longer present are removed.
+        Entries that fail to compile are left out of the library and reported.
+
+        :param dict[str,str] template_strs: Template strings by name.
+        :return: What changed and every error that was raised.
+        :rtype: LoadReport
+        """
+        with self._load_lock:
+            template_strs = OrderedDict(template_strs)
+            sources = OrderedDict(
+                (
+                    name,
+                    self._parser._cache_key(template_str, self._default_fallback_token),
+                )
+                for name, template_str in template_strs.items()
+            )
+            changed = [
+                name
+                for name, source in sources.items()
+                if self._sources.get(name) != source or name not in self._templates
+            ]
+            results = self._compile_all([template_strs[name] for name in changed])
+            compiled = dict(zip(changed, results))
+
+            templates = OrderedDict()
+            errors = OrderedDict()
+            for name in sources:
+                result = compiled.get(name, self._templates.get(name))
+                if isinstance(result, SeptError):
+                    errors[name] = result
+                else:
+                    templates[name] = result
+
+            report = LoadReport(
+                compiled=[name for name in changed if name not in errors],
+                unchanged=[name for name in sources if name not in compiled],
+                removed=[name for name in self._sources if name not in sources],
+                errors=errors,
+            )
+            self._sources = sources
+            self._templates = templates
+            self._template_set = None
+            return report
+
+    def load_file(self, path, loader=json.load):
+        """
+        load_file will read a configuration file mapping names to template
+            strings and `load` it.
+
+        :param str path: Path to the configuration file.
+        :param callable loader: Function reading the opened file, JSON by
+            default. Pass `yaml.safe_load` for YAML files.
+        :rtype: LoadReport
+        """
+        with open(path, "r") as handle:
+            template_strs = loader(handle)
+        return self.load(template_strs)
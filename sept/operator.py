@@ -23,14 +23,68 @@ class Operator(object):
     # Internal...Ignore this
     _private = False
 
+    # Set this to True if your Operator holds nothing but what `compile`
+    #   derives from its arguments and never changes afterwards. Stateless
+    #   Operators are shared by every Template that uses them with the same
+    #   arguments instead of being created for every Token Expression.
+    stateless = False
+
+    # Operators are created for every Token Expression of every Template.
+    #   Subclasses that store compiled arguments can list them in their own
+    #   `__slots__` to stay compact, subclasses without `__slots__` still
+    #   get a regular `__dict__`.
+    __slots__ = ("_args",)
+
     def __init__(self, args=None):
         super(Operator, self).__init__()
         self._args = args
 
+    def __getstate__(self):
+        # Python 2 can only pickle a class with `__slots__` with the default
+        #   protocols through `__getstate__`, collect every slot of the MRO.
+        state = dict(getattr(self, "__dict__", {}))
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @classmethod
     def create(cls, args=None):
         return cls(args=args)
 
+    def compile(self):
+        """
+        compile is called once when your Operator is added to a Template,
+            before any data is resolved.
+        Parse and validate `self._args` here and store whatever `execute`
+            needs so that `execute` only has to transform the data.
+
+        If the arguments are not valid, raise a
+            `sept.errors.InvalidOperatorArgumentsError`. It will be reported
+            as a `sept.errors.ParsingError` pointing at your Operator.
+        """
+        return None
+
+    def compiled_key(self):
+        """
+        compiled_key returns what `compile` derived from `self._args` as a
+            hashable value.
+
+        Stateless Operators whose compiled keys are equal are interned as a
+            single instance, so arguments that only differ in how they are
+            written (like "START" and "start") share one Operator.
+        The default of None interns on the raw arguments instead.
+
+        :return: Hashable value describing the compiled arguments, or None.
+        :rtype: Hashable|None
+        """
+        return None
+
     def execute(self, input_data):
         """
         execute does the actual work of your custom Operator.
@@ -56,3 +110,40 @@ class Operator(object):
         :return: A Falsey value if everything is ok, or an error string if not.
         :rtype: None|str
         """
+
+    def output_pattern(self, input_pattern):
+        """
+        output_pattern describes the text your Operator produces as a regular
+            expression. It is used to find Token values in an existing path
+            with `Template.parse_path`.
+
+        `input_pattern` is the regular expression describing the data passed
+            to your Operator, an Operator that does not change its input can
+            just return it.
+
+        If the output of your Operator can not be mapped back to its input,
+            return None (the default). The Token will still have to match but
+            its value will not be returned.
+
+        :param str input_pattern: Regular expression of the input data.
+        :return: Regular expression of the output data or None.
+        :rtype: str|None
+        """
+        return None
+
+    def output_type(self, input_type):
+        """
+        output_type lets a Template prove when it is compiled that your
+            Operator will never reject the data it receives, so resolving in
+            trusted mode can skip calling `is_invalid`.
+
+        If `is_invalid` is guaranteed to accept any value of `input_type`,
+            return the type that `execute` returns for it.
+        Otherwise return None (the default) and your Operator will always be
+            validated.
+
+        :param type input_type: Type of the data passed to your Operator.
+        :return: Type of the data returned by your Operator or None.
+        :rtype: type|None
+        """
+        return None
@@ -1,24 +1,67 @@
+from sept.cache import LRUCache
 from sept.errors import OperatorNotFoundError, OperatorNameAlreadyExists
 
+# Marks interning keys built from `Operator.compiled_key`, so they never
+#   collide with the keys built from raw arguments.
+_COMPILED = object()
+
 
 class OperatorManager(object):
+    # Maximum number of distinct stateless Operators kept for sharing.
+    INTERN_SIZE = 1024
+
     def __init__(self):
         super(OperatorManager, self).__init__()
         self._cache = {}
+        self._version = 0
+        self._interned = LRUCache(maxsize=self.INTERN_SIZE)
 
-        from sept.builtin.operators import ALL_OPERATORS
+        # Builtin Operators are registered by name and only imported the
+        #   first time they are looked up, see `_lookup`.
+        from sept.builtin.operators import BUILTIN_OPERATORS
 
-        for operator_klass in ALL_OPERATORS:
-            self._cache[operator_klass.name] = operator_klass
+        for operator_name in BUILTIN_OPERATORS:
+            self._cache[operator_name] = None
 
     @property
     def operators(self):
         # Don't include the NULL operator
         return sorted(
-            filter(lambda op: op._private is False, self._cache.values()),
+            filter(
+                lambda op: op._private is False,
+                [self._lookup(name) for name in self._cache],
+            ),
             key=lambda op: op.name,
         )
 
+    @property
+    def version(self):
+        # Bumped every time the registered operators change
+        return self._version
+
+    def fingerprint(self):
+        """
+        fingerprint will return the name and class of every registered
+            Operator, without importing the builtin Operators.
+
+        :return: Sorted tuple of (name, "module.Class") pairs.
+        :rtype: tuple[tuple[str,str]]
+        """
+        from sept.builtin.operators import BUILTIN_OPERATORS
+
+        classes = []
+        for name, operator_klass in self._cache.items():
+            if operator_klass is None:
+                path = "{}.{}".format(*BUILTIN_OPERATORS[name])
+            else:
+                if not isinstance(operator_klass, type):
+                    operator_klass = type(operator_klass)
+                path = "{}.{}".format(
+                    operator_klass.__module__, operator_klass.__name__
+                )
+            classes.append((name, path))
+        return tuple(sorted(classes))
+
     def add_custom_operators(self, custom_operators, dont_overwrite=True):
         for custom_operator in custom_operators:
             if custom_operator.name in self._cache and dont_overwrite:
@@ -28,15 +71,45 @@ class OperatorManager(object):
                     "you pass `dont_overwrite=True` when adding custom "
                     "operators.".format(
                         name=custom_operator.name,
-                        value=self._cache[custom_operator.name],
+                        value=self._lookup(custom_operator.name),
                     )
                 )
             self._cache[custom_operator.name] = custom_operator()
+        self._version += 1
+
+    def _lookup(self, operator_name):
+        operator_klass = self._cache[operator_name]
+        if operator_klass is None:
+            from sept.builtin.operators import load_builtin_operator
+
+            operator_klass = load_builtin_operator(operator_name)
+            self._cache[operator_name] = operator_klass
+        return operator_klass
 
     def getOperator(self, operator_name, args=None):
         if operator_name in self._cache:
-            operator_klass = self._cache[operator_name]
-            return operator_klass.create(args)
+            operator_klass = self._lookup(operator_name)
+            if not operator_klass.stateless:
+                operator = operator_klass.create(args)
+                operator.compile()
+                return operator
+
+            # Stateless Operators are interned, every Template using the
+            #   same Operator with equivalent arguments shares one instance.
+            #   The raw arguments are kept as an alias of the compiled key so
+            #   repeated lookups skip `compile`.
+            key = (operator_klass, None if args is None else tuple(args))
+            operator = self._interned.get(key)
+            if operator is None:
+                operator = operator_klass.create(args)
+                operator.compile()
+                compiled_key = operator.compiled_key()
+                if compiled_key is not None:
+                    operator = self._interned.setdefault(
+                        (operator_klass, _COMPILED, compiled_key), operator
+                    )
+                operator = self._interned.setdefault(key, operator)
+            return operator
         raise OperatorNotFoundError(
             "Could not find an Operator with the name {}".format(operator_name)
         )
@@ -0,0 +1,93 @@
+import collections
+import itertools
+import multiprocessing
+import pickle
+import uuid
+
+from sept.template import ON_ERROR_RAISE, ON_ERROR_POLICIES
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# The Template each worker process resolves against, by the key of the
+#   `resolve_parallel` call that sent it. The pickled Template travels with
+#   every chunk but is only unpickled once per worker.
+#   Executors only take an `initializer` from Python 3.7 on.
+_worker_template = (None, None)
+
+
+def _resolve_chunk(key, payload, records, on_error, trusted):
+    global _worker_template
+    if _worker_template[0] != key:
+        _worker_template = (key, pickle.loads(payload))
+    template = _worker_template[1]
+    return list(template.resolve_many(records, on_error=on_error, trusted=trusted))
+
+
+def resolve_parallel(
+    template,
+    records,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    max_workers=None,
+    on_error=ON_ERROR_RAISE,
+    trusted=False,
+):
+    """
+    resolve_parallel will resolve `records` against `template` using a pool of
+        worker processes.
+
+    The Template is pickled once and only unpickled once per worker, the
+        records are streamed to the workers `chunk_size` at a time and the results are
+        yielded in the same order as `records`.
+    Only a few chunks per worker are in flight at any time so memory use does
+        not grow with the number of records.
+
+    :param sept.template.Template template: Template to resolve.
+    :param Iterable[dict] records: Data to resolve against, one per result.
+    :param int chunk_size: Number of records sent to a worker at a time.
+    :param int|None max_workers: Number of worker processes, defaults to the
+        number of CPUs.
+    :param str on_error: See `sept.template.Template.resolve_many`.
+    :param bool trusted: See `sept.template.Template.resolve`.
+    :return: Generator of resolved strings (and errors if requested).
+    :rtype: Iterator[str|sept.errors.SeptError]
+    """
+    if on_error not in ON_ERROR_POLICIES:
+        raise ValueError(
+            "Unknown on_error policy {policy}, expected one of {policies}".format(
+                policy=on_error, policies=ON_ERROR_POLICIES
+            )
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive number")
+    max_workers = max_workers or multiprocessing.cpu_count()
+    return _resolve_parallel(
+        template, iter(records), chunk_size, max_workers, on_error, trusted
+    )
+
+
+def _resolve_parallel(template, records, chunk_size, max_workers, on_error, trusted):
+    from concurrent.futures import ProcessPoolExecutor
+
+    key = uuid.uuid4().hex
+    payload = pickle.dumps(template, pickle.HIGHEST_PROTOCOL)
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    pending = collections.deque()
+    try:
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if chunk:
+                pending.append(
+                    executor.submit(
+                        _resolve_chunk, key, payload, chunk, on_error, trusted
+                    )
+                )
+            if not pending:
+                break
+            if chunk and len(pending) < max_workers * 2:
+                continue
+            for result in pending.popleft().result():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
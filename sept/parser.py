@@ -1,11 +1,25 @@
 from sept.token_manager import TokenManager
 from sept.operator_manager import OperatorManager
 from sept.documentation import DocumentationGenerator
-from sept.template import Template
+from sept.template import Template, ENGINE_PYPARSING
+from sept.balancer import DEFAULT_MAX_DEPTH, DEFAULT_MAX_LENGTH
+from sept.cache import LRUCache
+from sept.template_set import TemplateSet
 
 
 class PathTemplateParser(object):
-    def __init__(self, additional_tokens=None, additional_operators=None):
+    DEFAULT_CACHE_SIZE = 512
+
+    def __init__(
+        self,
+        additional_tokens=None,
+        additional_operators=None,
+        cache_size=DEFAULT_CACHE_SIZE,
+        engine=ENGINE_PYPARSING,
+        max_depth=DEFAULT_MAX_DEPTH,
+        max_length=DEFAULT_MAX_LENGTH,
+        cache_dir=None,
+    ):
         super(PathTemplateParser, self).__init__()
 
         self._token_manager = TokenManager()
@@ -20,6 +34,20 @@ class PathTemplateParser(object):
             token_manager=self._token_manager,
             operator_manager=self._operator_manager,
         )
+        self._template_cache = LRUCache(maxsize=cache_size)
+        # "pyparsing" or the single pass "scanner" compile engine
+        self._engine = engine
+        # Limits on nesting and length that keep untrusted template strings
+        #   from exhausting time or memory, None disables a limit.
+        self._max_depth = max_depth
+        self._max_length = max_length
+        # Compiled Templates are also kept on disk when a directory is given
+        #   so new processes can skip compiling them.
+        self._disk_cache = None
+        if cache_dir is not None:
+            from sept.serialization import TemplateDiskCache
+
+            self._disk_cache = TemplateDiskCache(cache_dir)
 
     def operator_documentation(self):
         return self._documentation_generation.generate_operator_documentation()
@@ -27,17 +55,116 @@ class PathTemplateParser(object):
     def token_documentation(self):
         return self._documentation_generation.generate_token_documentation()
 
+    def cache_info(self):
+        """
+        cache_info will return the statistics of the compiled Template cache.
+
+        :return: Named tuple of hits, misses, evictions, maxsize and size.
+        :rtype: sept.cache.CacheInfo
+        """
+        return self._template_cache.info()
+
+    def clear_cache(self):
+        """
+        clear_cache will drop every compiled Template from the cache.
+        """
+        self._template_cache.clear()
+
     def parse(self, template, data):
         if not isinstance(template, Template):
             template = self.validate_template(template)
 
         return template.resolve(data)
 
+    def resolve_parallel(self, template, records, **kwargs):
+        """
+        resolve_parallel will resolve every record in `records` against
+            `template` using a pool of worker processes.
+
+        :param str|Template template: Template to resolve.
+        :param Iterable[dict] records: Data to resolve against, one per result.
+        :param kwargs: See `sept.template.Template.resolve_parallel`.
+        :return: Generator of resolved strings in the same order as `records`.
+        :rtype: Iterator[str|sept.errors.SeptError]
+        """
+        if not isinstance(template, Template):
+            template = self.validate_template(template)
+
+        return template.resolve_parallel(records, **kwargs)
+
+    def _cache_key(self, template_str, default_fallback_token):
+        # Any change to the registered tokens or operators can change how a
+        #   template string compiles, so the registry versions are part of
+        #   the key and stale entries simply age out of the cache.
+        return (
+            template_str,
+            bool(default_fallback_token),
+            self._token_manager.version,
+            self._operator_manager.version,
+        )
+
     def validate_template(self, template_str, default_fallback_token=True):
-        template = Template.from_template_str(
+        cache_key = self._cache_key(template_str, default_fallback_token)
+        template = self._template_cache.get(cache_key)
+        if template is not None:
+            return template
+
+        if self._disk_cache is None:
+            template = self._compile_template(template_str, default_fallback_token)
+        else:
+            template = self._load_template(template_str, default_fallback_token)
+        return self._template_cache.put(cache_key, template)
+
+    def _compile_template(self, template_str, default_fallback_token):
+        return Template.from_template_str(
             template_str=template_str,
             tmanager=self._token_manager,
             omanager=self._operator_manager,
             default_fallback=default_fallback_token,
+            engine=self._engine,
+            max_depth=self._max_depth,
+            max_length=self._max_length,
+        )
+
+    def _load_template(self, template_str, default_fallback_token):
+        from sept.serialization import template_key
+
+        # The engine always produces the same Template, the limits decide
+        #   whether a template string compiles at all.
+        disk_key = template_key(
+            template_str,
+            self._token_manager,
+            self._operator_manager,
+            default_fallback=bool(default_fallback_token),
+            max_depth=self._max_depth,
+            max_length=self._max_length,
         )
+        template = self._disk_cache.get(
+            disk_key, self._token_manager, self._operator_manager
+        )
+        if template is None:
+            template = self._compile_template(template_str, default_fallback_token)
+            self._disk_cache.put(disk_key, template)
         return template
+
+    def validate_template_set(self, template_strs, default_fallback_token=True):
+        """
+        validate_template_set will compile every template string in
+            `template_strs` and group them in a TemplateSet.
+
+        The Templates keep the order of `template_strs`, which decides the
+            order of `TemplateSet.classify` and `TemplateSet.required_tokens`.
+            A plain dict has no order before Python 3.7, pass an OrderedDict
+            or a sequence of pairs when the order matters.
+
+        :param dict[str,str]|Iterable[tuple[str,str]] template_strs: Template
+            strings by name, or (name, template string) pairs.
+        :param bool default_fallback_token: See `validate_template`.
+        :rtype: TemplateSet
+        """
+        if hasattr(template_strs, "items"):
+            template_strs = template_strs.items()
+        return TemplateSet(
+            (name, self.validate_template(template_str, default_fallback_token))
+            for name, template_str in template_strs
+        )
@@ -0,0 +1,202 @@
+import re
+import sys
+
+from sept.errors import SeptError
+from sept.template_set import PATH_SEPARATOR
+
+# Token values are matched one path component at a time, they never span a
+#   path separator.
+SLOT_PATTERN = r"[^/\\]+?"
+# Path components without uppercase and without lowercase letters.
+LOWERCASE_PATTERN = r"[^A-Z/\\]+?"
+UPPERCASE_PATTERN = r"[^a-z/\\]+?"
+
+
+class _Slot(object):
+    def __init__(self, resolved_token, pattern, invertible):
+        super(_Slot, self).__init__()
+        self.resolved_token = resolved_token
+        self.pattern = pattern
+        self.invertible = invertible
+        self.group = None
+        # Only the private NULL Operator leaves the Token value untouched, a
+        #   pattern can look like `SLOT_PATTERN` after any Operator.
+        self.is_identity = all(
+            operator._private for operator in resolved_token.operators
+        )
+
+    @property
+    def token_name(self):
+        return self.resolved_token.raw_token.name
+
+    @property
+    def chain_key(self):
+        return tuple(
+            (type(operator), tuple(operator._args or ()))
+            for operator in self.resolved_token.operators
+        )
+
+
+def case_insensitive_pattern(input_pattern, cased_pattern):
+    """
+    case_insensitive_pattern will return the pattern of an Operator that only
+        changes the case of the text matched by `input_pattern`.
+
+    :param str input_pattern: Regular expression of the input data.
+    :param str cased_pattern: `LOWERCASE_PATTERN` or `UPPERCASE_PATTERN`.
+    :return: `cased_pattern` for input that is only constrained by its case,
+        otherwise `input_pattern` matched without regard to case.
+    :rtype: str
+    """
+    if input_pattern in (SLOT_PATTERN, LOWERCASE_PATTERN, UPPERCASE_PATTERN):
+        return cased_pattern
+    if sys.version_info < (3, 6):
+        # Scoped inline flags need Python 3.6, the value is still checked by
+        #   `PathMatcher.match` resolving the slot again.
+        return SLOT_PATTERN
+    return "(?i:{})".format(input_pattern)
+
+
+def slot_pattern(resolved_token):
+    """
+    slot_pattern will return the regular expression text that matches the
+        output of `resolved_token` and whether the matched text is the value
+        of its raw Token.
+
+    Each Operator narrows the pattern through `Operator.output_pattern`. An
+        Operator that can not describe its output makes the slot match any
+        path component and marks it as not invertible.
+
+    :param sept.token.ResolvedToken resolved_token: Token slot to describe.
+    :return: Tuple of the regular expression and whether it is invertible.
+    :rtype: tuple[str,bool]
+    """
+    pattern = SLOT_PATTERN
+    for operator in resolved_token.operators:
+        pattern = operator.output_pattern(pattern)
+        if pattern is None:
+            return SLOT_PATTERN, False
+    return pattern, True
+
+
+class PathMatcher(object):
+    """
+    The PathMatcher class is the inverse of `Template.resolve`.
+
+    It compiles the literal segments and Token slots of a Template into a
+        single regular expression and uses it to extract the Token values
+        from an existing path.
+    Slots that repeat a Token with the same Operators must match the same
+        text, Operators that can not be inverted (like `substr`) still have to
+        match but do not contribute a value.
+    Every slot with Operators is resolved again from the extracted value and
+        has to give back the matched text, so the values always resolve to
+        the same path and slots using a Token with different Operators agree
+        with each other.
+    """
+
+    def __init__(self, template):
+        super(PathMatcher, self).__init__()
+        self.template = template
+        self._slots = []
+        self._regex = re.compile(self._build_pattern(template))
+
+        # Slots without transforming Operators hold the exact Token value,
+        #   prefer those over the first transformed occurrence.
+        groups = {}
+        invertible = [slot for slot in self._slots if slot.invertible]
+        for slot in sorted(invertible, key=lambda slot: not slot.is_identity):
+            groups.setdefault(slot.token_name, slot)
+        self._groups = sorted((name, slot.group) for name, slot in groups.items())
+        # Slots whose text has to be what their Operators make of the
+        #   extracted value, patterns alone can not tie them together.
+        self._checks = [
+            (slot.token_name, slot.group, slot.resolved_token)
+            for slot in self._slots
+            if slot.token_name in groups and not slot.is_identity
+        ]
+
+    def _build_pattern(self, template):
+        pattern = []
+        groups = {}
+        slots_by_index = dict(template._slots)
+        for index, part in enumerate(template._parts):
+            if index not in slots_by_index:
+                pattern.append(re.escape(part))
+                continue
+
+            slot = _Slot(slots_by_index[index], *slot_pattern(slots_by_index[index]))
+            key = (slot.token_name, slot.chain_key)
+            if key in groups:
+                # The same expression has to resolve to the same text.
+                pattern.append("(?P={})".format(groups[key]))
+                continue
+            slot.group = "slot{}".format(len(self._slots))
+            groups[key] = slot.group
+            self._slots.append(slot)
+            pattern.append("(?P<{}>{})".format(slot.group, slot.pattern))
+        return "(?:{})\\Z".format("".join(pattern))
+
+    @property
+    def pattern(self):
+        return self._regex.pattern
+
+    def match(self, path):
+        """
+        match will extract the Token values from `path`.
+
+        :param str path: Path that was resolved from the Template.
+        :return: A dictionary of Token name to the matched text, or None if
+            `path` could not have been resolved from the Template.
+        :rtype: dict|None
+        """
+        match = self._regex.match(path)
+        if match is None:
+            return None
+
+        values = dict((name, match.group(group)) for name, group in self._groups)
+        for name, group, resolved_token in self._checks:
+            try:
+                text = resolved_token.apply(values[name])
+            except SeptError:
+                return None
+            if text != match.group(group):
+                return None
+        return values
+
+
+def level_patterns(template):
+    """
+    level_patterns will split `template` into its path levels.
+
+    Fully literal levels are returned as their text, levels containing a
+        Token as a compiled regular expression matching any directory or file
+        name the level could resolve to.
+    Repeated Tokens are not tied together so the expressions can reject
+        names early but `Template.parse_path` still has to confirm a path.
+
+    :param sept.template.Template template: Template to split.
+    :return: One entry per path level.
+    :rtype: list[str|re.Pattern]
+    """
+    slots_by_index = dict(template._slots)
+    levels = [[]]
+    for index, part in enumerate(template._parts):
+        if index in slots_by_index:
+            pattern, _ = slot_pattern(slots_by_index[index])
+            levels[-1].append((None, pattern))
+            continue
+        pieces = part.split(PATH_SEPARATOR)
+        levels[-1].append((pieces[0], re.escape(pieces[0])))
+        for piece in pieces[1:]:
+            levels.append([(piece, re.escape(piece))])
+
+    patterns = []
+    for level in levels:
+        if all(text is not None for text, _ in level):
+            patterns.append("".join(text for text, _ in level))
+        else:
+            patterns.append(
+                re.compile("(?:{})\\Z".format("".join(regex for _, regex in level)))
+            )
+    return patterns
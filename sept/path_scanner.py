@@ -0,0 +1,286 @@
+import os
+
+from sept.errors import TokenNotFoundError
+from sept.path_matcher import level_patterns
+from sept.template_set import PATH_SEPARATOR
+from sept.token import ResolvedToken
+
+
+def _list_directory(directory):
+    # Yields (name, is_directory) for every entry of `directory`.
+    scandir = getattr(os, "scandir", None)
+    if scandir is None:
+        for name in os.listdir(directory):
+            yield name, os.path.isdir(os.path.join(directory, name))
+        return
+    for entry in scandir(directory):
+        try:
+            is_directory = entry.is_dir()
+        except OSError:
+            is_directory = False
+        yield entry.name, is_directory
+
+
+def _join(prefix, name, level):
+    if level == 0:
+        return name
+    return prefix + PATH_SEPARATOR + name
+
+
+def _listing_directory(prefix, level):
+    # The first level of a relative template is listed from the current
+    #   directory, an empty prefix after the first level is the root.
+    if level == 0:
+        return "."
+    return prefix or PATH_SEPARATOR
+
+
+def _parse_path(template, path, known):
+    values = template.parse_path(path)
+    if values is not None and known:
+        values.update(known)
+    return values
+
+
+def scan_template(template, partial_data=None):
+    """
+    scan_template will find the existing paths that `template` could have
+        resolved to.
+
+    The directory tree is walked one template level at a time. Fully literal
+        levels are joined without listing anything and every other level
+        lists a single directory, only descending into the names that can
+        still match that level.
+    Every candidate is confirmed with `Template.parse_path`, the values of
+        the Tokens bound from `partial_data` are added to its result.
+
+    :param sept.template.Template template: Template to scan for.
+    :param dict partial_data: Token values that are already known, they are
+        bound into the Template before scanning, see `Template.bind`.
+    :return: Generator of (path, values) tuples sorted by path, `values` is
+        the result of `Template.parse_path`.
+    :rtype: Iterator[tuple[str,dict]]
+    """
+    search = template
+    known = {}
+    if partial_data:
+        search = template.bind(partial_data)
+        # The values `bind` folded in, looked up the same way.
+        for resolved_token in template._resolved_tokens:
+            raw_token = resolved_token.raw_token
+            if raw_token.name not in known:
+                value = template._partial_value(raw_token, partial_data)
+                if value is not None:
+                    known[raw_token.name] = value
+    levels = level_patterns(search)
+    last_level = len(levels) - 1
+
+    # Depth first over (prefix, level) so results come out in path order.
+    stack = [("", 0)]
+    while stack:
+        prefix, level = stack.pop()
+        pattern = levels[level]
+        if not hasattr(pattern, "match"):
+            path = _join(prefix, pattern, level)
+            if level < last_level:
+                stack.append((path, level + 1))
+            elif os.path.lexists(path):
+                values = _parse_path(search, path, known)
+                if values is not None:
+                    yield path, values
+            continue
+
+        try:
+            entries = sorted(_list_directory(_listing_directory(prefix, level)))
+        except OSError:
+            # A literal directory that does not exist prunes this branch.
+            continue
+        children = []
+        for name, is_directory in entries:
+            if pattern.match(name) is None:
+                continue
+            path = _join(prefix, name, level)
+            if level < last_level:
+                if is_directory:
+                    children.append((path, level + 1))
+                continue
+            values = _parse_path(search, path, known)
+            if values is not None:
+                yield path, values
+        stack.extend(reversed(children))
+
+
+def _version_key(version):
+    # Numeric versions sort by value so "v10" comes after "v9".
+    if version.isdigit():
+        return 0, int(version), version
+    return 1, 0, version
+
+
+def _slice_template(template, start, end):
+    # Returns the Template for template_str[start:end], which has to start and
+    #   end outside of any Token Expression.
+    resolved_tokens = []
+    for resolved_token in template._resolved_tokens:
+        if resolved_token.start >= start and resolved_token.end <= end:
+            resolved_tokens.append(
+                ResolvedToken(
+                    raw_token=resolved_token.raw_token,
+                    operators=resolved_token.operators,
+                    tok_start=resolved_token.start - start,
+                    tok_end=resolved_token.end - start,
+                    original_string=resolved_token.original_string,
+                )
+            )
+    return template.__class__(
+        template_str=template.text()[start:end], resolved_tokens=resolved_tokens
+    )
+
+
+def _split_version_level(template, version_token):
+    # Returns the Template of the directory holding the versions (None for
+    #   the current directory) and the Template of the version level itself.
+    resolved_tokens = sorted(template._resolved_tokens, key=lambda token: token.start)
+    start = None
+    for resolved_token in resolved_tokens:
+        if resolved_token.raw_token.name.lower() == version_token.lower():
+            start = resolved_token.start
+            break
+    if start is None:
+        raise TokenNotFoundError(
+            "Template {} does not use the Token {}".format(
+                template.text(), version_token
+            )
+        )
+
+    # Path separators in the literal text, the ones inside Token Expressions
+    #   (like in Operator arguments) do not split levels.
+    template_str = template.text()
+    separators = []
+    last_end = 0
+    for resolved_token in resolved_tokens + [None]:
+        literal_end = len(template_str)
+        if resolved_token is not None:
+            literal_end = resolved_token.start
+        index = template_str.find(PATH_SEPARATOR, last_end, literal_end)
+        while index != -1:
+            separators.append(index)
+            index = template_str.find(PATH_SEPARATOR, index + 1, literal_end)
+        if resolved_token is not None:
+            last_end = resolved_token.end
+
+    before = [index for index in separators if index < start]
+    after = [index for index in separators if index > start]
+    level_end = after[0] if after else len(template_str)
+    if not before:
+        return None, _slice_template(template, 0, level_end)
+    level_start = before[-1] + 1
+    return (
+        _slice_template(template, 0, before[-1]),
+        _slice_template(template, level_start, level_end),
+    )
+
+
+def find_versions(template, partial_data, version_token="version"):
+    """
+    find_versions will return every version of `version_token` that exists on
+        disk for `partial_data`.
+
+    Only the directory holding the path level of `version_token` is listed,
+        a single listing when `partial_data` binds every Token above that
+        level, and every name in it is reverse parsed against that level.
+
+    :param sept.template.Template template: Template to search with.
+    :param dict partial_data: Token values that are already known, like the
+        show, shot and step. A value for `version_token` is ignored.
+    :param str version_token: Name of the Token holding the version.
+    :return: The distinct versions as found in the paths, numeric versions are
+        sorted by their value.
+    :rtype: list[str]
+    :raises sept.errors.TokenNotFoundError: If `template` does not use
+        `version_token`.
+    """
+    levels = template._version_levels.get(version_token)
+    if levels is None:
+        levels = _split_version_level(template, version_token)
+        template._version_levels[version_token] = levels
+    directory_template, level_template = levels
+
+    partial_data = dict(
+        (key, value)
+        for key, value in (partial_data or {}).items()
+        if key.lower() != version_token.lower()
+    )
+    # The version level is usually the same for every record, reusing the
+    #   unbound Template keeps its compiled PathMatcher.
+    bound_level = level_template.bind(partial_data)
+    if bound_level.text() != level_template.text():
+        level_template = bound_level
+
+    if directory_template is None:
+        directories = ["."]
+    else:
+        bound_directory = directory_template.bind(partial_data)
+        if bound_directory._slots:
+            directories = [path for path, _ in scan_template(bound_directory)]
+        else:
+            directories = [bound_directory.text() or PATH_SEPARATOR]
+
+    versions = set()
+    for directory in directories:
+        try:
+            names = [name for name, _ in _list_directory(directory)]
+        except OSError:
+            continue
+        for name in names:
+            values = level_template.parse_path(name)
+            if values is None:
+                continue
+            version = values.get(version_token, values.get(version_token.lower()))
+            if version is not None:
+                versions.add(version)
+    return sorted(versions, key=_version_key)
+
+
+def find_latest_version(template, partial_data, version_token="version"):
+    """
+    find_latest_version will return the highest version of `version_token`
+        that exists on disk for `partial_data`, see `find_versions`.
+
+    :param sept.template.Template template: Template to search with.
+    :param dict partial_data: Token values that are already known.
+    :param str version_token: Name of the Token holding the version.
+    :return: The highest version or None if there are none.
+    :rtype: str|None
+    """
+    versions = find_versions(template, partial_data, version_token)
+    if versions:
+        return versions[-1]
+    return None
+
+
+def find_latest_versions(template, records, version_token="version", max_workers=None):
+    """
+    find_latest_versions will run `find_latest_version` for every record in
+        `records` on a pool of threads.
+
+    Listing directories mostly waits on the file system, so threads overlap
+        the lookups of many shots even though they share one interpreter.
+
+    :param sept.template.Template template: Template to search with.
+    :param Iterable[dict] records: Partial data to look up, like one record
+        per shot.
+    :param str version_token: Name of the Token holding the version.
+    :param int|None max_workers: Number of threads, see
+        `concurrent.futures.ThreadPoolExecutor`.
+    :return: The highest version (or None) of every record, in the same
+        order as `records`.
+    :rtype: list[str|None]
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def latest(partial_data):
+        return find_latest_version(template, partial_data, version_token)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(latest, records))
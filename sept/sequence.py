@@ -0,0 +1,237 @@
+from six.moves import range
+
+from sept.builtin.operators.pad import PadOperator
+from sept.errors import InvalidOperatorInputDataError, ParsingError, TokenNotFoundError
+
+PATTERN_PRINTF = "printf"
+PATTERN_HASH = "hash"
+PATTERN_STYLES = (PATTERN_PRINTF, PATTERN_HASH)
+
+
+def frame_range(start, end, step=1):
+    """
+    frame_range will return the frames from `start` to `end`, including
+        `end`, without building a list of them.
+
+    :param int start: First frame.
+    :param int end: Last frame, included when the step lands on it.
+    :param int step: Distance between two frames, negative to count down.
+    :rtype: six.moves.range
+    """
+    if step > 0:
+        return range(start, end + 1, step)
+    return range(start, end - 1, step)
+
+
+def _raise_invalid_data(resolved_token, err):
+    raise ParsingError(
+        location=resolved_token.start,
+        length=resolved_token.end - resolved_token.start,
+        message=str(err),
+    )
+
+
+def _slot_text(resolved_token, data):
+    # Same as a single slot of `Template.resolve`.
+    text = resolved_token.raw_token.getValue(data)
+    if text is None:
+        return resolved_token.original_string
+    try:
+        return resolved_token.apply(str(text))
+    except InvalidOperatorInputDataError as err:
+        _raise_invalid_data(resolved_token, err)
+
+
+def _frame_padding(resolved_token):
+    # Returns the padding count and character of a frame slot, (0, "") for a
+    #   slot without Operators and None for any other Operator chain.
+    operators = [
+        operator for operator in resolved_token.operators if not operator._private
+    ]
+    if not operators:
+        return 0, ""
+    if len(operators) == 1 and type(operators[0]) is PadOperator:
+        return operators[0]._padding_count, operators[0]._args[1]
+    return None
+
+
+def _escape_format(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _format_field(count, char):
+    # The same format spec `PadOperator` builds, applied to the frame.
+    if not count:
+        return "{0}"
+    return "{{0:{char}>{count}}}".format(char=char, count=count)
+
+
+class FrameSequence(object):
+    """
+    The FrameSequence class resolves a Template for many frames of the same
+        data.
+
+    Everything but the frame Token is resolved once. A frame slot with no
+        Operators or only `pad` is compiled into a single format string, so
+        each frame costs one `str.format` call, or a printf style `%` for
+        a range of positive frames. Any other Operator chain
+        still runs its Operators, but only for the frame slots.
+    The frame is used directly as the value of the frame Token.
+    """
+
+    def __init__(self, template, data, frames=None, frame_token="frame"):
+        """
+        :param sept.template.Template template: Template to resolve.
+        :param dict data: Data shared by every frame, a value for
+            `frame_token` is ignored.
+        :param Iterable[int] frames: Frames iterated over by default, see
+            `frame_range`. A generator is consumed by the first iteration and
+            has no length, use a sized collection to iterate again or to
+            call `len`.
+        :param str frame_token: Name of the Token holding the frame.
+        :raises sept.errors.TokenNotFoundError: If `template` does not use
+            `frame_token`.
+        """
+        super(FrameSequence, self).__init__()
+        self.template = template
+        self.frames = frames
+        self.frame_token = frame_token
+
+        data = dict(
+            (key, value)
+            for key, value in (data or {}).items()
+            if key.lower() != frame_token.lower()
+        )
+        bound = template.bind(data)
+        self._parts = list(bound._parts)
+        self._frame_slots = []
+        for index, resolved_token in bound._slots:
+            if resolved_token.raw_token.name.lower() == frame_token.lower():
+                self._frame_slots.append((index, resolved_token))
+            else:
+                # Tokens missing from `data` or that are not deterministic.
+                self._parts[index] = _slot_text(resolved_token, data)
+        if not self._frame_slots:
+            raise TokenNotFoundError(
+                "Template {} does not use the Token {}".format(
+                    template.text(), frame_token
+                )
+            )
+
+        self._paddings = [
+            _frame_padding(resolved_token) for _, resolved_token in self._frame_slots
+        ]
+        self._format = None
+        self._printf = None
+        if None not in self._paddings:
+            self._format = self._build_pattern(_escape_format, _format_field).format
+            if len(self._frame_slots) == 1 and self._is_printf():
+                # For frames that are not negative integers the printf pattern
+                #   gives the same text as `pad` and formats twice as fast.
+                self._printf = self.pattern(PATTERN_PRINTF)
+
+    def __iter__(self):
+        if self.frames is None:
+            raise ValueError("FrameSequence was created without frames")
+        return self.paths(self.frames)
+
+    def __len__(self):
+        if self.frames is None:
+            raise TypeError("FrameSequence was created without frames")
+        try:
+            return len(self.frames)
+        except TypeError:
+            raise TypeError(
+                "FrameSequence frames of type {} have no length, pass a sized "
+                "collection like `frame_range`".format(type(self.frames).__name__)
+            )
+
+    def _build_pattern(self, escape, frame_pattern):
+        parts = [escape(part) if part is not None else None for part in self._parts]
+        for (index, _), (count, char) in zip(self._frame_slots, self._paddings):
+            parts[index] = frame_pattern(count, char)
+        return "".join(parts)
+
+    def _is_printf(self):
+        # Only padding with "0" has a printf and a hash equivalent.
+        return all(
+            padding is not None and (padding[0] <= 1 or padding[1] == "0")
+            for padding in self._paddings
+        )
+
+    def path(self, frame):
+        """
+        path will return the path of a single frame, the same string as
+            `Template.resolve` with the frame added to the data.
+
+        :param int frame: Frame to resolve.
+        :rtype: str
+        """
+        if self._format is not None:
+            return self._format(frame)
+        parts = list(self._parts)
+        text = str(frame)
+        for index, resolved_token in self._frame_slots:
+            try:
+                parts[index] = resolved_token.apply(text)
+            except InvalidOperatorInputDataError as err:
+                _raise_invalid_data(resolved_token, err)
+        return "".join(parts)
+
+    def paths(self, frames=None):
+        """
+        paths will lazily resolve every frame in `frames`.
+
+        :param Iterable[int] frames: Frames to resolve, defaults to the frames
+            this FrameSequence was created with.
+        :return: Generator of paths in the order of `frames`.
+        :rtype: Iterator[str]
+        """
+        if frames is None:
+            frames = self.frames
+        if (
+            self._printf is not None
+            and isinstance(frames, range)
+            and (not frames or min(frames[0], frames[-1]) >= 0)
+        ):
+            printf = self._printf
+            for frame in frames:
+                yield printf % frame
+            return
+        if self._format is not None:
+            formatter = self._format
+            for frame in frames:
+                yield formatter(frame)
+            return
+        for frame in frames:
+            yield self.path(frame)
+
+    def pattern(self, style=PATTERN_PRINTF):
+        """
+        pattern will return a single path describing every frame, like
+            "shot.%04d.exr" or "shot.####.exr".
+
+        :param str style: `PATTERN_PRINTF` or `PATTERN_HASH`.
+        :rtype: str
+        :raises ValueError: If the frame slots can not be written in `style`,
+            like a frame padded with another character than "0".
+        """
+        if style not in PATTERN_STYLES:
+            raise ValueError(
+                "Unknown pattern style {style}, expected one of {styles}".format(
+                    style=style, styles=PATTERN_STYLES
+                )
+            )
+        if not self._is_printf():
+            raise ValueError(
+                "The frame slots of {} can not be written as a {} "
+                "pattern".format(self.template.text(), style)
+            )
+        if style == PATTERN_PRINTF:
+            return self._build_pattern(
+                lambda text: text.replace("%", "%%"),
+                lambda count, char: "%0{}d".format(count) if count > 1 else "%d",
+            )
+        return self._build_pattern(
+            lambda text: text, lambda count, char: "#" * max(count, 1)
+        )
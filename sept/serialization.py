@@ -0,0 +1,226 @@
+import errno
+import hashlib
+import json
+import os
+import tempfile
+
+from sept.errors import SeptError
+from sept.template import Template
+from sept.token import ResolvedToken
+
+# Bumped whenever the layout written by `dump_template` changes.
+FORMAT_VERSION = 1
+# Hash of the sept sources, see `compiler_version`.
+_compiler_version = None
+
+
+def compiler_version():
+    """
+    compiler_version will return a hash of every Python source file of the
+        sept package, computed once per process.
+
+    Any change to the parser or a builtin Operator, including installing
+        another sept version, changes the hash. The sources are read instead
+        of importing `sept._version`, which can run git.
+
+    :rtype: str
+    """
+    global _compiler_version
+    if _compiler_version is None:
+        digest = hashlib.sha256()
+        package = os.path.dirname(os.path.abspath(__file__))
+        for root, directories, file_names in os.walk(package):
+            directories.sort()
+            for file_name in sorted(file_names):
+                if not file_name.endswith(".py"):
+                    continue
+                path = os.path.join(root, file_name)
+                digest.update(os.path.relpath(path, package).encode("utf-8"))
+                with open(path, "rb") as handle:
+                    digest.update(handle.read())
+        _compiler_version = digest.hexdigest()
+    return _compiler_version
+
+
+def dump_template(template):
+    """
+    dump_template will convert a compiled Template into plain data that can
+        be written as JSON.
+
+    Tokens and Operators are stored by the name they are registered under,
+        `load_template` looks them up again so nothing has to be parsed.
+
+    :param sept.template.Template template: Template to serialize.
+    :return: JSON compatible dictionary.
+    :rtype: dict
+    """
+    from sept.builtin.tokens.default import DefaultFallbackToken
+
+    tokens = []
+    for resolved_token in template._resolved_tokens:
+        raw_token = resolved_token.raw_token
+        token = {
+            "start": resolved_token.start,
+            "end": resolved_token.end,
+            "original": resolved_token.original_string,
+            "operators": [
+                [
+                    operator.name,
+                    None if operator._args is None else list(operator._args),
+                ]
+                for operator in resolved_token.operators
+            ],
+        }
+        if isinstance(raw_token, DefaultFallbackToken):
+            token["fallback"] = raw_token.name
+        else:
+            token["token"] = raw_token.name.lower()
+        tokens.append(token)
+    return {
+        "format": FORMAT_VERSION,
+        "template": template.text(),
+        "tokens": tokens,
+    }
+
+
+def load_template(payload, tmanager, omanager):
+    """
+    load_template will rebuild a Template written by `dump_template`, looking
+        up its Tokens and Operators in `tmanager` and `omanager`.
+
+    :param dict payload: Data returned by `dump_template`.
+    :param sept.token_manager.TokenManager tmanager: Registered Tokens.
+    :param sept.operator_manager.OperatorManager omanager: Registered
+        Operators.
+    :rtype: sept.template.Template
+    :raises ValueError: If `payload` was written in another format.
+    """
+    from sept.builtin.tokens.default import default_fallback_token
+
+    if payload.get("format") != FORMAT_VERSION:
+        raise ValueError(
+            "Unsupported compiled template format {}".format(payload.get("format"))
+        )
+    resolved_tokens = []
+    for token in payload["tokens"]:
+        if "fallback" in token:
+            raw_token = default_fallback_token(token["fallback"])
+        else:
+            raw_token = tmanager.getToken(token["token"])
+        resolved_tokens.append(
+            ResolvedToken(
+                raw_token=raw_token,
+                operators=[
+                    omanager.getOperator(name, args=args)
+                    for name, args in token["operators"]
+                ],
+                tok_start=token["start"],
+                tok_end=token["end"],
+                original_string=token["original"],
+            )
+        )
+    return Template(template_str=payload["template"], resolved_tokens=resolved_tokens)
+
+
+def template_key(template_str, tmanager, omanager, **options):
+    """
+    template_key will return a content hash identifying how `template_str`
+        compiles.
+
+    The hash covers the template string, the compile `options`, the name and
+        class of every registered Token and Operator, the serialized format
+        and `compiler_version`, so a change to any of them gives a new key.
+
+    :param str template_str: Template string that is compiled.
+    :param sept.token_manager.TokenManager tmanager: Registered Tokens.
+    :param sept.operator_manager.OperatorManager omanager: Registered
+        Operators.
+    :param options: Anything else that changes the compiled Template.
+    :rtype: str
+    """
+    content = json.dumps(
+        [
+            template_str,
+            sorted(options.items()),
+            tmanager.fingerprint(),
+            omanager.fingerprint(),
+            FORMAT_VERSION,
+            compiler_version(),
+        ]
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class TemplateDiskCache(object):
+    """
+    The TemplateDiskCache class stores compiled Templates as JSON files in a
+        directory, so a new process can load them instead of compiling.
+
+    Entries are written atomically and keyed by `template_key`, stale entries
+        are never read again and unreadable entries are treated as missing.
+    """
+
+    def __init__(self, directory):
+        """
+        :param str directory: Directory to keep the compiled Templates in, it
+            is created when the first Template is stored.
+        """
+        super(TemplateDiskCache, self).__init__()
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, "{}.json".format(key))
+
+    def get(self, key, tmanager, omanager):
+        """
+        get will load the Template stored for `key`.
+
+        :param str key: Key returned by `template_key`.
+        :param sept.token_manager.TokenManager tmanager: Registered Tokens.
+        :param sept.operator_manager.OperatorManager omanager: Registered
+            Operators.
+        :return: The Template or None if it is not cached or unreadable.
+        :rtype: sept.template.Template|None
+        """
+        try:
+            with open(self._path(key), "r") as handle:
+                payload = json.load(handle)
+            return load_template(payload, tmanager, omanager)
+        except (IOError, OSError, ValueError, KeyError, TypeError, SeptError):
+            return None
+
+    def put(self, key, template):
+        """
+        put will store `template` under `key`.
+
+        A directory that can not be written to, like a read only shared
+            cache, or a Template that can not be serialized is not an error,
+            the Template is just not stored.
+
+        :param str key: Key returned by `template_key`.
+        :param sept.template.Template template: Template to store.
+        :return: `template`
+        :rtype: sept.template.Template
+        """
+        try:
+            os.makedirs(self.directory)
+        except OSError as err:
+            if err.errno != errno.EEXIST:
+                return template
+        try:
+            handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except (IOError, OSError):
+            return template
+        try:
+            with os.fdopen(handle, "w") as temp_file:
+                json.dump(dump_template(template), temp_file)
+            # Readers never see a partially written entry.
+            getattr(os, "replace", os.rename)(temp_path, self._path(key))
+        except (IOError, OSError, TypeError, ValueError):
+            # Whatever failed, like state that is not JSON serializable, the
+            #   Template is just not stored and no temporary file is left.
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return template
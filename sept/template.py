@@ -1,16 +1,32 @@
-from sept.template_tokenizer import Tokenizer
-from sept.balancer import ParenthesisBalancer
+import itertools
+import re
+
+from sept.template_tokenizer import get_tokenizer
+from sept.token import ResolvedToken, collect_dependencies
+from sept.balancer import ParenthesisBalancer, DEFAULT_MAX_DEPTH, DEFAULT_MAX_LENGTH
 from sept.errors import (
     SeptError,
     ParsingError,
     MultipleBalancingError,
     OperatorNotFoundError,
+    InvalidOperatorArgumentsError,
     TokenNotFoundError,
     InvalidOperatorInputDataError,
 )
 
+ENGINE_PYPARSING = "pyparsing"
+ENGINE_SCANNER = "scanner"
+ENGINES = (ENGINE_PYPARSING, ENGINE_SCANNER)
+
+ON_ERROR_RAISE = "raise"
+ON_ERROR_SKIP = "skip"
+ON_ERROR_YIELD = "yield"
+ON_ERROR_POLICIES = (ON_ERROR_RAISE, ON_ERROR_SKIP, ON_ERROR_YIELD)
+
 
 class _RawTokenExpression(object):
+    __slots__ = ("text", "offset")
+
     def __init__(self, text, offset):
         super(_RawTokenExpression, self).__init__()
         self.text = text
@@ -24,10 +40,32 @@ class _RawTokenExpression(object):
 
 
 class Template(object):
-    def __init__(self):
+    def __init__(self, template_str="", resolved_tokens=None):
         super(Template, self).__init__()
-        self._template_str = ""
-        self._resolved_tokens = []
+        self._template_str = template_str
+        self._resolved_tokens = list(resolved_tokens or [])
+        self._compact_resolved_tokens(self._resolved_tokens)
+        # Compiled representation used by `resolve`.
+        #   `_parts` holds the literal text of the template with a `None`
+        #   placeholder for every token and `_slots` maps each placeholder
+        #   index to the ResolvedToken that fills it.
+        self._parts, self._slots = self._compile_segments(
+            self._template_str, self._resolved_tokens
+        )
+        self._functions = {}
+        self._path_matcher = None
+        # Directory and version level Templates by version Token name, see
+        #   `find_versions`.
+        self._version_levels = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Generated functions can not be pickled, they and the other derived
+        #   matchers are rebuilt on demand.
+        state["_functions"] = {}
+        state["_path_matcher"] = None
+        state["_version_levels"] = {}
+        return state
 
     def __str__(self):
         return "<{klass} {path}>".format(
@@ -47,10 +85,10 @@ class Template(object):
         if match.Operator:
             args = None
             if match.Args:
-                args = match.Args
+                args = list(match.Args)
             try:
                 _Operator = omanager.getOperator(match.Operator, args=args)
-            except OperatorNotFoundError as err:
+            except (OperatorNotFoundError, InvalidOperatorArgumentsError) as err:
                 raise ParsingError(
                     location=match.start + offset,
                     length=match.end - match.start,
@@ -101,8 +139,12 @@ class Template(object):
         return resolved_token
 
     @classmethod
-    def _balance_template_str(cls, template_str):
-        expression_locations, errors = ParenthesisBalancer.parse_string(template_str)
+    def _balance_template_str(
+        cls, template_str, max_depth=DEFAULT_MAX_DEPTH, max_length=DEFAULT_MAX_LENGTH
+    ):
+        expression_locations, errors = ParenthesisBalancer.parse_string(
+            template_str, max_depth=max_depth, max_length=max_length
+        )
         expressions = []
         for start_index, end_index in expression_locations:
             try:
@@ -121,61 +163,506 @@ class Template(object):
     def sanitize_template_str(cls, template_str):
         return template_str.replace(" ", "")
 
+    @classmethod
+    def _tokenize_template_str(
+        cls, template_str, max_depth=DEFAULT_MAX_DEPTH, max_length=DEFAULT_MAX_LENGTH
+    ):
+        template_expressions = cls._balance_template_str(
+            template_str, max_depth=max_depth, max_length=max_length
+        )
+        tokenizer = get_tokenizer()
+        expressions = []
+        for template_expression in template_expressions:
+            sanitized_expr = cls.sanitize_template_str(str(template_expression))
+            matches = [
+                results.match for results, _, _ in tokenizer.scanString(sanitized_expr)
+            ]
+            expressions.append(
+                (
+                    template_expression.offset,
+                    len(template_expression),
+                    sanitized_expr,
+                    matches,
+                )
+            )
+        return expressions
+
     @classmethod
     def from_template_str(
-        cls, template_str, tmanager, omanager, default_fallback=False
+        cls,
+        template_str,
+        tmanager,
+        omanager,
+        default_fallback=False,
+        engine=ENGINE_PYPARSING,
+        max_depth=DEFAULT_MAX_DEPTH,
+        max_length=DEFAULT_MAX_LENGTH,
     ):
-        matches = []
+        if engine == ENGINE_PYPARSING:
+            template_expressions = cls._tokenize_template_str(
+                template_str, max_depth=max_depth, max_length=max_length
+            )
+        elif engine == ENGINE_SCANNER:
+            from sept.template_scanner import TemplateScanner
+
+            template_expressions = TemplateScanner.scan_string(
+                template_str, max_depth=max_depth, max_length=max_length
+            )
+        else:
+            raise ValueError(
+                "Unknown template engine {engine}, expected one of {engines}".format(
+                    engine=engine, engines=ENGINES
+                )
+            )
 
-        template_expressions = cls._balance_template_str(template_str)
+        matches = []
         sanitized_template_str = ""
         sanitized_offset = 0
 
         last_template_expr_end = 0
-        for template_expression in template_expressions:
-            sanitized_template_str += template_str[
-                last_template_expr_end : template_expression.offset
-            ]
-            last_template_expr_end = template_expression.offset + len(
-                template_expression.text
-            )
+        for offset, length, sanitized_expr, expr_matches in template_expressions:
+            sanitized_template_str += template_str[last_template_expr_end:offset]
+            last_template_expr_end = offset + length
 
-            sanitized_expr = cls.sanitize_template_str(str(template_expression))
             sanitized_template_str += sanitized_expr
-            for results, tok_start, tok_end in Tokenizer.scanString(sanitized_expr):
-                match = results.match
+            for match in expr_matches:
                 resolved_token = cls._gather_match(
                     match=match,
                     tmanager=tmanager,
                     omanager=omanager,
-                    offset=template_expression.offset + sanitized_offset,
+                    offset=offset + sanitized_offset,
                     default_fallback=default_fallback,
                 )
                 matches.append(resolved_token)
-            sanitized_offset += len(sanitized_expr) - len(template_expression)
+            sanitized_offset += len(sanitized_expr) - length
 
         sanitized_template_str += template_str[last_template_expr_end:]
-        T = Template()
-        T._template_str = sanitized_template_str
-        T._resolved_tokens = matches
-        return T
-
-    def resolve(self, data):
-        offset = 0
-        result_str = self._template_str
-        for resolved_token in self._resolved_tokens:
-            start = resolved_token.start
-            end = resolved_token.end
-            before, target, after = (
-                result_str[: start + offset],
-                result_str[start + offset : end + offset],
-                result_str[end + offset :],
+        return cls(template_str=sanitized_template_str, resolved_tokens=matches)
+
+    @staticmethod
+    def _compact_resolved_tokens(resolved_tokens):
+        # Nested Token Expressions are only built up while parsing, once the
+        #   Template exists the Operator chains are frozen and repeated
+        #   expressions share a single copy of their original text.
+        originals = {}
+        for resolved_token in resolved_tokens:
+            resolved_token.operators = tuple(resolved_token.operators)
+            resolved_token.original_string = originals.setdefault(
+                resolved_token.original_string, resolved_token.original_string
             )
+
+    @staticmethod
+    def _compile_segments(template_str, resolved_tokens):
+        parts = []
+        slots = []
+        last_end = 0
+        for resolved_token in resolved_tokens:
+            literal = template_str[last_end : resolved_token.start]
+            if literal:
+                parts.append(literal)
+            slots.append((len(parts), resolved_token))
+            parts.append(None)
+            last_end = resolved_token.end
+        literal = template_str[last_end:]
+        if literal:
+            parts.append(literal)
+        return tuple(parts), tuple(slots)
+
+    def compile_function(self, trusted=False):
+        """
+        compile_function will return a Python function generated specifically
+            for this Template.
+
+        Calling the function with a data dictionary gives the same result as
+            `Template.resolve` but with the literal text, the `getValue` calls
+            and the Operator calls written out inline, which makes it the
+            cheapest way to resolve the same Template many times.
+        The function is generated once and cached on the Template.
+
+        :param bool trusted: Leave out the `is_invalid` calls that are proven
+            unnecessary when the Template is compiled, see `resolve`.
+        :return: Function taking the data to resolve against.
+        :rtype: callable
+        """
+        trusted = bool(trusted)
+        if trusted not in self._functions:
+            from sept.codegen import compile_resolver
+
+            self._functions[trusted] = compile_resolver(self, trusted=trusted)
+        return self._functions[trusted]
+
+    def required_tokens(self):
+        """
+        required_tokens will return every Token this Template reads, so the
+            data for it can be fetched up front.
+
+        :return: One `sept.token.TokenDependency` (name, path, chains) per
+            Token, in the order they first appear in the Template.
+        :rtype: tuple[sept.token.TokenDependency]
+        """
+        return collect_dependencies(self._resolved_tokens)
+
+    def parse_path(self, path):
+        """
+        parse_path is the inverse of `resolve`, it will extract the Token
+            values from a path that was resolved from this Template.
+
+        The Template is compiled once into a `sept.path_matcher.PathMatcher`
+            that is cached on the Template.
+        Token values are returned as the text found in `path`, Tokens that
+            only appear behind Operators that can not be inverted (like
+            `substr`) have to match but are not returned.
+
+        :param str path: Path to extract the Token values from.
+        :return: A dictionary of Token name to value, or None if `path` does
+            not match this Template.
+        :rtype: dict|None
+        """
+        if self._path_matcher is None:
+            from sept.path_matcher import PathMatcher
+
+            self._path_matcher = PathMatcher(self)
+        return self._path_matcher.match(path)
+
+    def to_glob(self, partial_data=None):
+        """
+        to_glob will return a glob pattern matching every path this Template
+            could resolve to.
+
+        Every remaining Token slot becomes a `*` and the literal text is
+            escaped, so the pattern can be passed to `glob.glob` or
+            `fnmatch`.
+
+        :param dict partial_data: Token values that are already known, they
+            are bound into the pattern, see `bind`.
+        :rtype: str
+        """
+        template = self.bind(partial_data) if partial_data else self
+        slot_indexes = set(index for index, _ in template._slots)
+        pattern = []
+        for index, part in enumerate(template._parts):
+            if index in slot_indexes:
+                if not pattern or pattern[-1] != "*":
+                    pattern.append("*")
+            elif part:
+                pattern.append(re.sub(r"([*?[])", r"[\1]", part))
+        return "".join(pattern)
+
+    def level_matchers(self, partial_data=None):
+        """
+        level_matchers will split this Template into one matcher per path
+            level, see `sept.path_matcher.level_patterns`.
+
+        :param dict partial_data: Token values that are already known, see
+            `bind`.
+        :return: The literal text of fully literal levels and a compiled
+            regular expression for every other level.
+        :rtype: list[str|re.Pattern]
+        """
+        from sept.path_matcher import level_patterns
+
+        return level_patterns(self.bind(partial_data) if partial_data else self)
+
+    def scan(self, partial_data=None):
+        """
+        scan will find the existing paths this Template could have resolved
+            to, only listing the directories that can still match.
+
+        See `sept.path_scanner.scan_template`.
+
+        :param dict partial_data: Token values that are already known, see
+            `bind`.
+        :return: Generator of (path, values) tuples sorted by path.
+        :rtype: Iterator[tuple[str,dict]]
+        """
+        from sept.path_scanner import scan_template
+
+        return scan_template(self, partial_data)
+
+    def find_versions(self, partial_data, version_token="version"):
+        """
+        find_versions will return every version of `version_token` that
+            exists on disk for `partial_data`, lowest first.
+
+        See `sept.path_scanner.find_versions`.
+
+        :param dict partial_data: Token values that are already known, like
+            the show, shot and step.
+        :param str version_token: Name of the Token holding the version.
+        :rtype: list[str]
+        """
+        from sept.path_scanner import find_versions
+
+        return find_versions(self, partial_data, version_token)
+
+    def find_latest_version(self, partial_data, version_token="version"):
+        """
+        find_latest_version will return the highest version of
+            `version_token` that exists on disk for `partial_data`.
+
+        :param dict partial_data: Token values that are already known.
+        :param str version_token: Name of the Token holding the version.
+        :return: The highest version or None if there are none.
+        :rtype: str|None
+        """
+        from sept.path_scanner import find_latest_version
+
+        return find_latest_version(self, partial_data, version_token)
+
+    def find_latest_versions(self, records, version_token="version", max_workers=None):
+        """
+        find_latest_versions will look up the highest version for every
+            record in `records` on a pool of threads.
+
+        See `sept.path_scanner.find_latest_versions`.
+
+        :param Iterable[dict] records: Partial data to look up, like one
+            record per shot.
+        :param str version_token: Name of the Token holding the version.
+        :param int|None max_workers: Number of threads.
+        :return: The highest version (or None) of every record, in order.
+        :rtype: list[str|None]
+        """
+        from sept.path_scanner import find_latest_versions
+
+        return find_latest_versions(self, records, version_token, max_workers)
+
+    def sequence(self, data, frames=None, frame_token="frame"):
+        """
+        sequence will resolve this Template once for `data` and return a
+            FrameSequence that only fills in the frame for every path.
+
+        See `sept.sequence.FrameSequence`.
+
+        :param dict data: Data shared by every frame.
+        :param Iterable[int] frames: Frames to iterate over, see
+            `sept.sequence.frame_range`.
+        :param str frame_token: Name of the Token holding the frame.
+        :rtype: sept.sequence.FrameSequence
+        """
+        from sept.sequence import FrameSequence
+
+        return FrameSequence(self, data, frames=frames, frame_token=frame_token)
+
+    def resolve(self, data, trusted=False):
+        """
+        resolve will build the final string from this Template and `data`.
+
+        In the default checked mode every Operator validates its input with
+            `is_invalid` before it runs.
+        In trusted mode the Operators whose input type is proven to be valid
+            when the Template is compiled (see `Operator.output_type`) are not
+            validated, only Operators with an unknown input type still are.
+
+        :param dict data: Data to resolve against.
+        :param bool trusted: Skip the validation that is proven unnecessary.
+        :return: The resolved string.
+        :rtype: str
+        """
+        parts = list(self._parts)
+        # Text value of every deterministic raw Token, by id, so each one is
+        #   only evaluated once for this data.
+        values = {}
+        for index, resolved_token in self._slots:
+            raw_token = resolved_token.raw_token
+            key = id(raw_token)
+            if key in values:
+                text = values[key]
+            else:
+                text = raw_token.getValue(data)
+                if text is not None:
+                    text = str(text)
+                if raw_token.deterministic:
+                    values[key] = text
+
+            if text is None:
+                parts[index] = resolved_token.original_string
+                continue
             try:
-                transformed = resolved_token.execute(data)
+                if trusted:
+                    parts[index] = resolved_token.apply_trusted(text)
+                else:
+                    parts[index] = resolved_token.apply(text)
             except InvalidOperatorInputDataError as err:
-                raise ParsingError(location=start, length=end - start, message=str(err))
-            result_str = before + transformed + after
-            offset += len(transformed) - len(target)
+                raise ParsingError(
+                    location=resolved_token.start,
+                    length=resolved_token.end - resolved_token.start,
+                    message=str(err),
+                )
+        return "".join(parts)
+
+    def bind(self, partial_data):
+        """
+        bind will return a new Template with every Token that can be resolved
+            from `partial_data` folded into the literal text.
 
-        return result_str
+        Only the Tokens missing from `partial_data` remain as slots, so
+            resolving the returned Template only does the work for the values
+            that still vary. Tokens that are not deterministic are never
+            folded.
+
+        :param dict partial_data: Data known up front, like the show and shot.
+        :return: A new Template, this Template is left unchanged.
+        :rtype: Template
+        """
+        template_str = []
+        resolved_tokens = []
+        length = 0
+        last_end = 0
+        values = {}
+        for resolved_token in self._resolved_tokens:
+            literal = self._template_str[last_end : resolved_token.start]
+            expression = self._template_str[resolved_token.start : resolved_token.end]
+            last_end = resolved_token.end
+            text = self._bind_token(resolved_token, partial_data, values)
+            if text is None:
+                start = length + len(literal)
+                resolved_tokens.append(
+                    ResolvedToken(
+                        raw_token=resolved_token.raw_token,
+                        operators=resolved_token.operators,
+                        tok_start=start,
+                        tok_end=start + len(expression),
+                        original_string=resolved_token.original_string,
+                    )
+                )
+                text = expression
+            template_str.append(literal)
+            template_str.append(text)
+            length += len(literal) + len(text)
+        template_str.append(self._template_str[last_end:])
+        return self.__class__(
+            template_str="".join(template_str), resolved_tokens=resolved_tokens
+        )
+
+    @staticmethod
+    def _partial_value(raw_token, partial_data):
+        # Text value of `raw_token` for `partial_data`, None if it can not be
+        #   known up front.
+        if not raw_token.deterministic:
+            return None
+        try:
+            value = raw_token.getValue(partial_data)
+        except (KeyError, IndexError, AttributeError, TypeError):
+            # Custom Tokens may expect keys that are only in the full data.
+            value = None
+        return None if value is None else str(value)
+
+    @classmethod
+    def _bind_token(cls, resolved_token, partial_data, values):
+        raw_token = resolved_token.raw_token
+        if not raw_token.deterministic:
+            return None
+        key = id(raw_token)
+        if key not in values:
+            values[key] = cls._partial_value(raw_token, partial_data)
+        if values[key] is None:
+            return None
+        try:
+            return resolved_token.apply(values[key])
+        except InvalidOperatorInputDataError as err:
+            raise ParsingError(
+                location=resolved_token.start,
+                length=resolved_token.end - resolved_token.start,
+                message=str(err),
+            )
+
+    def resolve_many(
+        self, records, chunk_size=None, on_error=ON_ERROR_RAISE, trusted=False
+    ):
+        """
+        resolve_many will lazily resolve every data dictionary in `records`.
+
+        The Template is compiled once with `compile_function` and the
+            records are pulled from the iterable as the results are consumed,
+            so arbitrarily large streams resolve in constant memory.
+
+        :param Iterable[dict] records: Data to resolve against, one per result.
+        :param int|None chunk_size: If set, records are pulled and resolved
+            `chunk_size` at a time before their results are yielded.
+        :param str on_error: What to do when a record raises a SeptError.
+            "raise" re-raises it, "skip" drops the record and "yield" yields
+            the error in place of the resolved string.
+        :param bool trusted: Resolve in trusted mode, see `resolve`.
+        :return: Generator of resolved strings (and errors if requested).
+        :rtype: Iterator[str|sept.errors.SeptError]
+        """
+        if on_error not in ON_ERROR_POLICIES:
+            raise ValueError(
+                "Unknown on_error policy {policy}, expected one of {policies}".format(
+                    policy=on_error, policies=ON_ERROR_POLICIES
+                )
+            )
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive number")
+        resolve = self.compile_function(trusted=trusted)
+        return self._resolve_many(resolve, iter(records), chunk_size, on_error)
+
+    def _resolve_many(self, resolve, records, chunk_size, on_error):
+        if chunk_size is None:
+            for result in self._resolve_chunk(resolve, records, on_error):
+                yield result
+            return
+
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return
+            if on_error == ON_ERROR_RAISE:
+                results = [resolve(record) for record in chunk]
+            else:
+                results = list(self._resolve_chunk(resolve, chunk, on_error))
+            for result in results:
+                yield result
+
+    @staticmethod
+    def _resolve_chunk(resolve, records, on_error):
+        if on_error == ON_ERROR_RAISE:
+            for record in records:
+                yield resolve(record)
+            return
+
+        for record in records:
+            try:
+                result = resolve(record)
+            except SeptError as err:
+                if on_error == ON_ERROR_YIELD:
+                    yield err
+                continue
+            yield result
+
+    def resolve_parallel(
+        self,
+        records,
+        chunk_size=None,
+        max_workers=None,
+        on_error=ON_ERROR_RAISE,
+        trusted=False,
+    ):
+        """
+        resolve_parallel will resolve `records` using a pool of worker
+            processes, yielding the results in the same order as `records`.
+
+        See `sept.parallel.resolve_parallel` for the details.
+
+        :param Iterable[dict] records: Data to resolve against, one per result.
+        :param int|None chunk_size: Number of records sent to a worker at a
+            time, `sept.parallel.DEFAULT_CHUNK_SIZE` if not given.
+        :param int|None max_workers: Number of worker processes.
+        :param str on_error: See `resolve_many`.
+        :param bool trusted: Resolve in trusted mode, see `resolve`.
+        :return: Generator of resolved strings (and errors if requested).
+        :rtype: Iterator[str|sept.errors.SeptError]
+        """
+        from sept.parallel import resolve_parallel, DEFAULT_CHUNK_SIZE
+
+        if chunk_size is None:
+            chunk_size = DEFAULT_CHUNK_SIZE
+        return resolve_parallel(
+            self,
+            records,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            on_error=on_error,
+            trusted=trusted,
+        )
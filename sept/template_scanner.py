@@ -0,0 +1,239 @@
+import re
+import string
+
+from sept.balancer import ParenthesisBalancer, DEFAULT_MAX_DEPTH, DEFAULT_MAX_LENGTH
+from sept.errors import MultipleBalancingError
+from sept.template_tokenizer import Node
+
+_WHITESPACE = frozenset(" \t\n\r")
+_ALPHANUMS = frozenset(string.ascii_letters + string.digits)
+_PRINTABLES = frozenset(c for c in string.printable if c not in string.whitespace)
+_ARG_START_CHARS = _PRINTABLES - frozenset("[],")
+_ARG_BODY_CHARS = frozenset("\\") | _ALPHANUMS
+_TOKEN_CHARS = _PRINTABLES - frozenset("{}[]:")
+
+_BRACE_RUN_REGEX = re.compile(r"\{+|\}+")
+
+
+class TemplateScanner(object):
+    """
+    The TemplateScanner class is a hand written alternative to running the
+        `ParenthesisBalancer` followed by the pyparsing `Tokenizer`.
+
+    It walks the template string once, pairing "{{" and "}}" with the exact
+        same rules as the `ParenthesisBalancer` and parses every root level
+        "Token Expression" as soon as it is closed.
+    The `Node` objects it produces mirror what the pyparsing `Tokenizer` parse
+        action builds, so both engines bind to identical `ResolvedToken`
+        chains.
+
+    Malformed templates are handed to the `ParenthesisBalancer` so that the
+        raised errors are identical to the pyparsing engine.
+    """
+
+    def __init__(
+        self, template_str, max_depth=DEFAULT_MAX_DEPTH, max_length=DEFAULT_MAX_LENGTH
+    ):
+        super(TemplateScanner, self).__init__()
+        self.template_str = template_str
+        self.max_depth = max_depth
+        self.max_length = max_length
+
+    def execute(self):
+        """
+        execute the template scanning.
+
+        :return: A list of (offset, length, sanitized_expression, matches)
+            tuples, one for every root level "Token Expression".
+        :rtype: list[tuple[int,int,str,list[Node]]]
+        :raises sept.errors.MultipleBalancingError: If the template is not
+            balanced.
+        """
+        template_str = self.template_str
+        if self.max_length is not None and len(template_str) > self.max_length:
+            self._raise_balancing_errors()
+        max_depth = self.max_depth
+        expressions = []
+        open_locations = []
+        for run in _BRACE_RUN_REGEX.finditer(template_str):
+            run_start, run_end = run.span()
+            if template_str[run_start] == "{":
+                # Every other character of a run of "{" opens a group, the
+                #   same way the ParenthesisBalancer pairs them.
+                for index in range(run_start, run_end - 1, 2):
+                    if max_depth is not None and len(open_locations) >= max_depth:
+                        self._raise_balancing_errors()
+                    open_locations.append(index)
+                continue
+
+            for index in range(run_start, run_end - 1, 2):
+                if not open_locations:
+                    self._raise_balancing_errors()
+                opener = open_locations.pop()
+                if not open_locations:
+                    expressions.append(self._scan_expression(opener, index + 1))
+        if open_locations:
+            self._raise_balancing_errors()
+        return expressions
+
+    def _raise_balancing_errors(self):
+        _, errors = ParenthesisBalancer.parse_string(
+            self.template_str, max_depth=self.max_depth, max_length=self.max_length
+        )
+        raise MultipleBalancingError(errors)
+
+    def _scan_expression(self, start_index, end_index):
+        text = self.template_str[start_index : end_index + 1]
+        sanitized = text.replace(" ", "")
+        matches = []
+        memo = {}
+        position = sanitized.find("{{")
+        while position != -1:
+            result = self._parse_token(sanitized, position, memo)
+            if result is None:
+                position = sanitized.find("{{", position + 1)
+                continue
+            node, position = result
+            matches.append(node)
+            position = sanitized.find("{{", position)
+        return start_index, len(text), sanitized, matches
+
+    @staticmethod
+    def _skip_whitespace(expr, position):
+        length = len(expr)
+        while position < length and expr[position] in _WHITESPACE:
+            position += 1
+        return position
+
+    @classmethod
+    def _parse_word(cls, expr, position, start_chars, body_chars):
+        position = cls._skip_whitespace(expr, position)
+        length = len(expr)
+        if position >= length or expr[position] not in start_chars:
+            return None, position
+        end = position + 1
+        while end < length and expr[end] in body_chars:
+            end += 1
+        return expr[position:end], end
+
+    @classmethod
+    def _parse_token(cls, expr, position, memo):
+        # Results are memoized per position so nested failures are never
+        #   parsed twice, keeping the scan linear.
+        if position not in memo:
+            memo[position] = cls._parse_token_uncached(expr, position, memo)
+        return memo[position]
+
+    @classmethod
+    def _parse_token_uncached(cls, expr, position, memo):
+        start = cls._skip_whitespace(expr, position)
+        if not expr.startswith("{{", start):
+            return None
+        length = 2
+        position = start + 2
+
+        operator_name = None
+        operator_args = None
+        operator = cls._parse_operator(expr, position)
+        if operator is not None:
+            operator_name, operator_args, operator_length, position = operator
+            length += operator_length
+
+        token_name = None
+        child = cls._parse_token(expr, position, memo)
+        if child is not None:
+            child, position = child
+            length += child.length
+        else:
+            token_name, position = cls._parse_word(
+                expr, position, _TOKEN_CHARS, _TOKEN_CHARS
+            )
+            if token_name is None:
+                return None
+            length += len(token_name)
+
+        position = cls._skip_whitespace(expr, position)
+        if not expr.startswith("}}", position):
+            return None
+        length += 2
+        if operator_args:
+            # Matches the Tokenizer parse action which adds n-1 length to
+            #   handle the commas.
+            length += len(operator_args) - 1
+
+        node = Node(
+            child=child,
+            Operator=operator_name,
+            Args=operator_args,
+            Token=token_name,
+            length=length,
+            tok_start=start,
+            tok_str=expr[start : start + length],
+        )
+        return node, position + 2
+
+    @classmethod
+    def _parse_operator(cls, expr, position):
+        name, position = cls._parse_word(expr, position, _ALPHANUMS, _ALPHANUMS)
+        if name is None:
+            return None
+        length = len(name)
+
+        args = None
+        arg_group = cls._parse_operator_args(expr, position)
+        if arg_group is not None:
+            args, args_length, position = arg_group
+            length += args_length
+
+        position = cls._skip_whitespace(expr, position)
+        if not expr.startswith(":", position):
+            return None
+        return name, args, length + 1, position + 1
+
+    @classmethod
+    def _parse_operator_args(cls, expr, position):
+        position = cls._skip_whitespace(expr, position)
+        if not expr.startswith("[", position):
+            return None
+        position += 1
+        length = 2
+        args = []
+        while True:
+            arg, position = cls._parse_word(
+                expr, position, _ARG_START_CHARS, _ARG_BODY_CHARS
+            )
+            if arg is None:
+                return None
+            while arg is not None:
+                args.append(arg)
+                length += len(arg)
+                arg, next_position = cls._parse_word(
+                    expr, position, _ARG_START_CHARS, _ARG_BODY_CHARS
+                )
+                if arg is not None:
+                    position = next_position
+
+            position = cls._skip_whitespace(expr, position)
+            if not expr.startswith(",", position):
+                break
+            position += 1
+
+        if not expr.startswith("]", position):
+            return None
+        return args, length, position + 1
+
+    @classmethod
+    def scan_string(
+        cls, template_str, max_depth=DEFAULT_MAX_DEPTH, max_length=DEFAULT_MAX_LENGTH
+    ):
+        """
+        Standard entrypoint into usage of the TemplateScanner class
+
+        :param str template_str: Template string that we want to scan.
+        :param int|None max_depth: See `ParenthesisBalancer.parse_string`.
+        :param int|None max_length: See `ParenthesisBalancer.parse_string`.
+        :return: See `execute` for definition.
+        :rtype: list[tuple[int,int,str,list[Node]]]
+        """
+        _s = cls(template_str, max_depth=max_depth, max_length=max_length)
+        return _s.execute()
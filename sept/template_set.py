@@ -0,0 +1,186 @@
+from collections import OrderedDict
+
+from sept.token import collect_dependencies
+
+PATH_SEPARATOR = "/"
+
+
+def _level_keys(template):
+    """
+    Split `template` into its path levels, fully literal levels are returned
+        as their text and levels containing a Token as None.
+    """
+    slot_indexes = set(index for index, _ in template._slots)
+    levels = [[]]
+    for index, part in enumerate(template._parts):
+        if index in slot_indexes:
+            levels[-1].append(None)
+            continue
+        pieces = part.split(PATH_SEPARATOR)
+        levels[-1].append(pieces[0])
+        for piece in pieces[1:]:
+            levels.append([piece])
+    return [None if None in level else "".join(level) for level in levels]
+
+
+class _LevelNode(object):
+    def __init__(self):
+        super(_LevelNode, self).__init__()
+        self.children = {}
+        self.wildcard = None
+        self.templates = []
+
+
+class TemplateSet(object):
+    """
+    The TemplateSet class groups many named Templates together.
+
+    It can classify a path, finding which of its Templates could have
+        resolved it and the Token values each of them extracts.
+    Token values never contain a path separator, so the Templates are indexed
+        in a trie of their path levels: fully literal directory names are
+        looked up exactly and levels containing a Token act as a wildcard.
+    A single walk over the levels of a path finds every candidate Template,
+        which is then confirmed with `Template.parse_path`.
+
+    It can also resolve all of its Templates against the same data at once,
+        evaluating every Token and Token Expression they share only once.
+    """
+
+    def __init__(self, templates):
+        """
+        :param dict[str,sept.template.Template] templates: Templates by name,
+            or (name, Template) pairs. Use an ordered mapping or pairs for an
+            ordered set before Python 3.7.
+        """
+        super(TemplateSet, self).__init__()
+        self._templates = OrderedDict(templates)
+        self._root = _LevelNode()
+        for order, (name, template) in enumerate(self._templates.items()):
+            node = self._root
+            for key in _level_keys(template):
+                if key is None:
+                    if node.wildcard is None:
+                        node.wildcard = _LevelNode()
+                    node = node.wildcard
+                else:
+                    node = node.children.setdefault(key, _LevelNode())
+            node.templates.append((order, name, template))
+        self._functions = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Generated functions can not be pickled, they are rebuilt on demand.
+        state["_functions"] = {}
+        return state
+
+    def __len__(self):
+        return len(self._templates)
+
+    def __iter__(self):
+        return iter(self._templates)
+
+    def __getitem__(self, name):
+        return self._templates[name]
+
+    def names(self):
+        return list(self._templates)
+
+    def required_tokens(self):
+        """
+        required_tokens will return every Token read by any Template in the
+            set, see `sept.template.Template.required_tokens`.
+
+        :rtype: tuple[sept.token.TokenDependency]
+        """
+        return collect_dependencies(
+            resolved_token
+            for template in self._templates.values()
+            for resolved_token in template._resolved_tokens
+        )
+
+    def compile_function(self, trusted=False):
+        """
+        compile_function will return a Python function generated for all of
+            the Templates in the set.
+
+        Calling it with a data dictionary gives the same result as `resolve`.
+        The function is generated once and cached on the TemplateSet.
+
+        :param bool trusted: See `sept.template.Template.resolve`.
+        :return: Function taking the data to resolve against.
+        :rtype: callable
+        """
+        trusted = bool(trusted)
+        if trusted not in self._functions:
+            from sept.codegen import compile_set_resolver
+
+            self._functions[trusted] = compile_set_resolver(
+                list(self._templates.items()), trusted=trusted
+            )
+        return self._functions[trusted]
+
+    def resolve(self, data, trusted=False):
+        """
+        resolve will resolve every Template in the set against `data`.
+
+        The Templates share a single evaluation plan, every deterministic
+            Token is evaluated once and every distinct Token Expression is
+            computed once, however many of the Templates use it.
+
+        :param dict data: Data to resolve against.
+        :param bool trusted: See `sept.template.Template.resolve`.
+        :return: The resolved strings by Template name, in the order of the
+            Templates.
+        :rtype: collections.OrderedDict[str,str]
+        """
+        return self.compile_function(trusted=trusted)(data)
+
+    def _candidates(self, path):
+        components = path.split(PATH_SEPARATOR)
+        depth = len(components)
+        candidates = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, level = stack.pop()
+            if level == depth:
+                candidates.extend(node.templates)
+                continue
+            child = node.children.get(components[level])
+            if child is not None:
+                stack.append((child, level + 1))
+            if node.wildcard is not None:
+                stack.append((node.wildcard, level + 1))
+        # Keep the order the Templates were given in.
+        candidates.sort(key=lambda candidate: candidate[0])
+        return candidates
+
+    def classify(self, path):
+        """
+        classify will return every Template in the set that matches `path`.
+
+        :param str path: Path to classify.
+        :return: A list of (name, values) tuples in the order the Templates
+            were added, `values` is the result of `Template.parse_path`.
+        :rtype: list[tuple[str,dict]]
+        """
+        matches = []
+        for _, name, template in self._candidates(path):
+            values = template.parse_path(path)
+            if values is not None:
+                matches.append((name, values))
+        return matches
+
+    def match(self, path):
+        """
+        match will return the first Template in the set that matches `path`.
+
+        :param str path: Path to classify.
+        :return: A (name, values) tuple or None if nothing matched.
+        :rtype: tuple[str,dict]|None
+        """
+        for _, name, template in self._candidates(path):
+            values = template.parse_path(path)
+            if values is not None:
+                return name, values
+        return None
@@ -1,29 +1,18 @@
-import pyparsing
+import sys
 
-token_group_start = pyparsing.Literal("{{")
-token_group_end = pyparsing.Literal("}}")
-escaped_character = "\\" + pyparsing.alphanums
 
-operator_name = pyparsing.Word(pyparsing.alphanums)("Operator")
-operator_args = pyparsing.delimitedList(
-    pyparsing.OneOrMore(
-        pyparsing.Word(pyparsing.printables, escaped_character, excludeChars="[],")
-    )
-)("Args")
-
-operator_arg_group = pyparsing.Literal("[") + operator_args + pyparsing.Literal("]")
-
-operator = (
-    operator_name
-    + pyparsing.Optional(
-        operator_arg_group,
+class Node(object):
+    __slots__ = (
+        "Operator",
+        "Args",
+        "Token",
+        "child",
+        "length",
+        "start",
+        "end",
+        "original_str",
     )
-    + pyparsing.Literal(":")
-)
-token_name = pyparsing.Word(pyparsing.printables, excludeChars="{}[]:")("Token")
 
-
-class Node(object):
     def __init__(self, Operator, Args, Token, length, tok_start, tok_str, child=()):
         super(Node, self).__init__()
         self.Operator = Operator
@@ -62,6 +51,10 @@ def parseAction(string, location, tokens):
         # We add n-1 length to handle the commas
         length += len(operator_args) - 1
     end = location + length
+    if operator_args:
+        # Keep the plain argument strings, not the pyparsing results that
+        #   reference the rest of the parse.
+        operator_args = list(operator_args)
     if isinstance(token, Node):
         new_node = Node(
             child=token,
@@ -85,12 +78,69 @@ def parseAction(string, location, tokens):
     return new_node
 
 
-Tokenizer = pyparsing.Forward().setResultsName("match")
+# The pyparsing grammar is only built, and pyparsing only imported, the first
+#   time a template is tokenized so `import sept` stays cheap.
+_tokenizer = None
+
+
+def get_tokenizer():
+    """
+    get_tokenizer will return the pyparsing grammar that matches a single
+        "Token Expression", building it on first use.
+
+    :rtype: pyparsing.ParserElement
+    """
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = _build_tokenizer()
+    return _tokenizer
+
+
+def _build_tokenizer():
+    import pyparsing
+
+    token_group_start = pyparsing.Literal("{{")
+    token_group_end = pyparsing.Literal("}}")
+    escaped_character = "\\" + pyparsing.alphanums
+
+    operator_name = pyparsing.Word(pyparsing.alphanums)("Operator")
+    operator_args = pyparsing.delimitedList(
+        pyparsing.OneOrMore(
+            pyparsing.Word(pyparsing.printables, escaped_character, excludeChars="[],")
+        )
+    )("Args")
+
+    operator_arg_group = pyparsing.Literal("[") + operator_args + pyparsing.Literal("]")
+
+    operator = (
+        operator_name
+        + pyparsing.Optional(
+            operator_arg_group,
+        )
+        + pyparsing.Literal(":")
+    )
+    token_name = pyparsing.Word(pyparsing.printables, excludeChars="{}[]:")("Token")
+
+    Tokenizer = pyparsing.Forward().setResultsName("match")
+
+    Tokenizer << (
+        token_group_start
+        + pyparsing.Optional(operator, default=None)
+        + (Tokenizer | token_name)
+        + token_group_end
+    )
+    Tokenizer.setParseAction(parseAction)
+    return Tokenizer
+
+
+def __getattr__(name):
+    # `Tokenizer` used to be built at import time, it is still available as a
+    #   module attribute but only built when it is first accessed.
+    if name == "Tokenizer":
+        return get_tokenizer()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
 
-Tokenizer << (
-    token_group_start
-    + pyparsing.Optional(operator, default=None)
-    + (Tokenizer | token_name)
-    + token_group_end
-)
-Tokenizer.setParseAction(parseAction)
+if sys.version_info < (3, 7):
+    # Module level __getattr__ needs Python 3.7, build the grammar up front.
+    Tokenizer = get_tokenizer()
@@ -1,5 +1,13 @@
+from collections import OrderedDict, namedtuple
+
 from sept.errors import InvalidOperatorInputDataError
 
+# A Token a Template reads.
+#   `name` is the Token name, `path` the keys looked up in the data for
+#   fallback Tokens (None for registered Tokens, which compute their own
+#   value) and `chains` every Operator chain applied to it.
+TokenDependency = namedtuple("TokenDependency", ["name", "path", "chains"])
+
 
 class Token(object):
     """
@@ -7,12 +15,26 @@ class Token(object):
     """
 
     name = NotImplementedError
+    # A Token is only evaluated once per resolve, even if it appears more
+    #   than once in a Template. Set this to False if `getValue` is expected
+    #   to return something different every time it is called.
+    deterministic = True
 
     def getValue(self, data):
         raise NotImplementedError
 
 
 class ResolvedToken(object):
+    __slots__ = (
+        "raw_token",
+        "operators",
+        "start",
+        "end",
+        "original_string",
+        "_trusted_checks",
+        "_trusted_chain",
+    )
+
     def __init__(self, raw_token, operators, tok_start, tok_end, original_string):
         """
 
@@ -29,30 +51,164 @@ class ResolvedToken(object):
         self.start = tok_start
         self.end = tok_end
         self.original_string = original_string
+        # Which Operators still need `is_invalid` in trusted mode, computed
+        #   on first use because nested tokens append to `operators`.
+        self._trusted_checks = None
+        self._trusted_chain = None
+
+    def __getstate__(self):
+        # Python 2 can only pickle a class with `__slots__` with the default
+        #   protocols through `__getstate__`. The trusted chain is derived
+        #   from the Operators and rebuilt on first use.
+        state = dict((name, getattr(self, name)) for name in self.__slots__)
+        state["_trusted_checks"] = None
+        state["_trusted_chain"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def invalid_data_error(self, operator, message, previous_operator=None):
+        """
+        invalid_data_error builds the error raised when `operator` rejects
+            the data it was given.
+
+        :param sept.operator.Operator operator: Operator that rejected the data.
+        :param str message: Error message returned by `Operator.is_invalid`.
+        :param sept.operator.Operator|None previous_operator: Operator that
+            ran before `operator`, if any.
+        :rtype: InvalidOperatorInputDataError
+        """
+        error = (
+            "The Operator {opname} received invalid data and "
+            "could not continue. {opname} threw the error: "
+            '"{errmsg}". The previous Operator was {prevop}, '
+            "maybe the error originated there?"
+        )
+        return InvalidOperatorInputDataError(
+            error.format(
+                opname=operator.name,
+                errmsg=message,
+                prevop=previous_operator,
+            )
+        )
 
     def execute(self, version_data):
         source_data = self.raw_token.getValue(version_data)
         if source_data is None:
             return self.original_string
-        transformed_data = str(source_data)
+        return self.apply(str(source_data))
 
+    def apply(self, transformed_data):
+        """
+        apply runs the Operators of this ResolvedToken on the text value of
+            its raw Token.
+
+        :param str transformed_data: Text value returned by the raw Token.
+        :return: The transformed data.
+        :rtype: str
+        """
         previous_operator = None
         for operator in self.operators:
             is_invalid_data = operator.is_invalid(transformed_data)
             if is_invalid_data:
-                error = (
-                    "The Operator {opname} received invalid data and "
-                    "could not continue. {opname} threw the error: "
-                    '"{errmsg}". The previous Operator was {prevop}, '
-                    "maybe the error originated there?"
+                raise self.invalid_data_error(
+                    operator, is_invalid_data, previous_operator
                 )
-                raise InvalidOperatorInputDataError(
-                    error.format(
-                        opname=operator.name,
-                        errmsg=is_invalid_data,
-                        prevop=previous_operator,
+            transformed_data = operator.execute(transformed_data)
+            previous_operator = operator
+        return transformed_data
+
+    def trusted_checks(self):
+        """
+        trusted_checks will return, for each Operator, whether its input
+            still has to be validated with `is_invalid` when resolving in
+            trusted mode.
+
+        The raw Token value is always converted to `str` so each Operator is
+            asked through `Operator.output_type` whether it accepts the type
+            produced by the Operator before it. Once an Operator can not
+            guarantee that, every Operator after it is validated.
+
+        :rtype: tuple[bool]
+        """
+        if self._trusted_checks is None:
+            data_type = str
+            checks = []
+            for operator in self.operators:
+                if data_type is not None:
+                    data_type = operator.output_type(data_type)
+                checks.append(data_type is None)
+            self._trusted_checks = tuple(checks)
+        return self._trusted_checks
+
+    def apply_trusted(self, transformed_data):
+        """
+        apply_trusted is `apply` without the `is_invalid` calls that were
+            proven unnecessary by `trusted_checks`.
+
+        :param str transformed_data: Text value returned by the raw Token.
+        :return: The transformed data.
+        :rtype: str
+        """
+        if self._trusted_chain is None:
+            self._trusted_chain = tuple(zip(self.operators, self.trusted_checks()))
+        previous_operator = None
+        for operator, checked in self._trusted_chain:
+            if checked:
+                is_invalid_data = operator.is_invalid(transformed_data)
+                if is_invalid_data:
+                    raise self.invalid_data_error(
+                        operator, is_invalid_data, previous_operator
                     )
-                )
             transformed_data = operator.execute(transformed_data)
             previous_operator = operator
         return transformed_data
+
+    def operator_chain(self):
+        """
+        operator_chain will return the Operators applied to the raw Token as
+            they are written in a template, in the order they run.
+
+        :return: Expressions like "pad[3,0]", without the NULL Operator.
+        :rtype: tuple[str]
+        """
+        chain = []
+        for operator in self.operators:
+            if operator._private:
+                continue
+            expression = operator.name
+            if operator._args:
+                expression += "[{}]".format(",".join(operator._args))
+            chain.append(expression)
+        return tuple(chain)
+
+
+def collect_dependencies(resolved_tokens):
+    """
+    collect_dependencies will return the Tokens read by `resolved_tokens`.
+
+    :param Iterable[ResolvedToken] resolved_tokens: Slots of one or more
+        Templates.
+    :return: One TokenDependency per Token name, in order of first use.
+    :rtype: tuple[TokenDependency]
+    """
+    from sept.builtin.tokens.default import DefaultFallbackToken, PATH_SEPARATOR
+
+    dependencies = OrderedDict()
+    for resolved_token in resolved_tokens:
+        raw_token = resolved_token.raw_token
+        if raw_token.name not in dependencies:
+            path = None
+            if isinstance(raw_token, DefaultFallbackToken):
+                path = tuple(raw_token.name.split(PATH_SEPARATOR))
+            dependencies[raw_token.name] = (path, [])
+        chains = dependencies[raw_token.name][1]
+        chain = resolved_token.operator_chain()
+        if chain not in chains:
+            chains.append(chain)
+    return tuple(
+        TokenDependency(name=name, path=path, chains=tuple(chains))
+        for name, (path, chains) in dependencies.items()
+    )
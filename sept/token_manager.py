@@ -7,6 +7,7 @@ class TokenManager(object):
     def __init__(self):
         super(TokenManager, self).__init__()
         self._cache = {}
+        self._version = 0
 
         from sept.builtin.tokens import ALL_TOKENS
 
@@ -19,6 +20,32 @@ class TokenManager(object):
         # Don't include the NULL operator
         return sorted(self._cache.values(), key=lambda tok: tok.name)
 
+    @property
+    def version(self):
+        # Bumped every time the registered tokens change
+        return self._version
+
+    def fingerprint(self):
+        """
+        fingerprint will return the name and class of every registered Token.
+
+        :return: Sorted tuple of (name, "module.Class") pairs.
+        :rtype: tuple[tuple[str,str]]
+        """
+        return tuple(
+            sorted(
+                (name, "{}.{}".format(type(token).__module__, type(token).__name__))
+                for name, token in self._cache.items()
+            )
+        )
+
+    def getToken(self, token_name):
+        if token_name in self._cache:
+            return self._cache[token_name]
+        raise TokenNotFoundError(
+            "Could not find a registered token matching: {}".format(token_name)
+        )
+
     def add_custom_tokens(self, custom_tokens, dont_overwrite=True):
         for custom_token in custom_tokens:
             token_name = custom_token.name.lower()
@@ -32,6 +59,7 @@ class TokenManager(object):
                     )
                 )
             self._cache[token_name] = custom_token()
+        self._version += 1
 
     def _bind_token(
         self,
@@ -50,9 +78,9 @@ class TokenManager(object):
             operators.append(operator_instance)
         else:
             if use_default:
-                from sept.builtin.tokens import DefaultTokenFactory
+                from sept.builtin.tokens import default_fallback_token
 
-                raw_token = DefaultTokenFactory(token_name)()
+                raw_token = default_fallback_token(token_name)
             else:
                 raw_token = self._cache[token_name]
             operators = [operator_instance]
@@ -77,7 +105,8 @@ class TokenManager(object):
     ):
         use_default_fallback = False
         if not isinstance(token, ResolvedToken):
-            token = token.lower().strip(" ")
+            token_path = token.strip(" ")
+            token = token_path.lower()
             if token not in self._cache:
                 if not default_fallback:
                     error = (
@@ -93,6 +122,8 @@ class TokenManager(object):
                         )
                     )
                 use_default_fallback = True
+                # The fallback Token decides how the name is looked up.
+                token = token_path
         return self._bind_token(
             token_name=token,
             operator_instance=operator,
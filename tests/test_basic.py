@@ -8,6 +8,8 @@ from sept.errors import (
     OpeningBalancingParenthesisError,
     ClosingBalancingParenthesisError,
     MultipleBalancingError,
+    MaximumDepthParsingError,
+    MaximumLengthParsingError,
 )
 
 state_data = {
@@ -304,6 +306,51 @@ def test_balencer_double_missing_closer_and_opener():
     assert len(token_expresion_locations) == 0
 
 
+def test_balencer_max_depth():
+    template_str = r"{{lower:{{upper:{{name}}}}}}"
+    token_expresion_locations, errors = ParenthesisBalancer.parse_string(
+        template_str, max_depth=3
+    )
+    assert errors == []
+    assert token_expresion_locations == [(0, len(template_str) - 1)]
+
+    token_expresion_locations, errors = ParenthesisBalancer.parse_string(
+        template_str, max_depth=2
+    )
+    assert len(errors) == 1
+    assert isinstance(errors[0], MaximumDepthParsingError)
+    assert errors[0].location == 16
+
+
+def test_balencer_max_length():
+    template_str = r"{{lower:name}}"
+    _, errors = ParenthesisBalancer.parse_string(template_str, max_length=14)
+    assert errors == []
+    _, errors = ParenthesisBalancer.parse_string(template_str, max_length=13)
+    assert len(errors) == 1
+    assert isinstance(errors[0], MaximumLengthParsingError)
+
+
+def test_balencer_limits_errors():
+    template_str = r"{{" * 10000
+    token_expresion_locations, errors = ParenthesisBalancer.parse_string(
+        template_str, max_depth=None
+    )
+    assert token_expresion_locations == []
+    assert len(errors) == ParenthesisBalancer.MAX_ERRORS
+    assert all(isinstance(e, ClosingBalancingParenthesisError) for e in errors)
+
+
+@pytest.mark.parametrize("engine", ["pyparsing", "scanner"])
+def test_parse_max_depth(engine):
+    depth_parser = PathTemplateParser(engine=engine, max_depth=2)
+    template_obj = depth_parser.validate_template(r"{{lower:{{upper:name}}}}")
+    assert template_obj.resolve({"name": "AhUgHeS"}) == "ahughes"
+    with pytest.raises(MultipleBalancingError) as err:
+        depth_parser.validate_template(r"{{lower:{{upper:{{name}}}}}}")
+    assert isinstance(err.value.errors[0], MaximumDepthParsingError)
+
+
 def test_parse_partial_expression():
     template_str = r"{lower:name}}/{{upper:name}}"
     try:
@@ -324,5 +371,38 @@ def test_parse_raise_missing_operator():
         raise AssertionError("Should have raised a OperatorNotFoundError!")
 
 
+def test_substr_single_argument():
+    template_str = r"{{substr[2]:name}}"
+    template_obj = parser.validate_template(template_str)
+
+    resolved_path = template_obj.resolve(state_data)
+    assert resolved_path == "UgHeS"
+
+
+def test_parse_raise_invalid_operator_arguments():
+    template_str = r"/{{lower:name}}/{{pad[four,0]:name}}"
+    try:
+        _ = parser.validate_template(template_str)
+    except ParsingError as err:
+        assert str(err) == "The first input value passed should be a number."
+        assert err.location == 16
+    else:
+        raise AssertionError("Should have raised a ParsingError!")
+
+
+def test_parse_raise_invalid_nested_operator_arguments():
+    for template_str in (
+        r"{{lower:{{substr[1,middle]:name}}}}",
+        r"{{replace[a]:name}}",
+        r"{{pad[4,{]:name}}",
+    ):
+        try:
+            _ = parser.validate_template(template_str)
+        except ParsingError:
+            pass
+        else:
+            raise AssertionError("Should have raised a ParsingError!")
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,132 @@
+import threading
+
+import pytest
+
+from sept import Operator
+from sept.cache import LRUCache
+from sept.errors import ParsingError
+from sept.parser import PathTemplateParser
+
+state_data = {
+    "name": "AhUgHeS",
+}
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    info = cache.info()
+    assert info.evictions == 1
+    assert info.size == 2
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_setdefault():
+    cache = LRUCache(maxsize=2)
+    assert cache.setdefault("a", 1) == 1
+    assert cache.setdefault("a", 2) == 1
+    assert cache.get("a") == 1
+
+
+def test_operators_interned():
+    parser = PathTemplateParser(cache_size=0)
+    first = parser.validate_template(r"{{pad[4,0]:frame}}/{{upper:name}}")
+    second = parser.validate_template(r"{{upper:shot}}/{{pad[4,0]:version}}")
+    other = parser.validate_template(r"{{pad[3,0]:frame}}")
+
+    first_pad, first_upper = [rt.operators[0] for rt in first._resolved_tokens]
+    second_upper, second_pad = [rt.operators[0] for rt in second._resolved_tokens]
+    assert first_pad is second_pad
+    assert first_upper is second_upper
+    assert other._resolved_tokens[0].operators[0] is not first_pad
+    assert second.resolve({"shot": "sh010", "version": 3}) == "SH010/0003"
+
+
+def test_operators_interned_on_compiled_arguments():
+    parser = PathTemplateParser(cache_size=0)
+    template_obj = parser.validate_template(
+        r"{{substr[START,2]:a}}{{substr[start,2]:b}}{{substr[0,2]:c}}{{substr[1,2]:d}}"
+    )
+    operators = [rt.operators[0] for rt in template_obj._resolved_tokens]
+    assert operators[0] is operators[1] is operators[2]
+    assert operators[3] is not operators[0]
+
+
+def test_stateful_operators_not_interned():
+    class CountOperator(Operator):
+        name = "count"
+
+        def execute(self, input_data):
+            return input_data
+
+    parser = PathTemplateParser(additional_operators=[CountOperator])
+    template_obj = parser.validate_template(r"{{count:name}}/{{count:name}}")
+    first, second = [rt.operators[0] for rt in template_obj._resolved_tokens]
+    assert first is not second
+
+
+def test_parser_reuses_compiled_template():
+    parser = PathTemplateParser()
+    template_obj = parser.validate_template(r"{{lower:name}}")
+
+    assert parser.validate_template(r"{{lower:name}}") is template_obj
+    assert parser.parse(r"{{lower:name}}", state_data) == "ahughes"
+    info = parser.cache_info()
+    assert info.hits == 2
+    assert info.misses == 1
+
+
+def test_parser_cache_keyed_on_default_fallback():
+    parser = PathTemplateParser()
+    parser.validate_template(r"{{name}}")
+    with pytest.raises(ParsingError):
+        parser.validate_template(r"{{name}}", default_fallback_token=False)
+
+
+def test_parser_cache_invalidated_by_registry_change():
+    class SoupOperator(Operator):
+        name = "soup"
+
+        def is_invalid(self, token_value):
+            return None
+
+        def execute(self, input_data):
+            return "tomato soup"
+
+    parser = PathTemplateParser()
+    template_obj = parser.validate_template(r"{{lower:name}}")
+    parser._operator_manager.add_custom_operators([SoupOperator])
+
+    assert parser.validate_template(r"{{lower:name}}") is not template_obj
+
+
+def test_parser_cache_threaded():
+    parser = PathTemplateParser(cache_size=4)
+    results = []
+
+    def worker(index):
+        template_str = "{{lower:name}}/%d" % (index % 8)
+        results.append(parser.parse(template_str, state_data))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(64)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 64
+    assert all(result.startswith("ahughes/") for result in results)
+    assert parser.cache_info().size <= 4
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import sept
+from sept.operator_manager import OperatorManager
+
+# Module level __getattr__ needs Python 3.7, older versions import eagerly.
+requires_lazy_imports = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="Lazy imports need Python 3.7"
+)
+
+
+def _loaded_modules(code):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    code += "\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], env=env, universal_newlines=True
+    )
+    return set(output.split())
+
+
+@requires_lazy_imports
+def test_import_is_lazy():
+    modules = _loaded_modules("import sept")
+    assert "pyparsing" not in modules
+    assert "sept._version" not in modules
+    assert "sept.builtin.operators.substr" not in modules
+
+
+@requires_lazy_imports
+def test_resolve_loads_used_operators_only():
+    modules = _loaded_modules(
+        "import sept\n"
+        "sept.PathTemplateParser(engine='scanner').parse('{{lower:name}}', {})"
+    )
+    assert "sept.builtin.operators.lower" in modules
+    assert "sept.builtin.operators.substr" not in modules
+    assert "pyparsing" not in modules
+
+
+def test_lazy_attributes():
+    from sept.builtin.operators import ALL_OPERATORS, PadOperator
+
+    assert sept.__version__
+    assert PadOperator in ALL_OPERATORS
+    assert [operator.name for operator in OperatorManager().operators] == [
+        "lower",
+        "pad",
+        "replace",
+        "substr",
+        "upper",
+    ]
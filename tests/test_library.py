@@ -0,0 +1,87 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from sept import Operator
+from sept.errors import ParsingError
+from sept.library import TemplateLibrary
+from sept.parser import PathTemplateParser
+
+state_data = {"show": "abc", "shot": "sh0100", "version": "3"}
+CONFIG = {
+    "shot_root": r"/show/{{show}}/{{shot}}",
+    "work": r"/show/{{show}}/{{shot}}/work/v{{pad[3,0]:version}}",
+    "broken": r"/show/{{show}/{{shot}}",
+    "bad_operator": r"/show/{{nope:show}}",
+}
+
+
+def test_load_reports_every_error():
+    library = TemplateLibrary()
+    report = library.load(CONFIG)
+
+    assert report.compiled == ["shot_root", "work"]
+    assert list(report.errors) == ["broken", "bad_operator"]
+    assert all(isinstance(err, ParsingError) for err in report.errors.values())
+    assert library.names() == ["shot_root", "work"]
+    assert library["work"].resolve(state_data) == "/show/abc/sh0100/work/v003"
+
+
+def test_incremental_load():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        library = TemplateLibrary(executor=executor)
+        library.load(CONFIG)
+        work = library["work"]
+
+        config = dict(CONFIG)
+        config["shot_root"] = r"/projects/{{show}}/{{shot}}"
+        config["broken"] = r"/show/{{show}}/{{shot}}/broken"
+        del config["bad_operator"]
+        report = library.load(config)
+
+    assert sorted(report.compiled) == ["broken", "shot_root"]
+    assert report.unchanged == ["work"]
+    assert report.removed == ["bad_operator"]
+    assert report.errors == {}
+    assert library["work"] is work
+    assert library.template_set().resolve(state_data)["shot_root"] == (
+        "/projects/abc/sh0100"
+    )
+
+
+def test_load_file(tmp_path):
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps({"shot_root": CONFIG["shot_root"]}))
+
+    library = TemplateLibrary()
+    assert library.load_file(str(path)).compiled == ["shot_root"]
+    assert "shot_root" in library
+
+
+class NopeOperator(Operator):
+    name = "nope"
+
+    def execute(self, input_data):
+        return input_data
+
+
+def test_load_on_process_pool():
+    parser = PathTemplateParser(additional_operators=[NopeOperator])
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        library = TemplateLibrary(parser=parser, executor=executor)
+        report = library.load(CONFIG)
+
+    assert report.compiled == ["shot_root", "work", "bad_operator"]
+    assert list(report.errors) == ["broken"]
+    assert library["work"].resolve(state_data) == "/show/abc/sh0100/work/v003"
+
+
+def test_registry_change_recompiles():
+    parser = PathTemplateParser()
+    library = TemplateLibrary(parser=parser)
+    assert list(library.load(CONFIG).errors) == ["broken", "bad_operator"]
+
+    parser._operator_manager.add_custom_operators([NopeOperator])
+    report = library.load(CONFIG)
+    assert report.compiled == ["shot_root", "work", "bad_operator"]
+    assert report.unchanged == []
+    assert library["bad_operator"].resolve(state_data) == "/show/abc"
@@ -0,0 +1,86 @@
+import pickle
+
+import pytest
+
+from sept import Operator
+from sept.parser import PathTemplateParser
+from sept.errors import ParsingError, MultipleBalancingError
+
+parser = PathTemplateParser()
+
+
+def test_template_pickles_with_default_tokens():
+    template_obj = parser.validate_template(r"/{{lower:{{substr[0,3]:shot}}}}/{{shot}}")
+    template_obj.compile_function()
+
+    restored = pickle.loads(pickle.dumps(template_obj))
+    assert restored.text() == template_obj.text()
+    assert restored.resolve({"shot": "SH0100"}) == "/sh0/SH0100"
+    assert restored.compile_function()({"shot": "SH0100"}) == "/sh0/SH0100"
+
+
+def test_template_pickles_with_every_protocol():
+    template_obj = parser.validate_template(
+        r"/{{upper:show}}/{{replace[_,-]:shot}}/v{{pad[3,0]:version}}"
+    )
+    data = {"show": "abc", "shot": "sh_0100", "version": "7"}
+    expected = template_obj.resolve(data, trusted=True)
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(template_obj, protocol))
+        assert restored.resolve(data) == expected
+        assert restored.resolve(data, trusted=True) == expected
+
+
+def test_parsing_errors_pickle():
+    with pytest.raises(MultipleBalancingError) as err:
+        parser.validate_template(r"{lower:name}}/{{upper:name}")
+
+    restored = pickle.loads(pickle.dumps(err.value))
+    assert type(restored) is MultipleBalancingError
+    assert str(restored) == str(err.value)
+    assert restored.location == err.value.location
+    assert [str(e) for e in restored.errors] == [str(e) for e in err.value.errors]
+
+
+def test_resolve_parallel_keeps_order():
+    template_obj = parser.validate_template(r"{{shot}}.{{pad[4,0]:frame}}")
+    records = ({"shot": "sh0100", "frame": frame} for frame in range(1000))
+
+    results = list(template_obj.resolve_parallel(records, chunk_size=64, max_workers=2))
+    assert results == ["sh0100.{:0>4}".format(frame) for frame in range(1000)]
+
+
+def test_resolve_parallel_rejects_empty_chunks():
+    template_obj = parser.validate_template(r"{{shot}}")
+    with pytest.raises(ValueError):
+        template_obj.resolve_parallel([{"shot": "sh0100"}], chunk_size=0)
+
+
+class EvenOperator(Operator):
+    name = "even"
+
+    def is_invalid(self, token_value):
+        if int(token_value) % 2:
+            return "Odd number"
+        return None
+
+    def execute(self, input_data):
+        return input_data
+
+
+def test_parser_resolve_parallel_yields_errors():
+    custom_parser = PathTemplateParser(additional_operators=[EvenOperator])
+    results = list(
+        custom_parser.resolve_parallel(
+            r"{{even:frame}}",
+            [{"frame": frame} for frame in range(4)],
+            chunk_size=1,
+            max_workers=2,
+            on_error="yield",
+        )
+    )
+    assert results[0] == "0"
+    assert isinstance(results[1], ParsingError)
+    assert results[1].location == 0
+    assert results[2] == "2"
@@ -0,0 +1,155 @@
+import os
+
+import pytest
+
+from sept.errors import TokenNotFoundError
+from sept.parser import PathTemplateParser
+
+parser = PathTemplateParser()
+TEMPLATE_STR = r"{{root}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}/{{shot}}_{{step}}.exr"
+
+
+def _touch(root, *names):
+    for name in names:
+        path = os.path.join(str(root), name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        open(path, "w").close()
+
+
+def test_to_glob():
+    template_obj = parser.validate_template(TEMPLATE_STR)
+    assert template_obj.to_glob() == "*/*/*/v*/*_*.exr"
+    assert (
+        template_obj.to_glob({"root": "/sh[ow]", "shot": "sh0100"})
+        == "/sh[[]ow]/sh0100/*/v*/sh0100_*.exr"
+    )
+
+    adjacent = parser.validate_template(r"/show/{{shot}}{{step}}.exr")
+    assert adjacent.to_glob() == "/show/*.exr"
+
+
+def test_level_matchers():
+    template_obj = parser.validate_template(TEMPLATE_STR)
+    levels = template_obj.level_matchers({"root": "/show", "step": "comp"})
+    assert levels[:2] == ["", "show"]
+    assert levels[3] == "comp"
+    assert levels[4].match("v012")
+    assert not levels[4].match("v12")
+    assert levels[5].match("sh0100_comp.exr")
+    assert not levels[5].match("sh0100_comp.exr.bak")
+
+
+def test_scan(tmp_path):
+    _touch(
+        tmp_path,
+        "sh0100/comp/v001/sh0100_comp.exr",
+        "sh0100/comp/v002/sh0100_comp.exr",
+        "sh0100/comp/v002/sh0200_comp.exr",
+        "sh0100/comp/v03/sh0100_comp.exr",
+        "sh0100/comp/notes.txt",
+        "sh0100/anim/v001/sh0100_anim.exr",
+        "sh0200/comp/v001/sh0200_comp.exr",
+    )
+    template_obj = parser.validate_template(TEMPLATE_STR)
+    root = str(tmp_path)
+
+    paths = [path for path, _ in template_obj.scan({"root": root})]
+    assert paths == [
+        os.path.join(root, name)
+        for name in (
+            "sh0100/anim/v001/sh0100_anim.exr",
+            "sh0100/comp/v001/sh0100_comp.exr",
+            "sh0100/comp/v002/sh0100_comp.exr",
+            "sh0200/comp/v001/sh0200_comp.exr",
+        )
+    ]
+
+    results = list(template_obj.scan({"root": root, "step": "comp", "shot": "sh0100"}))
+    assert [values["version"] for _, values in results] == ["001", "002"]
+    assert results[0][1]["root"] == root
+
+    assert list(template_obj.scan({"root": os.path.join(root, "missing")})) == []
+
+
+def test_scan_known_values(tmp_path):
+    from sept import Token
+
+    class ShotCodeToken(Token):
+        name = "shotcode"
+
+        def getValue(self, data):
+            shot_id = data.get("shot_id")
+            if shot_id is None:
+                return None
+            return "sh{:04d}".format(shot_id)
+
+    _touch(tmp_path, "sh0100/comp/v001/sh0100_comp.exr")
+    custom_parser = PathTemplateParser(additional_tokens=[ShotCodeToken])
+    template_obj = custom_parser.validate_template(
+        r"{{root}}/{{shotcode}}/{{entity.step}}/v{{pad[3,0]:version}}/"
+        r"{{shotcode}}_{{entity.step}}.exr"
+    )
+    root = str(tmp_path)
+
+    results = list(
+        template_obj.scan(
+            {"root": root, "shot_id": 100, "entity": {"step": "comp"}, "version": None}
+        )
+    )
+    assert results == [
+        (
+            os.path.join(root, "sh0100/comp/v001/sh0100_comp.exr"),
+            {
+                "root": root,
+                "shotcode": "sh0100",
+                "entity.step": "comp",
+                "version": "001",
+            },
+        )
+    ]
+
+
+def test_scan_relative(tmp_path, monkeypatch):
+    _touch(tmp_path, "sh0100/comp.exr", "sh0100/comp.txt")
+    monkeypatch.chdir(str(tmp_path))
+    template_obj = parser.validate_template(r"{{shot}}/{{step}}.exr")
+    assert list(template_obj.scan()) == [
+        ("sh0100/comp.exr", {"shot": "sh0100", "step": "comp"})
+    ]
+
+
+def test_find_versions(tmp_path):
+    _touch(
+        tmp_path,
+        "sh0100/comp/v001/sh0100_comp.exr",
+        "sh0100/comp/v002/sh0100_comp.exr",
+        "sh0100/comp/v010/sh0100_comp.exr",
+        "sh0100/comp/v03/sh0100_comp.exr",
+        "sh0100/comp/latest.txt",
+        "sh0200/comp/v004/sh0200_comp.exr",
+    )
+    os.makedirs(os.path.join(str(tmp_path), "sh0300", "comp"))
+    template_obj = parser.validate_template(TEMPLATE_STR)
+    shot = {"root": str(tmp_path), "shot": "sh0100", "step": "comp", "version": 1}
+
+    assert template_obj.find_versions(shot) == ["001", "002", "010"]
+    assert template_obj.find_latest_version(shot) == "010"
+    assert template_obj.find_latest_version(dict(shot, step="anim")) is None
+    # Unbound Tokens above the version level are scanned for.
+    assert template_obj.find_versions({"root": str(tmp_path), "step": "comp"}) == [
+        "001",
+        "002",
+        "004",
+        "010",
+    ]
+
+    records = [dict(shot, shot=name) for name in ("sh0100", "sh0200", "sh0300")]
+    assert template_obj.find_latest_versions(records, max_workers=2) == [
+        "010",
+        "004",
+        None,
+    ]
+
+    with pytest.raises(TokenNotFoundError):
+        template_obj.find_versions(shot, version_token="take")
@@ -0,0 +1,68 @@
+import pytest
+
+from sept.errors import TokenNotFoundError
+from sept.parser import PathTemplateParser
+from sept.sequence import FrameSequence, frame_range
+
+state_data = {"show": "abc", "shot": "sh0100", "step": "comp", "frame": "1"}
+parser = PathTemplateParser()
+
+
+def test_frame_range():
+    assert list(frame_range(1001, 1005, 2)) == [1001, 1003, 1005]
+    assert list(frame_range(3, 1, -1)) == [3, 2, 1]
+    assert len(frame_range(1, 100000)) == 100000
+
+
+def test_paths_match_resolve():
+    template_obj = parser.validate_template(
+        r"/{{show}}/{{shot}}/{{upper:step}}/{{shot}}.{{pad[4,0]:frame}}.{frame}.exr"
+    )
+    sequence = template_obj.sequence(state_data, frames=frame_range(998, 1001))
+    expected = [
+        template_obj.resolve(dict(state_data, frame=frame))
+        for frame in frame_range(998, 1001)
+    ]
+    assert list(sequence) == expected
+    assert list(sequence.paths(list(frame_range(998, 1001)))) == expected
+    assert len(sequence) == 4
+    assert sequence.path(-5) == template_obj.resolve(dict(state_data, frame=-5))
+    assert sequence.pattern() == "/abc/sh0100/COMP/sh0100.%04d.{frame}.exr"
+    assert sequence.pattern("hash") == "/abc/sh0100/COMP/sh0100.####.{frame}.exr"
+
+
+def test_paths_operator_chain():
+    template_obj = parser.validate_template(
+        r"{{shot}}_{{missing}}.{{substr[0,2]:frame}}_{{frame}}%"
+    )
+    sequence = FrameSequence(template_obj, state_data)
+    assert list(sequence.paths([1001, 1002])) == [
+        template_obj.resolve(dict(state_data, frame=frame)) for frame in (1001, 1002)
+    ]
+    with pytest.raises(ValueError):
+        sequence.pattern()
+
+    twice = parser.validate_template(r"{{pad[3,0]:frame}}/{{pad[4,0]:frame}}")
+    assert list(twice.sequence({}, frames=range(9, 11))) == ["009/0009", "010/0010"]
+
+    plain = parser.validate_template(r"{{shot}}.{{frame}}%.exr").sequence({})
+    assert plain.path(7) == "{{shot}}.7%.exr"
+    assert plain.pattern() == "{{shot}}.%d%%.exr"
+    assert plain.pattern("hash") == "{{shot}}.#%.exr"
+
+    with pytest.raises(TokenNotFoundError):
+        template_obj.sequence(state_data, frame_token="take")
+
+
+def test_frames_without_length():
+    template_obj = parser.validate_template(r"{{shot}}.{{pad[4,0]:frame}}.exr")
+    sequence = template_obj.sequence(state_data)
+    with pytest.raises(TypeError):
+        len(sequence)
+    with pytest.raises(ValueError):
+        list(sequence)
+
+    generated = template_obj.sequence(state_data, frames=(f for f in (1, 2)))
+    with pytest.raises(TypeError):
+        len(generated)
+    assert list(generated) == ["sh0100.0001.exr", "sh0100.0002.exr"]
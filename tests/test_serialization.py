@@ -0,0 +1,95 @@
+import json
+import os
+
+from sept import Token
+from sept.parser import PathTemplateParser
+from sept.serialization import TemplateDiskCache, dump_template, load_template
+from sept.template import Template
+
+state_data = {
+    "name": "AhUgHeS",
+    "entity": {"code": "sh0100"},
+    "version": "12",
+}
+TEMPLATE_STR = (
+    r"/{{upper:entity.code}}/{{lower:{{substr[0,3]:name}}}}/v{{pad[3,0]:version}}/"
+    r"{{missing}}"
+)
+
+
+def test_dump_load_template():
+    parser = PathTemplateParser()
+    template_obj = parser.validate_template(TEMPLATE_STR)
+
+    payload = json.loads(json.dumps(dump_template(template_obj)))
+    loaded = load_template(payload, parser._token_manager, parser._operator_manager)
+    assert loaded.text() == template_obj.text()
+    assert loaded.resolve(state_data) == template_obj.resolve(state_data)
+    assert loaded.resolve(state_data) == "/SH0100/ahu/v012/{{missing}}"
+
+
+def test_disk_cache_skips_compiling(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "templates")
+    expected = PathTemplateParser(cache_dir=cache_dir).parse(TEMPLATE_STR, state_data)
+    assert len(os.listdir(cache_dir)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Template should be loaded from disk")
+
+    monkeypatch.setattr(Template, "from_template_str", fail)
+    assert PathTemplateParser(cache_dir=cache_dir).parse(TEMPLATE_STR, state_data) == (
+        expected
+    )
+
+
+def test_disk_cache_invalidation(tmp_path):
+    cache_dir = str(tmp_path)
+    PathTemplateParser(cache_dir=cache_dir).validate_template(TEMPLATE_STR)
+
+    class VersionToken(Token):
+        name = "version"
+
+        def getValue(self, data):
+            return 7
+
+    # A new registered Token changes how the template compiles.
+    parser = PathTemplateParser(additional_tokens=[VersionToken], cache_dir=cache_dir)
+    assert parser.parse(TEMPLATE_STR, state_data) == "/SH0100/ahu/v007/{{missing}}"
+    assert len(os.listdir(cache_dir)) == 2
+
+    # Unreadable entries are compiled again and replaced.
+    for file_name in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, file_name), "w") as handle:
+            handle.write("{")
+    parser = PathTemplateParser(cache_dir=cache_dir)
+    assert parser.parse(TEMPLATE_STR, state_data) == "/SH0100/ahu/v012/{{missing}}"
+
+
+def test_template_key_follows_sources(monkeypatch):
+    import sept.serialization
+
+    parser = PathTemplateParser()
+    args = (TEMPLATE_STR, parser._token_manager, parser._operator_manager)
+    key = sept.serialization.template_key(*args)
+    assert sept.serialization.template_key(*args) == key
+
+    # Another sept version has other sources.
+    monkeypatch.setattr(sept.serialization, "_compiler_version", "0" * 64)
+    assert sept.serialization.template_key(*args) != key
+
+
+def test_disk_cache_put_cleans_up(tmp_path, monkeypatch):
+    import sept.serialization
+
+    cache = TemplateDiskCache(str(tmp_path))
+    template_obj = PathTemplateParser().validate_template(r"{{shot}}")
+    monkeypatch.setattr(
+        sept.serialization, "dump_template", lambda template: {"bad": object()}
+    )
+    assert cache.put("key", template_obj) is template_obj
+    assert os.listdir(str(tmp_path)) == []
+
+    # A failed write does not escape through `validate_template`.
+    parser = PathTemplateParser(cache_dir=str(tmp_path))
+    assert parser.parse(r"{{shot}}", {"shot": "sh0100"}) == "sh0100"
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,420 @@
+import pytest
+
+from sept.parser import PathTemplateParser
+
+state_data = {
+    "name": "AhUgHeS",
+    "show": "abc",
+    "sequence": "seq010",
+    "shot": "sh0100",
+    "step": "comp",
+    "version": "12",
+    "frame": "1001",
+}
+parser = PathTemplateParser()
+
+
+def test_resolve_without_tokens():
+    template_obj = parser.validate_template(r"/show/static/path")
+    assert template_obj.resolve(state_data) == "/show/static/path"
+
+
+def test_resolve_adjacent_tokens():
+    template_obj = parser.validate_template(r"{{upper:name}}{{lower:name}}{{name}}")
+    assert template_obj.resolve(state_data) == "AHUGHESahughesAhUgHeS"
+
+
+def test_resolve_many_tokens():
+    template_str = (
+        r"/show/{{show}}/{{sequence}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}/"
+        r"{{show}}_{{shot}}_{{step}}_v{{pad[3,0]:version}}.{{pad[4,0]:frame}}.exr"
+    )
+    template_obj = parser.validate_template(template_str)
+
+    assert template_obj.resolve(state_data) == (
+        "/show/abc/seq010/sh0100/comp/v012/abc_sh0100_comp_v012.1001.exr"
+    )
+
+
+def test_resolve_missing_value_keeps_expression():
+    template_obj = parser.validate_template(r"/show/{{show}}/{{ missing }}/")
+    assert template_obj.resolve(state_data) == "/show/abc/{{missing}}/"
+
+
+def test_compile_function_matches_resolve():
+    template_str = (
+        r"/show/{{show}}/{{lower:{{substr[0,3]:shot}}}}/{{ missing }}/"
+        r"{{upper:name}}_v{{pad[3,0]:version}}.{{pad[4,0]:frame}}.exr"
+    )
+    template_obj = parser.validate_template(template_str)
+    function = template_obj.compile_function()
+
+    assert function is template_obj.compile_function()
+    assert function(state_data) == template_obj.resolve(state_data)
+
+
+def test_compile_function_matches_resolve_on_missing_data():
+    template_obj = parser.validate_template(
+        r"{{Show}}/{{show}}/{{upper:Shot}}_{{upper:shot}}/{{ show }}"
+    )
+    for data in ({}, {"show": "abc"}, {"shot": "sh0100"}):
+        expected = template_obj.resolve(data)
+        assert template_obj.compile_function()(data) == expected
+        assert list(template_obj.resolve_many([data])) == [expected]
+    assert template_obj.resolve({}) == (
+        "{{Show}}/{{show}}/{{upper:Shot}}_{{upper:shot}}/{{show}}"
+    )
+
+
+def test_compile_function_raises_parsing_error():
+    from sept import Operator
+    from sept.errors import ParsingError
+
+    class StrictOperator(Operator):
+        name = "strict"
+
+        def is_invalid(self, token_value):
+            return "Nothing is ever valid"
+
+        def execute(self, input_data):
+            return input_data
+
+    custom_parser = PathTemplateParser(additional_operators=[StrictOperator])
+    template_obj = custom_parser.validate_template(r"/{{lower:{{strict:name}}}}")
+
+    with pytest.raises(ParsingError) as expected:
+        template_obj.resolve(state_data)
+    with pytest.raises(ParsingError) as actual:
+        template_obj.compile_function()(state_data)
+    assert str(actual.value) == str(expected.value)
+    assert actual.value.location == expected.value.location
+
+
+def test_resolve_many():
+    template_obj = parser.validate_template(r"{{shot}}.{{pad[4,0]:frame}}")
+    records = ({"shot": "sh0100", "frame": frame} for frame in range(1, 6))
+
+    results = template_obj.resolve_many(records, chunk_size=2)
+    assert list(results) == [
+        "sh0100.0001",
+        "sh0100.0002",
+        "sh0100.0003",
+        "sh0100.0004",
+        "sh0100.0005",
+    ]
+
+
+def test_resolve_many_on_error():
+    from sept import Operator
+    from sept.errors import ParsingError
+
+    class EvenOperator(Operator):
+        name = "even"
+
+        def is_invalid(self, token_value):
+            if int(token_value) % 2:
+                return "Odd number"
+            return None
+
+        def execute(self, input_data):
+            return input_data
+
+    custom_parser = PathTemplateParser(additional_operators=[EvenOperator])
+    template_obj = custom_parser.validate_template(r"{{even:frame}}")
+    records = [{"frame": frame} for frame in range(4)]
+
+    assert list(template_obj.resolve_many(records, on_error="skip")) == ["0", "2"]
+    results = list(template_obj.resolve_many(records, on_error="yield"))
+    assert results[0] == "0"
+    assert isinstance(results[1], ParsingError)
+    with pytest.raises(ParsingError):
+        list(template_obj.resolve_many(records, chunk_size=3))
+    with pytest.raises(ValueError):
+        template_obj.resolve_many(records, on_error="ignore")
+
+
+def test_parse_path():
+    template_obj = parser.validate_template(
+        r"/show/{{show}}/{{sequence}}/{{shot}}/{{step}}/v{{pad[3,0]:version}}/"
+        r"{{shot}}_{{step}}_v{{pad[3,0]:version}}.{{pad[4,0]:frame}}.exr"
+    )
+    path = template_obj.resolve(state_data)
+
+    assert template_obj.parse_path(path) == {
+        "show": "abc",
+        "sequence": "seq010",
+        "shot": "sh0100",
+        "step": "comp",
+        "version": "012",
+        "frame": "1001",
+    }
+    assert template_obj.parse_path(path.replace("_v012.", "_v013.")) is None
+    assert template_obj.parse_path("/show/abc/seq010") is None
+
+
+def test_parse_path_operators():
+    template_obj = parser.validate_template(
+        r"{{upper:show}}/{{substr[0,2]:shot}}/{{lower:step}}/{{step}}"
+    )
+
+    assert template_obj.parse_path("ABC/sh/comp/Comp") == {
+        "show": "ABC",
+        "step": "Comp",
+    }
+    assert template_obj.parse_path("abc/sh/comp/Comp") is None
+    assert template_obj.parse_path("ABC/sh/Comp/Comp") is None
+    # Every use of a Token has to agree with the others.
+    assert template_obj.parse_path("ABC/sh/anim/Comp") is None
+
+
+def test_parse_path_nested_operators():
+    template_obj = parser.validate_template(r"{{lower:{{pad[4,0]:frame}}}}.exr")
+    assert template_obj.parse_path("0012.exr") == {"frame": "0012"}
+    assert template_obj.parse_path("12.exr") is None
+
+    mixed = parser.validate_template(
+        r"{{upper:{{lower:name}}}}/{{substr[0,2]:name}}/{{name}}"
+    )
+    assert mixed.parse_path("ABC/ab/abc") == {"name": "abc"}
+    assert mixed.parse_path("ABC/xy/abc") is None
+    assert mixed.parse_path("ABD/ab/abc") is None
+
+
+def test_parse_path_pad_keeps_inner_pattern():
+    template_obj = parser.validate_template(r"{{pad[4,0]:{{upper:name}}}}")
+    assert template_obj.parse_path("00AB") == {"name": "00AB"}
+    assert template_obj.parse_path("abcd") is None
+
+    both = parser.validate_template(r"{{upper:name}}_{{pad[4,0]:{{upper:name}}}}")
+    assert both.parse_path("ABCD_ABCD") == {"name": "ABCD"}
+    assert both.parse_path("ABCD_abcd") is None
+
+
+def test_parse_path_without_scoped_flags(monkeypatch):
+    # Python before 3.6 can not scope the case insensitive flag, every slot
+    #   is then only confirmed by resolving it again.
+    from sept import path_matcher
+
+    monkeypatch.setattr(
+        path_matcher,
+        "case_insensitive_pattern",
+        lambda input_pattern, cased_pattern: path_matcher.SLOT_PATTERN,
+    )
+    template_obj = PathTemplateParser().validate_template(
+        r"{{lower:{{pad[4,0]:frame}}}}.exr"
+    )
+    assert template_obj.parse_path("0012.exr") == {"frame": "0012"}
+    assert template_obj.parse_path("12.exr") is None
+    assert template_obj.parse_path("0O12.exr") is None
+
+
+def _counting_token(deterministic):
+    from sept import Token
+
+    class CountingToken(Token):
+        name = "counted"
+        calls = 0
+
+        def getValue(self, data):
+            CountingToken.calls += 1
+            return data.get("name")
+
+    CountingToken.deterministic = deterministic
+    return CountingToken
+
+
+def test_resolve_evaluates_token_once():
+    token_klass = _counting_token(deterministic=True)
+    custom_parser = PathTemplateParser(additional_tokens=[token_klass])
+    template_obj = custom_parser.validate_template(
+        r"{{counted}}/{{upper:counted}}_{{lower:counted}}"
+    )
+
+    assert template_obj.resolve(state_data) == "AhUgHeS/AHUGHES_ahughes"
+    assert token_klass.calls == 1
+    assert template_obj.compile_function()(state_data) == "AhUgHeS/AHUGHES_ahughes"
+    assert token_klass.calls == 2
+
+
+def test_resolve_non_deterministic_token():
+    token_klass = _counting_token(deterministic=False)
+    custom_parser = PathTemplateParser(additional_tokens=[token_klass])
+    template_obj = custom_parser.validate_template(
+        r"{{counted}}/{{upper:counted}}_{{lower:counted}}"
+    )
+
+    template_obj.resolve(state_data)
+    assert token_klass.calls == 3
+    template_obj.compile_function()(state_data)
+    assert token_klass.calls == 6
+
+
+def test_resolve_trusted():
+    template_obj = parser.validate_template(
+        r"/{{upper:show}}/{{substr[0,3]:shot}}/{{replace[c,k]:{{lower:step}}}}/"
+        r"v{{pad[3,0]:version}}/{{missing}}"
+    )
+
+    expected = template_obj.resolve(state_data)
+    assert expected == "/ABC/sh0/komp/v012/{{missing}}"
+    assert template_obj.resolve(state_data, trusted=True) == expected
+    assert template_obj.compile_function(trusted=True)(state_data) == expected
+    assert list(template_obj.resolve_many([state_data], trusted=True)) == [expected]
+
+
+def test_resolve_trusted_validates_unknown_operators():
+    from sept import Operator
+    from sept.errors import ParsingError
+
+    class RejectOperator(Operator):
+        name = "reject"
+
+        def is_invalid(self, input_data):
+            return "Rejected {}".format(input_data)
+
+        def execute(self, input_data):
+            return input_data
+
+    custom_parser = PathTemplateParser(additional_operators=[RejectOperator])
+    template_obj = custom_parser.validate_template(r"{{upper:{{reject:name}}}}")
+
+    assert template_obj._resolved_tokens[0].trusted_checks() == (True, True)
+    with pytest.raises(ParsingError):
+        template_obj.resolve(state_data, trusted=True)
+    with pytest.raises(ParsingError):
+        template_obj.compile_function(trusted=True)(state_data)
+
+
+def test_default_fallback_tokens_shared():
+    import pickle
+
+    from sept.builtin.tokens import DefaultFallbackToken
+
+    first = parser.validate_template(r"{{show}}/{{upper:show}}")
+    second = parser.validate_template(r"/root/{{show}}")
+
+    tokens = [rt.raw_token for rt in first._resolved_tokens]
+    tokens.append(second._resolved_tokens[0].raw_token)
+    assert isinstance(tokens[0], DefaultFallbackToken)
+    assert all(token is tokens[0] for token in tokens)
+    assert tokens[0].getValue(state_data) == "abc"
+    assert pickle.loads(pickle.dumps(tokens[0])) is tokens[0]
+
+
+def test_default_token_factory():
+    import pickle
+
+    from sept.builtin.tokens import DefaultTokenFactory, DefaultFallbackToken
+
+    klass = DefaultTokenFactory("show")
+    assert DefaultTokenFactory("show") is klass
+    assert klass.name == "show"
+    assert issubclass(klass, DefaultFallbackToken)
+
+    class ShowToken(klass):
+        pass
+
+    token = ShowToken()
+    assert isinstance(token, klass)
+    assert token.getValue(state_data) == "abc"
+    assert type(pickle.loads(pickle.dumps(klass()))) is klass
+
+
+def test_dotted_path_tokens():
+    class Version(object):
+        number = 7
+
+    data = {
+        "entity": {"shot": {"code": "sh0100", "tags": ["hero", "fx"]}},
+        "deep": {"githubUsername": "Ahuge"},
+        "version": Version(),
+    }
+    template_obj = parser.validate_template(
+        r"{{upper:entity.shot.code}}/{{entity.shot.tags.1}}/{{lower:deep.githubUsername}}/"
+        r"v{{pad[3,0]:version.number}}/{{entity.shot.missing}}"
+    )
+
+    expected = "SH0100/fx/ahuge/v007/{{entity.shot.missing}}"
+    assert template_obj.resolve(data) == expected
+    assert template_obj.compile_function()(data) == expected
+    assert template_obj.parse_path(expected)["entity.shot.tags.1"] == "fx"
+
+
+SECRET = "do not leak"
+
+
+def test_dotted_path_tokens_flat_keys_and_private_attributes():
+    template_obj = parser.validate_template(r"{{a.b}}/{{A.B}}")
+    assert template_obj.resolve({"a.b": "flat"}) == "flat/flat"
+    assert template_obj.resolve({"a": {"b": "nested"}}) == "nested/{{A.B}}"
+
+    class Shot(object):
+        code = "sh0100"
+        _private = "hidden"
+
+        def method(self):
+            return "called"
+
+    data = {"entity": {"shot": Shot()}}
+    template_obj = parser.validate_template(
+        r"{{entity.shot.code}}/{{entity.shot._private}}/{{entity.shot.method}}/"
+        r"{{entity.shot.method.__globals__.SECRET}}/"
+        r"{{entity.shot.__init__.__globals__.SECRET}}"
+    )
+    assert template_obj.resolve(data) == (
+        "sh0100/{{entity.shot._private}}/{{entity.shot.method}}/"
+        "{{entity.shot.method.__globals__.SECRET}}/"
+        "{{entity.shot.__init__.__globals__.SECRET}}"
+    )
+
+
+def test_bind():
+    template_obj = parser.validate_template(
+        r"/show/{{show}}/{{upper:shot}}/{{step}}/{{show}}_{{shot}}.{{pad[4,0]:frame}}.exr"
+    )
+    bound = template_obj.bind({"show": "abc", "shot": "sh0100"})
+
+    assert bound.text() == "/show/abc/SH0100/{{step}}/abc_sh0100.{{pad[4,0]:frame}}.exr"
+    assert len(bound._resolved_tokens) == 2
+    assert bound.resolve(state_data) == template_obj.resolve(state_data)
+    assert bound.compile_function()(state_data) == template_obj.resolve(state_data)
+    assert bound.bind({"step": "comp", "frame": 7}).text() == (
+        "/show/abc/SH0100/comp/abc_sh0100.0007.exr"
+    )
+    assert len(template_obj._resolved_tokens) == 6
+
+
+def test_bind_keeps_non_deterministic_tokens():
+    token_klass = _counting_token(deterministic=False)
+    custom_parser = PathTemplateParser(additional_tokens=[token_klass])
+    template_obj = custom_parser.validate_template(r"{{counted}}/{{show}}")
+
+    bound = template_obj.bind(state_data)
+    assert bound.text() == "{{counted}}/abc"
+    assert bound.resolve(state_data) == "AhUgHeS/abc"
+
+
+def test_required_tokens():
+    from sept import Token
+
+    class UserToken(Token):
+        name = "user"
+
+        def getValue(self, data):
+            return data.get("login")
+
+    custom_parser = PathTemplateParser(additional_tokens=[UserToken])
+    template_obj = custom_parser.validate_template(
+        r"/{{entity.shot.code}}/{{lower:{{substr[0,3]:entity.shot.code}}}}/"
+        r"{{user}}/v{{pad[3,0]:version}}_{{entity.shot.code}}"
+    )
+
+    assert template_obj.required_tokens() == (
+        (
+            "entity.shot.code",
+            ("entity", "shot", "code"),
+            ((), ("substr[0,3]", "lower")),
+        ),
+        ("user", None, ((),)),
+        ("version", ("version",), (("pad[3,0]",),)),
+    )
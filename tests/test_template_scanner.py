@@ -0,0 +1,78 @@
+import pytest
+
+from sept.parser import PathTemplateParser
+from sept.template import ENGINE_PYPARSING, ENGINE_SCANNER
+from sept.errors import ParsingError
+
+state_data = {
+    "name": "AhUgHeS",
+    "data_with_space": "This is a sentence",
+}
+pyparsing_parser = PathTemplateParser(engine=ENGINE_PYPARSING)
+scanner_parser = PathTemplateParser(engine=ENGINE_SCANNER)
+
+
+def _describe(template_obj):
+    tokens = []
+    for resolved_token in template_obj._resolved_tokens:
+        tokens.append(
+            (
+                resolved_token.start,
+                resolved_token.end,
+                resolved_token.original_string,
+                resolved_token.raw_token.name,
+                [
+                    (operator.name, list(operator._args or []))
+                    for operator in resolved_token.operators
+                ],
+            )
+        )
+    return template_obj.text(), tokens
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        r"{{lower:name}}",
+        r"My username is {{lower: name   }}",
+        r"{{replace[\s,-]: data_with_space}}",
+        r"{{lower:{{substr[1,end]:name}}}}",
+        r"/{{pad[4,0]:name}}/{{upper:name}}_{{{{name}}}}",
+        r"{{{name}}}",
+        r"{{foo{{name}}}}",
+        r"{{a:b:c}}",
+    ],
+)
+def test_scanner_matches_pyparsing(template_str):
+    expected = pyparsing_parser.validate_template(template_str)
+    actual = scanner_parser.validate_template(template_str)
+
+    assert _describe(actual) == _describe(expected)
+    assert actual.resolve(state_data) == expected.resolve(state_data)
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        r"{{lower:name}",
+        r"{{lower:name}{{upper:name}}",
+        r"{lower:name}}/{{upper:name}}",
+        r"{{lowerr:name}}/{{upper:name}}",
+        r"{{lower:{{lowerr:name}}}}",
+    ],
+)
+def test_scanner_raises_same_errors(template_str):
+    with pytest.raises(ParsingError) as expected:
+        pyparsing_parser.validate_template(template_str)
+    with pytest.raises(ParsingError) as actual:
+        scanner_parser.validate_template(template_str)
+
+    assert type(actual.value) is type(expected.value)
+    assert str(actual.value) == str(expected.value)
+    assert actual.value.location == expected.value.location
+    assert actual.value.length == expected.value.length
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        PathTemplateParser(engine="regex").validate_template(r"{{name}}")
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+
+import pytest
+
+from sept.parser import PathTemplateParser
+from sept.template_set import TemplateSet
+
+parser = PathTemplateParser()
+# Pairs keep the order of the Templates on every Python version.
+template_set = parser.validate_template_set(
+    [
+        ("shot_work", r"/show/{{show}}/{{shot}}/work/{{step}}/v{{pad[3,0]:version}}"),
+        (
+            "shot_publish",
+            r"/show/{{show}}/{{shot}}/publish/{{step}}/v{{pad[3,0]:version}}",
+        ),
+        ("shot_any", r"/show/{{show}}/{{shot}}/{{area}}/{{step}}/v{{version}}"),
+        ("asset_publish", r"/show/{{show}}/assets/{{asset}}/publish/{{step}}"),
+        ("root", r"{{root}}/{{show}}"),
+    ]
+)
+
+
+def test_classify():
+    path = "/show/abc/sh0100/publish/comp/v012"
+    assert template_set.classify(path) == [
+        (
+            "shot_publish",
+            {"show": "abc", "shot": "sh0100", "step": "comp", "version": "012"},
+        ),
+        (
+            "shot_any",
+            {
+                "show": "abc",
+                "shot": "sh0100",
+                "area": "publish",
+                "step": "comp",
+                "version": "012",
+            },
+        ),
+    ]
+
+
+def test_match_first():
+    name, values = template_set.match("/show/abc/assets/chair/publish/model")
+    assert name == "asset_publish"
+    assert values == {"show": "abc", "asset": "chair", "step": "model"}
+    assert template_set.match("/show/abc/sh0100/work") is None
+
+
+def test_leading_token():
+    assert template_set.match("mnt/abc") == ("root", {"root": "mnt", "show": "abc"})
+
+
+def test_template_set_mapping():
+    assert len(template_set) == 5
+    assert template_set.names()[0] == "shot_work"
+    assert isinstance(TemplateSet({}), TemplateSet)
+
+
+def test_resolve():
+    data = {
+        "show": "abc",
+        "shot": "sh0100",
+        "step": "comp",
+        "version": 12,
+        "area": "work",
+        "asset": "chair",
+    }
+    results = template_set.resolve(data)
+
+    assert list(results) == template_set.names()
+    for name in template_set:
+        assert results[name] == template_set[name].resolve(data)
+    assert results["shot_publish"] == "/show/abc/sh0100/publish/comp/v012"
+    assert results["root"] == "{{root}}/abc"
+    assert template_set.resolve(data, trusted=True) == results
+
+
+def test_resolve_shares_expressions():
+    from sept import Token
+
+    class CountingToken(Token):
+        name = "counted"
+        calls = 0
+
+        def getValue(self, data):
+            CountingToken.calls += 1
+            return data.get("name")
+
+    custom_parser = PathTemplateParser(additional_tokens=[CountingToken])
+    counted_set = custom_parser.validate_template_set(
+        {
+            "a": r"{{upper:counted}}/{{counted}}",
+            "b": r"{{counted}}_{{upper:counted}}",
+        }
+    )
+    function = counted_set.compile_function()
+
+    assert function({"name": "abc"}) == {"a": "ABC/abc", "b": "abc_ABC"}
+    assert CountingToken.calls == 1
+    # Each distinct expression is computed once.
+    assert function.__source__.count("_join((") == 2
+    assert function.__source__.count("= execute_") == 1
+
+
+def test_resolve_missing_data_keeps_each_expression():
+    cased_set = parser.validate_template_set(
+        {"a": r"{{Show}}/{{upper:Show}}", "b": r"{{show}}/{{upper:show}}"}
+    )
+    assert cased_set.resolve({}) == {
+        "a": "{{Show}}/{{upper:Show}}",
+        "b": "{{show}}/{{upper:show}}",
+    }
+    assert cased_set.resolve({"show": "abc"}) == {"a": "abc/ABC", "b": "abc/ABC"}
+
+
+def test_resolve_errors_point_into_each_template():
+    from sept import Operator
+    from sept.errors import MultipleParsingError
+
+    class EvenOperator(Operator):
+        name = "even"
+        stateless = True
+
+        def is_invalid(self, token_value):
+            if int(token_value) % 2:
+                return "Odd number"
+            return None
+
+        def execute(self, input_data):
+            return input_data
+
+    custom_parser = PathTemplateParser(additional_operators=[EvenOperator])
+    even_set = custom_parser.validate_template_set(
+        [("a", r"{{even:frame}}"), ("b", r"/{{frame}}/{{even:frame}}")]
+    )
+    assert even_set.resolve({"frame": 2}) == {"a": "2", "b": "/2/2"}
+    with pytest.raises(MultipleParsingError) as err:
+        even_set.resolve({"frame": 1})
+    assert [error.location for error in err.value.errors] == [0, 11]
+    assert str(err.value.errors[1]).startswith("b: ")
+
+    assert TemplateSet({}).resolve({}) == {}
+
+
+def test_required_tokens():
+    dependencies = OrderedDict(
+        (dependency.name, dependency.chains)
+        for dependency in template_set.required_tokens()
+    )
+    assert list(dependencies) == [
+        "show",
+        "shot",
+        "step",
+        "version",
+        "area",
+        "asset",
+        "root",
+    ]
+    assert dependencies["version"] == (("pad[3,0]",), ())